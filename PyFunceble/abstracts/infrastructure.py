@@ -103,6 +103,13 @@ class Infrastructure:
     :type: str
     """
 
+    SQLITE_DB_FILENAME = "pyfunceble.sqlite3"
+    """
+    Sets the name of the database file we use with the SQLite database type.
+
+    :type: str
+    """
+
     PROD_CONFIG_LINK = "https://raw.githubusercontent.com/funilrys/PyFunceble/master/.PyFunceble_production.yaml"  # pylint: disable=line-too-long
     """
     Sets the link to the production configuration file.
@@ -49,14 +49,8 @@ License:
     See the License for the specific language governing permissions and
     limitations under the License.
 """
-from ipaddress import (
-    AddressValueError,
-    IPv4Address,
-    IPv6Address,
-    ip_address,
-    ip_interface,
-    ip_network,
-)
+from ipaddress import ip_address, ip_interface, ip_network
+from re import compile as re_compile
 
 import domain2idna
 
@@ -88,6 +82,24 @@ class Check:
     .. _IANA Special-Use Domain Names: https://www.iana.org/assignments/special-use-domain-names/special-use-domain-names.txt
     """
 
+    REGEX_VALID_DOMAINS = re_compile(
+        r"^(?=.{0,253}$)(([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9](?:\.)?|[a-z0-9](?:\.)?))$"
+    )
+    """
+    Specifies the (compiled) regex which matches the valid domains.
+
+    :type: :py:class:`re.Pattern`
+    """
+
+    REGEX_VALID_SUBDOMAINS = re_compile(
+        r"^(?=.{0,253}$)(([a-z0-9_][a-z0-9-_]{0,61}[a-z0-9_-]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9]))$"
+    )
+    """
+    Specifies the (compiled) regex which matches the valid subdomains.
+
+    :type: :py:class:`re.Pattern`
+    """
+
     def __init__(self, subject):
         self.subject = subject
 
@@ -221,12 +233,6 @@ class Check:
         :rtype: bool
         """
 
-        # We initate our regex which will match for valid domains.
-        regex_valid_domains = r"^(?=.{0,253}$)(([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9](?:\.)?|[a-z0-9](?:\.)?))$"  # pylint: disable=line-too-long
-
-        # We initiate our regex which will match for valid subdomains.
-        regex_valid_subdomains = r"^(?=.{0,253}$)(([a-z0-9_][a-z0-9-_]{0,61}[a-z0-9_-]|[a-z0-9])\.)+((?=.*[^0-9])([a-z0-9][a-z0-9-]{0,61}[a-z0-9]|[a-z0-9]))$"  # pylint: disable=line-too-long
-
         try:
             # We get the position of the last point.
             last_point_index = self.subject.rindex(".")
@@ -253,12 +259,7 @@ class Check:
                 # We return false.
                 return False
 
-            if (
-                PyFunceble.helpers.Regex(regex_valid_domains).match(
-                    self.subject, return_match=False
-                )
-                and not subdomain_check
-            ):
+            if self.REGEX_VALID_DOMAINS.search(self.subject) and not subdomain_check:
                 # * The element pass the domain validation.
                 # and
                 # * We are not checking if it is a subdomain.
@@ -269,67 +270,57 @@ class Check:
             # The element did not pass the domain validation. That means that
             # it has invalid character or the position of - or _ are not right.
 
-            if extension in PyFunceble.PSLOOOKUP:
-                # The extension is into the psl database.
+            # We get the longest suffix (of the psl database) which ends the
+            # element to test.
+            suffix = PyFunceble.PSLOOOKUP.get_longest_suffix(self.subject)
 
-                for suffix in PyFunceble.PSLOOOKUP[extension]:
-                    # We loop through the element of the extension into the psl database.
+            if suffix:
+                # The element ends with a suffix of the psl database.
 
-                    try:
-                        # We try to get the position of the currently read suffix
-                        # in the element ot test.
-                        suffix_index = self.subject.rindex("." + suffix)
+                # We get the element to check.
+                # The idea here is to delete the suffix, then retest with our
+                # subdomains regex.
+                to_check = self.subject[: self.subject.rindex("." + suffix)]
 
-                        # We get the element to check.
-                        # The idea here is to delete the suffix, then retest with our
-                        # subdomains regex.
-                        to_check = self.subject[:suffix_index]
-
-                        if "." not in to_check and subdomain_check:
-                            # * There is no point into the new element to check.
-                            # and
-                            # * We are checking if it is a subdomain.
+                if "." not in to_check and subdomain_check:
+                    # * There is no point into the new element to check.
+                    # and
+                    # * We are checking if it is a subdomain.
 
-                            # We return False, it is not a subdomain.
-                            return False
+                    # We return False, it is not a subdomain.
+                    return False
 
-                        if "." in to_check and subdomain_check:
-                            # * There is a point into the new element to check.
-                            # and
-                            # * We are checking if it is a subdomain.
+                if "." in to_check and subdomain_check:
+                    # * There is a point into the new element to check.
+                    # and
+                    # * We are checking if it is a subdomain.
 
-                            # We return True, it is a subdomain.
-                            return True
+                    # We return True, it is a subdomain.
+                    return True
 
-                        # We are not checking if it is a subdomain.
+                # We are not checking if it is a subdomain.
 
-                        if suffix.count(".") >= 2:
-                            # There is more than 2 level.
+                if suffix.count(".") >= 2:
+                    # There is more than 2 level.
 
-                            # We check if it passes our subdomain regex.
-                            # * True: It's a valid domain.
-                            # * False: It's an invalid domain.
-                            return PyFunceble.helpers.Regex(
-                                regex_valid_subdomains
-                            ).match(self.subject[:last_point_index], return_match=False)
+                    # We check if it passes our subdomain regex.
+                    # * True: It's a valid domain.
+                    # * False: It's an invalid domain.
+                    return bool(
+                        self.REGEX_VALID_SUBDOMAINS.search(
+                            self.subject[:last_point_index]
+                        )
+                    )
 
-                        if "." in to_check:
-                            # There is a point into the new element to check.
+                if "." in to_check:
+                    # There is a point into the new element to check.
 
-                            # We check if it passes our subdomain regex.
-                            # * True: It's a valid domain.
-                            # * False: It's an invalid domain.
-                            return PyFunceble.helpers.Regex(
-                                regex_valid_subdomains
-                            ).match(to_check, return_match=False)
+                    # We check if it passes our subdomain regex.
+                    # * True: It's a valid domain.
+                    # * False: It's an invalid domain.
+                    return bool(self.REGEX_VALID_SUBDOMAINS.search(to_check))
 
-                        return PyFunceble.helpers.Regex(regex_valid_domains).match(
-                            to_check, return_match=False
-                        )
-                    except ValueError:
-                        # In case of a value error because the position is not found,
-                        # we continue to the next element.
-                        pass
+                return bool(self.REGEX_VALID_DOMAINS.search(to_check))
 
             # * The extension is not into the psl database.
             # or
@@ -354,9 +345,7 @@ class Check:
                 # We check if it passes our subdomain regex.
                 # * True: It's a valid domain.
                 # * False: It's an invalid domain.
-                return PyFunceble.helpers.Regex(regex_valid_subdomains).match(
-                    to_check, return_match=False
-                )
+                return bool(self.REGEX_VALID_SUBDOMAINS.search(to_check))
 
         except (ValueError, AttributeError):
             # In case of a value or attribute error we ignore them.
@@ -490,79 +479,7 @@ class Check:
         :rtype: bool
         """
 
-        if self.is_ipv4():
-            # We are working with an IPv4.
-
-            # We list the regex which matched everything.
-            reserved = [
-                # Match 0.0.0.0–0.255.255.255
-                r"(0\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 10.0.0.0–10.255.255.255
-                r"(10\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 100.64.0.0–100.127.255.255
-                r"(100\.(0?6[4-9]|0?[7-9][0-9]|1[0-1][0-9]|12[0-7])\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 127.0.0.0–127.255.255.255
-                r"(127\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 169.254.0.0–169.254.255.255
-                r"(169\.254\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 172.16.0.0–172.31.255.255
-                r"(172\.(0?1[6-9]|0?2[0-9]|0?3[0-1])\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.0.0.0–192.0.0.255
-                r"(192\.0\.0\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.0.2.0–192.0.2.255
-                r"(192\.0\.2\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.31.196.0–192.31.196.255
-                r"(192\.31\.196\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.52.193.0–192.52.193.255
-                r"(192\.52\.193\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.88.99.0–192.88.99.255
-                r"(192\.88\.99\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.168.0.0–192.168.255.255
-                r"(192\.168\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 192.175.48.0-192.175.48.255
-                r"(192\.175\.48\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))",
-                # Match 198.18.0.0–198.19.255.255
-                r"(198\.(0?1[8-9])\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 198.51.100.0–198.51.100.255
-                r"(198\.51\.100\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 203.0.113.0–203.0.113.255
-                r"(203\.0\.113\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 224.0.0.0–239.255.255.255
-                r"((22[4-9]|23[0-9])\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 240.0.0.0–255.255.255.254
-                r"((24[0-9]|25[0-5])\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[0-9]{1,}\/[0-9]{1,}))",  # pylint: disable=line-too-long
-                # Match 255.255.255.255
-                r"(255\.255\.255\.255)",  # pylint: disable=line-too-long
-            ]
-
-            # We get a single regex out of the list of regex.
-            reserved_regex = "({0})".format("|".join(reserved))
-
-            try:
-                address = IPv4Address(self.subject)
-
-                # We check if it passes our regex.
-                # * True: It's reserved.
-                # * False: It's not reserved.
-                return (
-                    address.is_multicast
-                    or address.is_private
-                    or address.is_unspecified
-                    or address.is_reserved
-                    or address.is_loopback
-                    or address.is_link_local
-                    or not address.is_global
-                    or PyFunceble.helpers.Regex(reserved_regex).match(
-                        self.subject, return_match=False
-                    )
-                )
-            except AddressValueError:  # pragma: no cover
-                return PyFunceble.helpers.Regex(reserved_regex).match(
-                    self.subject, return_match=False
-                )
-
-        # We return False, we are not working with an IPv4
-        return False
+        return PyFunceble.lookup.ReservedIP().is_reserved_ipv4(self.subject)
 
     def is_reserved_ipv6(self):
         """
@@ -572,19 +489,4 @@ class Check:
         :rtype: bool
         """
 
-        if self.is_ipv6():
-            try:
-                address = IPv6Address(self.subject)
-
-                return (
-                    address.is_multicast
-                    or address.is_private
-                    or address.is_unspecified
-                    or address.is_reserved
-                    or address.is_loopback
-                    or address.is_link_local
-                    or not address.is_global
-                )
-            except AddressValueError:
-                pass
-        return False
+        return PyFunceble.lookup.ReservedIP().is_reserved_ipv6(self.subject)
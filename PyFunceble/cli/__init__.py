@@ -55,6 +55,7 @@ import argparse
 import sys
 from multiprocessing import set_start_method
 from os import cpu_count
+from signal import SIGTERM, signal
 
 from colorama import Back, Fore, Style
 from colorama import init as initiate_colorama
@@ -257,6 +258,44 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                test_control.add_argument(
+                    "--http-code-async",
+                    action="store_true",
+                    help="Switch the value of the asynchronous (and concurrent) "
+                    "request of the HTTP status codes while testing the "
+                    "availability of a file. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.http_code_async)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                test_control.add_argument(
+                    "--http-code-concurrency",
+                    type=int,
+                    help="Set the maximal number of HTTP requests to keep in flight "
+                    "with the asynchronous HTTP status code lookup. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.http_code_concurrency)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                test_control.add_argument(
+                    "--http-code-host-concurrency",
+                    type=int,
+                    help="Set the maximal number of HTTP requests to keep in flight "
+                    "for a single host with the asynchronous HTTP status code "
+                    "lookup. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.http_code_host_concurrency)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 test_control.add_argument(
                     "--local",
                     action="store_true",
@@ -374,6 +413,32 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                test_control.add_argument(
+                    "--whois-rate-limit",
+                    type=float,
+                    help="Set the maximal number of requests per second to send "
+                    "to a WHOIS server.\n\nSet it to 0 to disable the rate "
+                    "limiting. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.whois_rate_limit)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                test_control.add_argument(
+                    "--whois-server-cache-refresh",
+                    type=int,
+                    help="Set the number of seconds before we resolve (again) "
+                    "a WHOIS server.\n\nSet it to 0 to resolve the WHOIS server "
+                    "of every subject. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.whois_server_cache_refresh)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 test_control.add_argument(
                     "--wildcard",
                     action="store_true",
@@ -405,6 +470,66 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                dns_control_group.add_argument(
+                    "--dns-lookup-async",
+                    action="store_true",
+                    help="Switch the value of the usage of an asynchronous "
+                    "(and concurrent) DNS lookup while testing the availability "
+                    "of a file. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_lookup_async)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                dns_control_group.add_argument(
+                    "--dns-lookup-cache",
+                    action="store_true",
+                    help="Switch the value of the usage of the (in-memory) cache "
+                    "of the DNS answers. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_lookup_cache)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                dns_control_group.add_argument(
+                    "--dns-lookup-cache-size",
+                    type=int,
+                    help="Set the maximal number of DNS answers to keep in the cache. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_lookup_cache_size)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                dns_control_group.add_argument(
+                    "--dns-lookup-concurrency",
+                    type=int,
+                    help="Set the maximal number of DNS queries to keep in flight "
+                    "with the asynchronous DNS lookup. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_lookup_concurrency)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                dns_control_group.add_argument(
+                    "--dns-lookup-fan-out",
+                    action="store_true",
+                    help="Switch the value of the concurrent request of the "
+                    "record types of a subject. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_lookup_fan_out)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 dns_control_group.add_argument(
                     "--dns-lookup-over-tcp",
                     action="store_true",
@@ -433,7 +558,8 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     "--database-type",
                     type=str,
                     help="Tell us the type of database to use. "
-                    "\nYou can choose between the following: `json | mariadb | mysql` %s"
+                    "\nYou can choose between the following: "
+                    "`json | journal | mariadb | mysql | sqlite` %s"
                     % (
                         current_value_format
                         + repr(PyFunceble.CONFIGURATION.db_type)
@@ -467,6 +593,42 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                database_control_group.add_argument(
+                    "--db-batch-size",
+                    type=int,
+                    help="Set the maximal number of rows to write at once "
+                    "into our (SQL) databases. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.db_batch_size)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                database_control_group.add_argument(
+                    "--db-save-interval",
+                    type=int,
+                    help="Set the maximal number of seconds between two saves "
+                    "of our (JSON) databases. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.db_save_interval)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                database_control_group.add_argument(
+                    "--db-save-threshold",
+                    type=int,
+                    help="Set the maximal number of pending changes before "
+                    "saving our (JSON) databases. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.db_save_threshold)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 database_control_group.add_argument(
                     "-wdb",
                     "--whois-database",
@@ -714,6 +876,18 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                multiprocessing_group.add_argument(
+                    "--multiprocess-worker-pool",
+                    action="store_true",
+                    help="Switch the value of the usage of a pool of long-lived "
+                    "workers instead of one process per subject. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.multiprocess_worker_pool)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 multiprocessing_group.add_argument(
                     "-p",
                     "--processes",
@@ -966,7 +1140,13 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     )
 
                 if args.database_type:
-                    if args.database_type.lower() in ["json", "mariadb", "mysql"]:
+                    if args.database_type.lower() in [
+                        "json",
+                        "journal",
+                        "mariadb",
+                        "mysql",
+                        "sqlite",
+                    ]:
                         PyFunceble.CONFIGURATION.db_type = args.database_type.lower()
                     else:
                         print(
@@ -988,9 +1168,43 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         args.days_between_db_clean
                     )
 
+                if args.db_batch_size:
+                    PyFunceble.CONFIGURATION.db_batch_size = args.db_batch_size
+
+                if args.db_save_interval:
+                    PyFunceble.CONFIGURATION.db_save_interval = args.db_save_interval
+
+                if args.db_save_threshold:
+                    PyFunceble.CONFIGURATION.db_save_threshold = args.db_save_threshold
+
                 if args.dns:
                     PyFunceble.CONFIGURATION.dns_server = args.dns
 
+                if args.dns_lookup_async:
+                    PyFunceble.CONFIGURATION.dns_lookup_async = preset.switch(
+                        "dns_lookup_async"
+                    )
+
+                if args.dns_lookup_cache:
+                    PyFunceble.CONFIGURATION.dns_lookup_cache = preset.switch(
+                        "dns_lookup_cache"
+                    )
+
+                if args.dns_lookup_cache_size:
+                    PyFunceble.CONFIGURATION.dns_lookup_cache_size = (
+                        args.dns_lookup_cache_size
+                    )
+
+                if args.dns_lookup_concurrency:
+                    PyFunceble.CONFIGURATION.dns_lookup_concurrency = (
+                        args.dns_lookup_concurrency
+                    )
+
+                if args.dns_lookup_fan_out:
+                    PyFunceble.CONFIGURATION.dns_lookup_fan_out = preset.switch(
+                        "dns_lookup_fan_out"
+                    )
+
                 if args.dns_lookup_over_tcp:
                     PyFunceble.CONFIGURATION.dns_lookup_over_tcp = preset.switch(
                         "dns_lookup_over_tcp"
@@ -1019,6 +1233,21 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         PyFunceble.CONFIGURATION.http_codes.active, True
                     )
 
+                if args.http_code_async:
+                    PyFunceble.CONFIGURATION.http_code_async = preset.switch(
+                        "http_code_async"
+                    )
+
+                if args.http_code_concurrency:
+                    PyFunceble.CONFIGURATION.http_code_concurrency = (
+                        args.http_code_concurrency
+                    )
+
+                if args.http_code_host_concurrency:
+                    PyFunceble.CONFIGURATION.http_code_host_concurrency = (
+                        args.http_code_host_concurrency
+                    )
+
                 if args.idna:
                     PyFunceble.CONFIGURATION.idna_conversion = preset.switch(
                         "idna_conversion"
@@ -1058,6 +1287,11 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         )
                         sys.exit(1)
 
+                if args.multiprocess_worker_pool:
+                    PyFunceble.CONFIGURATION.multiprocess_worker_pool = preset.switch(
+                        "multiprocess_worker_pool"
+                    )
+
                 if args.no_files:
                     PyFunceble.CONFIGURATION.no_files = preset.switch("no_files")
 
@@ -1157,6 +1391,14 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         "whois_database"
                     )
 
+                if args.whois_rate_limit is not None:
+                    PyFunceble.CONFIGURATION.whois_rate_limit = args.whois_rate_limit
+
+                if args.whois_server_cache_refresh is not None:
+                    PyFunceble.CONFIGURATION.whois_server_cache_refresh = (
+                        args.whois_server_cache_refresh
+                    )
+
                 if args.wildcard:
                     PyFunceble.CONFIGURATION.wildcard = preset.switch("wildcard")
 
@@ -1164,6 +1406,8 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
 
                 preset.timeout()
                 preset.cooldown_time()
+                preset.dns_lookup_concurrency()
+                preset.dns_lookup_fan_out()
                 preset.dns_lookup_over_tcp()
 
                 if args.clean:
@@ -1189,6 +1433,10 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                 # We compare the versions (upstream and local) and in between.
                 PyFunceble.core.CLI.compare_version_and_print_messages()
 
+                # We save the pending changes of our databases before exiting
+                # when we are asked to terminate.
+                signal(SIGTERM, PyFunceble.engine.SaveScheduler.handle_signal)
+
                 # We call our Core which will handle all case depending of the configuration or
                 # the used command line arguments.
                 Dispatcher(
@@ -58,6 +58,7 @@ from box import Box
 from colorama import Fore, Style
 
 import PyFunceble
+from PyFunceble.output.counter import Counter
 
 
 class Loader:
@@ -76,7 +77,7 @@ class Loader:
 
     intern: dict = {
         "counter": {
-            "number": {"down": 0, "invalid": 0, "tested": 0, "up": 0},
+            "number": Counter(),
             "percentage": {"down": 0, "invalid": 0, "up": 0},
         },
         "done": Fore.GREEN + "✔",
@@ -96,6 +97,7 @@ class Loader:
         self.psl_lookup: Optional[PyFunceble.lookup.PublicSuffix] = None
         self.iana_lookup: Optional[PyFunceble.lookup.Iana] = None
         self.dns_lookup: Optional[PyFunceble.lookup.Dns] = None
+        self.dns_cache: Optional[PyFunceble.lookup.DNSCache] = None
 
         PyFunceble.downloader.Config()
 
@@ -497,10 +499,20 @@ class Loader:
         self.iana_lookup = PyFunceble.lookup.Iana()
         PyFunceble.IANALOOKUP = self.iana_lookup
 
+        if not PyFunceble.CONFIGURATION.dns_lookup_cache:
+            self.dns_cache = None
+        elif self.dns_cache is None:
+            # We keep the same cache across injections.
+            self.dns_cache = PyFunceble.lookup.DNSCache(
+                max_size=PyFunceble.CONFIGURATION.dns_lookup_cache_size
+            )
+
         self.dns_lookup = PyFunceble.lookup.Dns(
             dns_server=PyFunceble.CONFIGURATION.dns_server,
             lifetime=PyFunceble.CONFIGURATION.timeout,
             tcp=PyFunceble.CONFIGURATION.dns_lookup_over_tcp,
+            fan_out=PyFunceble.CONFIGURATION.dns_lookup_fan_out,
+            cache=self.dns_cache,
         )
         PyFunceble.DNSLOOKUP = self.dns_lookup
         PyFunceble.LOADER = self
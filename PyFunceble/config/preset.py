@@ -92,8 +92,11 @@ class Preset:  # pragma: no cover
         """
 
         self.timeout()
+        self.dns_lookup_concurrency()
+        self.dns_lookup_fan_out()
         self.dns_lookup_over_tcp()
         self.dns_nameserver()
+        self.http_code_concurrency()
 
         self.cooldown_time()
         self.multiprocess()
@@ -256,11 +259,13 @@ class Preset:  # pragma: no cover
         Resets the counters.
         """
 
+        # We set the number of each status to 0.
+        PyFunceble.INTERN["counter"]["number"].reset()
+
         for status in ["up", "down", "invalid", "tested"]:
             # We loop through to the index of the autoContinue subsystem.
 
-            # And we set the counter of the currently read status to 0.
-            PyFunceble.INTERN["counter"]["number"][status] = 0
+            # And we set the percentage of the currently read status to 0.
             PyFunceble.INTERN["counter"]["percentage"][status] = 0
 
         PyFunceble.LOGGER.debug("Counter resetted.")
@@ -312,7 +317,7 @@ class Preset:  # pragma: no cover
         ):
             PyFunceble.CONFIGURATION.multiprocess_merging_mode = "end"
 
-        if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]:
             PyFunceble.CONFIGURATION.multiprocess_merging_mode = "live"
 
     def simple_domain(self):
@@ -385,7 +390,11 @@ class Preset:  # pragma: no cover
                 and not PyFunceble.CONFIGURATION.simple
                 and not PyFunceble.CONFIGURATION.quiet
             ):
-                if PyFunceble.CONFIGURATION.db_type not in ["mysql", "mariadb"]:
+                if PyFunceble.CONFIGURATION.db_type not in [
+                    "mysql",
+                    "mariadb",
+                    "sqlite",
+                ]:
                     print(
                         f"{Fore.RED + Style.BRIGHT}The "
                         f"{repr(PyFunceble.CONFIGURATION.db_type)} database type "
@@ -428,6 +437,33 @@ class Preset:  # pragma: no cover
 
         PyFunceble.DNSLOOKUP.update_lifetime(PyFunceble.CONFIGURATION.timeout)
 
+    @classmethod
+    def dns_lookup_concurrency(cls):
+        """
+        Ensures that the number of DNS queries to keep in flight is alway >= 1.
+        """
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.dns_lookup_concurrency, int)
+            or PyFunceble.CONFIGURATION.dns_lookup_concurrency < 1
+        ):
+            PyFunceble.CONFIGURATION.dns_lookup_concurrency = (
+                PyFunceble.lookup.AsyncDns.default_concurrency
+            )
+
+            PyFunceble.LOGGER.debug(
+                "CONFIGURATION.dns_lookup_concurrency switched to "
+                f"{PyFunceble.CONFIGURATION.dns_lookup_concurrency}"
+            )
+
+    @classmethod
+    def dns_lookup_fan_out(cls):
+        """
+        Ensures that the DNS lookup fan-out is proprely set.
+        """
+
+        PyFunceble.DNSLOOKUP.fan_out = PyFunceble.CONFIGURATION.dns_lookup_fan_out
+
     @classmethod
     def dns_lookup_over_tcp(cls):
         """
@@ -444,6 +480,32 @@ class Preset:  # pragma: no cover
 
         PyFunceble.DNSLOOKUP.update_nameserver(PyFunceble.CONFIGURATION.dns_server)
 
+    @classmethod
+    def http_code_concurrency(cls):
+        """
+        Ensures that the number of HTTP requests to keep in flight is alway >= 1.
+        """
+
+        for index, default in [
+            (
+                "http_code_concurrency",
+                PyFunceble.lookup.AsyncHTTPCode.default_concurrency,
+            ),
+            (
+                "http_code_host_concurrency",
+                PyFunceble.lookup.AsyncHTTPCode.default_host_concurrency,
+            ),
+        ]:
+            if (
+                not isinstance(PyFunceble.CONFIGURATION[index], int)
+                or PyFunceble.CONFIGURATION[index] < 1
+            ):
+                PyFunceble.CONFIGURATION[index] = default
+
+                PyFunceble.LOGGER.debug(
+                    f"CONFIGURATION.{index} switched to {PyFunceble.CONFIGURATION[index]}"
+                )
+
     def reputation_data(self):
         """
         Ensures that the usage of reputation data is activated when needed.
@@ -479,7 +541,7 @@ class Preset:  # pragma: no cover
         """
 
         if (
-            PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]
+            PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]
             and "migration_started" not in PyFunceble.CONFIGURATION
         ):
             try:
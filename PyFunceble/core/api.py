@@ -139,7 +139,7 @@ class APICore:
             # We are authorized to operate with the
             # inactive database.s
 
-            if status.lower() in PyFunceble.STATUS.list.up:
+            if status.lower() in CLICore.get_up_statuses():
                 # The status is in the list of UP status.
 
                 # We remove it from the database.
@@ -52,16 +52,16 @@ License:
 
 import sys
 from datetime import datetime
+from multiprocessing import Pool
 from os import sep as directory_separator
 from os import walk
 from random import choice
 
 from colorama import Fore, Style
-from sqlalchemy.orm.exc import NoResultFound
 
 import PyFunceble
-from PyFunceble.engine.database.loader import session
-from PyFunceble.engine.database.schemas import File, Status
+from PyFunceble.engine.database.schemas import Status
+from PyFunceble.engine.database.writer import BulkWriter
 
 
 class CLICore:
@@ -69,6 +69,10 @@ class CLICore:
     Provides some methods which are dedicated for the CLI.
     """
 
+    # Saves the list of up statuses along with the statuses
+    # it was constructed from.
+    up_statuses_cache = (None, [])
+
     def __init__(self):
         self.list_of_up_statuses = self.get_up_statuses()
 
@@ -88,29 +92,84 @@ class CLICore:
     def get_up_statuses(cls):
         """
         Provides the list of up statuses.
+
+        .. note::
+            The list is constructed once per loaded list of statuses.
+
+        .. warning::
+            The given list is shared. Please do not update it.
         """
 
-        list_of_up_statuses = PyFunceble.STATUS.list.up
-        list_of_up_statuses.extend(PyFunceble.STATUS.list.valid)
-        list_of_up_statuses.extend(PyFunceble.STATUS.list.sane)
+        statuses, list_of_up_statuses = cls.up_statuses_cache
 
-        list_of_up_statuses.extend([x.upper() for x in list_of_up_statuses])
+        if statuses is not PyFunceble.STATUS:
+            list_of_up_statuses = (
+                PyFunceble.STATUS.list.up
+                + PyFunceble.STATUS.list.valid
+                + PyFunceble.STATUS.list.sane
+            )
+            list_of_up_statuses += [x.upper() for x in list_of_up_statuses]
+
+            cls.up_statuses_cache = (PyFunceble.STATUS, list_of_up_statuses)
 
         return list_of_up_statuses
 
+    @classmethod
+    def sort_file(cls, file_path, key_method, header_limit):
+        """
+        Sorts the content of the given file.
+
+        :param str file_path: The file to sort.
+        :param key_method: The method to use to format the lines before sorting.
+        :param int header_limit: The number of lines to not sort.
+        """
+
+        PyFunceble.engine.ExternalSort(
+            file_path, key_method, header_limit=header_limit
+        ).sort()
+
     @classmethod
     def sort_generated_files(cls):  # pragma: no cover
         """
         Sort the content of all files we generated.
+
+        .. note::
+            When the multiprocessing is activated, independent files
+            are sorted in parallel.
         """
 
-        header_limit = 3
+        # We write what is still waiting to be written.
+        PyFunceble.output.Writer.close()
+
+        if not PyFunceble.CONFIGURATION.hierarchical_sorting:
+            # We do not have to sort hierarchicaly.
+
+            # We sort the lines of the files standarly.
+            key_method = PyFunceble.engine.Sort.standard
+        else:
+            # We do have to sort hierarchicaly.
+
+            # We sort the lines of the files hierarchicaly.
+            key_method = PyFunceble.engine.Sort.hierarchical
+
+        to_sort = []
 
         for root, _, files in walk(
             PyFunceble.OUTPUT_DIRECTORY + PyFunceble.OUTPUTS.parent_directory
         ):
             # We loop through the list of directories of the output directory.
 
+            if f"{directory_separator}logs" in root:
+                # The currently read root should be ignored.
+
+                continue
+
+            if f"{directory_separator}splited" in root:
+                # The splited files have an additional header line.
+                header_limit = 4
+            else:
+                header_limit = 3
+
             for file in files:
                 # We loop through the list of file of the
                 # currently read directory.
@@ -130,49 +189,33 @@ class CLICore:
                     # We continue the loop.
                     continue
 
-                if f"{directory_separator}logs" in root:
-                    # The currently read root should be ignored.
-
-                    continue
-
-                if f"{directory_separator}splited" in root:
-                    header_limit += 1
-
-                # We create an instance of our File().
-                file_instance = PyFunceble.helpers.File(
-                    "{0}{1}{2}".format(root, directory_separator, file)
+                to_sort.append(
+                    (
+                        "{0}{1}{2}".format(root, directory_separator, file),
+                        key_method,
+                        header_limit,
+                    )
                 )
-                # We get the content of the current file.
-                file_content = file_instance.read().splitlines()
-
-                if not PyFunceble.CONFIGURATION.hierarchical_sorting:
-                    # We do not have to sort hierarchicaly.
-
-                    # We sort the lines of the file standarly.
-                    formatted = PyFunceble.helpers.List(
-                        file_content[header_limit:]
-                    ).custom_format(PyFunceble.engine.Sort.standard)
-                else:
-                    # We do have to sort hierarchicaly.
 
-                    # We sort the lines of the file hierarchicaly.
-                    formatted = PyFunceble.helpers.List(
-                        file_content[header_limit:]
-                    ).custom_format(PyFunceble.engine.Sort.hierarchical)
-
-                # We finally put the formatted data in place.
-                to_write = file_content[:header_limit]
-                to_write.extend(formatted)
-                to_write.append("")
-
-                file_instance.write("\n".join(to_write), overwrite=True)
+        if (
+            PyFunceble.CONFIGURATION.multiprocess
+            and PyFunceble.CONFIGURATION.maximal_processes > 1
+            and len(to_sort) > 1
+        ):
+            with Pool(
+                min(PyFunceble.CONFIGURATION.maximal_processes, len(to_sort))
+            ) as pool:
+                pool.starmap(cls.sort_file, to_sort)
+        else:
+            for file_path, file_key_method, header_limit in to_sort:
+                cls.sort_file(file_path, file_key_method, header_limit)
 
     @classmethod
     def save_into_database(cls, output, filename):  # pragma: no cover
         """
         Saves the current status inside the database.
         """
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             output = output.copy()
             if (
                 isinstance(output["http_status_code"], str)
@@ -185,47 +228,25 @@ class CLICore:
             if not filename:
                 filename = "simple"
 
-            status_input = output.copy()
-
-            undesirable_status = ["dns_lookup", "whois_record", "whois_server"]
+            # We only keep what is part of our status table.
+            status_input = {
+                x: y for x, y in output.items() if x in Status.__table__.columns
+            }
+            status_input["test_completed"] = True
 
-            for index in undesirable_status:
-                del status_input[index]
+            # The status is written along with the other pending rows.
+            BulkWriter.get_instance().add_status(filename, status_input)
 
-            with session.Session() as db_session:
-                # pylint: disable=no-member
-                try:
-                    file = db_session.query(File).filter(File.path == filename).one()
-                except NoResultFound:
-                    file = File(path=filename)
-
-                    db_session.add(file)
-                    db_session.commit()
-                    db_session.refresh(file)
-
-            with session.Session() as db_session:
-                # pylint: disable=no-member
-                try:
-                    status = (
-                        db_session.query(Status)
-                        .filter(Status.file_id == file.id)
-                        .filter(Status.tested == status_input["tested"])
-                        .one()
-                    )
-                except NoResultFound:
-                    status = Status(file_id=file.id)
-
-            for index, value in status_input.items():
-                setattr(status, index, value)
-
-            status.test_completed = True
+            PyFunceble.LOGGER.debug(f"Saved into database:\n{output}")
 
-            with session.Session() as db_session:
-                # pylint: disable=no-member
-                db_session.add(status)
-                db_session.commit()
+    @classmethod
+    def flush_database_writer(cls):  # pragma: no cover
+        """
+        Writes the pending rows of the SQL databases (if any).
+        """
 
-            PyFunceble.LOGGER.debug(f"Saved into database:\n{output}")
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            BulkWriter.get_instance().flush()
 
     @classmethod
     def get_simple_coloration(cls, status):
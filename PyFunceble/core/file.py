@@ -49,6 +49,7 @@ License:
     limitations under the License.
 """
 
+from itertools import islice
 from tempfile import NamedTemporaryFile
 
 import domain2idna
@@ -83,6 +84,9 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
 
     accepted_file_content_types = ["url", "domain"]
 
+    # The number of lines we process at once while constructing the shadow file.
+    shadow_file_chunk_size = 10000
+
     def __init__(self, file, file_content_type="domain"):
         super().__init__()
 
@@ -171,7 +175,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         :param bool include_entries_without_changes: Descriptive enough.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             with session.Session() as db_session:
                 fetched = (
                     # pylint: disable=no-member, singleton-comparison
@@ -223,7 +227,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         Generates all needed files.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             self.preset.reset_counters()
 
             if PyFunceble.CONFIGURATION.syntax:
@@ -339,7 +343,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             )
             return True
 
-        if auto_continue_db and subject in auto_continue_db.get_already_tested():
+        if auto_continue_db and auto_continue_db.is_already_tested(subject):
             PyFunceble.LOGGER.debug(
                 f"Ignored {subject} because it is into the list of already tested (autocontinue)."
             )
@@ -348,16 +352,14 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         if (
             not ignore_inactive_db_check
             and inactive_db
-            and subject in inactive_db.get_already_tested()
+            and inactive_db.is_already_tested(subject)
         ):
             PyFunceble.LOGGER.debug(
                 f"Ignored {subject} because it is into the list of already tested (inactive_db)."
             )
             return True
 
-        if PyFunceble.helpers.Regex(cls.regex_ignore).match(
-            subject, return_match=False
-        ):
+        if PyFunceble.helpers.Regex.get_compiled(cls.regex_ignore).search(subject):
             PyFunceble.LOGGER.debug(f"Ignored {subject} because it match our regex.")
             return True
 
@@ -370,12 +372,15 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             )
             return True
 
-        if PyFunceble.CONFIGURATION.filter and not PyFunceble.helpers.Regex(
+        if (
             PyFunceble.CONFIGURATION.filter
-        ).match(subject, return_match=False):
+            and not PyFunceble.helpers.Regex.get_compiled(
+                PyFunceble.CONFIGURATION.filter
+            ).search(subject)
+        ):
             PyFunceble.LOGGER.debug(
                 f"Ignored {subject} because it does not "
-                f"match the given filter ({PyFunceble.CONFIGURATION.fileter})"
+                f"match the given filter ({PyFunceble.CONFIGURATION.filter})"
             )
             return True
 
@@ -395,6 +400,15 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         Do the post test treatment.
         """
 
+        if (
+            PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
+            and PyFunceble.CONFIGURATION.multiprocess
+        ):
+            # The test was done by one of our child processes.
+
+            # We merge its status into our counters.
+            PyFunceble.output.Percentage(test_output["status"]).count()
+
         if auto_continue_db:
             auto_continue_db.add(test_output["tested"], test_output["status"])
 
@@ -416,7 +430,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         if (
             auto_continue_db
             and complements_test_started
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
             if "complements" in auto_continue_db.database:
 
@@ -424,7 +438,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
                     auto_continue_db.database["complements"].remove(
                         test_output["tested"]
                     )
-                    auto_continue_db.save()
+                    auto_continue_db.save_scheduler.schedule()
 
         if (
             whois_db
@@ -440,7 +454,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             )
 
         if (
-            PyFunceble.CONFIGURATION.db_type == "json"
+            PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
             and PyFunceble.CONFIGURATION.multiprocess
         ):
             generate = PyFunceble.output.Generate(
@@ -464,6 +478,9 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         """
 
         if test_completed or auto_save.is_time_exceed():
+            # We save the pending changes of our databases.
+            PyFunceble.engine.SaveScheduler.flush_all()
+
             auto_continue_db.update_counters()
             self.generate_files()
             self.sort_generated_files()
@@ -471,21 +488,42 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             if test_completed:
                 auto_continue_db.clean()
 
+            if PyFunceble.DNSLOOKUP.cache is not None:
+                PyFunceble.LOGGER.info(
+                    f"DNS cache statistics: {PyFunceble.DNSLOOKUP.cache.get_statistics()}"
+                )
+
+            PyFunceble.LOGGER.info(
+                f"Regex cache statistics: {PyFunceble.helpers.Regex.get_statistics()}"
+            )
+
+            PyFunceble.LOGGER.info(
+                "WHOIS servers statistics: "
+                f"{PyFunceble.lookup.WhoisLimiter.get_statistics()}"
+            )
+
             auto_save.process(test_completed=test_completed)
 
-    def __run_single_test(self, subject, ignore_inactive_db_check=False):
+    def __run_single_test(self, subject, ignore_inactive_db_check=False, ignored=None):
         """
         Run a test for a single subject.
+
+        :param bool ignored:
+            Tell us if the subject should be ignored.
+            If :code:`None` is given, we check it ourself.
         """
 
         self.print_header()
 
-        if not self.should_be_ignored(
-            subject,
-            auto_continue_db=self.autocontinue,
-            inactive_db=self.inactive_db,
-            ignore_inactive_db_check=ignore_inactive_db_check,
-        ):
+        if ignored is None:
+            ignored = self.should_be_ignored(
+                subject,
+                auto_continue_db=self.autocontinue,
+                inactive_db=self.inactive_db,
+                ignore_inactive_db_check=ignore_inactive_db_check,
+            )
+
+        if not ignored:
             result = self.test(subject)
 
             self.post_test_treatment(
@@ -525,11 +563,25 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             return [subjects]
         return subjects
 
-    def __test_line(self, line, ignore_inactive_db_check=False):
+    def __test_line(self, line, ignore_inactive_db_check=False, subjects=None):
         """
         Tests a given line.
+
+        :param list subjects:
+            The already checked subjects of the given line.
+            It should be a list of :code:`(subject, ignored)` tuples.
         """
 
+        if subjects is not None:
+            for subject, ignored in subjects:
+                self.__run_single_test(
+                    subject,
+                    ignore_inactive_db_check=ignore_inactive_db_check,
+                    ignored=ignored,
+                )
+
+            return
+
         subjects = self.get_subjects(line)
 
         if isinstance(subjects, list):
@@ -542,62 +594,243 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
                 subjects, ignore_inactive_db_check=ignore_inactive_db_check
             )
 
-    def write_in_shadow_file_if_needed(
-        self,
-        line,
-        temp_file,
-        ignore_inactive_db_check=False,
-        autocontinue=None,
-        inactive_db=None,
-    ):
+    def __check_chunk(self, chunk, ignore_inactive_db_check=False):
         """
-        Checks if the given line should be in the
-        shadow file.
+        Checks which subjects of the given lines should be ignored.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (checked lines, subjects to prefetch)
+
+            See :meth:`__prefetch_records` for the format of the
+            checked lines.
+        :rtype: tuple
         """
 
-        subjects = self.get_subjects(line)
+        to_prefetch = []
+        checked = []
+        seen = set()
 
-        if autocontinue is None:
-            autocontinue = self.autocontinue
-        if inactive_db is None:
-            inactive_db = self.inactive_db
+        for line in chunk:
+            subjects = self.get_subjects(line)
 
-        if isinstance(subjects, list):
-            comparison = {
-                self.should_be_ignored(
-                    x,
-                    auto_continue_db=autocontinue,
-                    inactive_db=inactive_db,
-                    ignore_inactive_db_check=ignore_inactive_db_check,
-                )
-                for x in subjects
-            }
-        else:
-            comparison = {
-                self.should_be_ignored(
-                    subjects,
-                    auto_continue_db=autocontinue,
-                    inactive_db=inactive_db,
+            if not isinstance(subjects, list):
+                checked.append((line, None))
+                continue
+
+            checked_subjects = []
+            checked.append((line, checked_subjects))
+
+            for subject in subjects:
+                if subject in seen:
+                    # The test of its previous occurrence may change
+                    # the outcome, so we let the test check it again.
+                    checked_subjects.append((subject, None))
+                    continue
+
+                seen.add(subject)
+
+                ignored = self.should_be_ignored(
+                    subject,
+                    auto_continue_db=self.autocontinue,
+                    inactive_db=self.inactive_db,
                     ignore_inactive_db_check=ignore_inactive_db_check,
                 )
-            }
 
-        if all(comparison) and (
-            self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots
-        ):
-            print("I", end="")
-        elif self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-            print("S", end="")
+                checked_subjects.append((subject, ignored))
+
+                if ignored:
+                    continue
+
+                if PyFunceble.CONFIGURATION.idna_conversion:
+                    subject = domain2idna.domain2idna(subject)
+
+                # We have to follow what self.test() does.
+                if "url" not in self.file_type:
+                    subject = subject.lower()
+
+                to_prefetch.append(subject)
+
+        return checked, to_prefetch
+
+    def __prefetch_records(self, lines, ignore_inactive_db_check=False):
+        """
+        Yields the given lines while prefetching - concurrently - the
+        DNS records and the HTTP status codes of the subjects to test.
+
+        :return:
+            A tuple per line in the following format.
+
+            ::
+
+                (line, subjects)
+
+            where :code:`subjects` is the list of :code:`(subject, ignored)`
+            tuples we already checked or :code:`None` if we did not check
+            the line.
+        :rtype: tuple
+
+        .. note::
+            We only prefetch the DNS records when the asynchronous DNS lookup
+            is activated and when we test the availability of domains or IPs.
+
+        .. note::
+            We only prefetch the HTTP status codes when the asynchronous
+            HTTP status code lookup is activated and when we test the
+            availability.
+        """
+
+        if PyFunceble.CONFIGURATION.syntax or PyFunceble.CONFIGURATION.reputation:
+            yield from ((x, None) for x in lines)
+            return
 
-        if not all(comparison):
-            to_write = (
-                "\n".join([subjects[x] for x, _ in enumerate(comparison) if comparison])
-                + "\n"
+        prefetch_dns = (
+            PyFunceble.CONFIGURATION.dns_lookup_async and "url" not in self.file_type
+        )
+        prefetch_http_code = (
+            PyFunceble.CONFIGURATION.http_code_async and PyFunceble.HTTP_CODE.active
+        )
+
+        if not prefetch_dns and not prefetch_http_code:
+            yield from ((x, None) for x in lines)
+            return
+
+        chunk_size = max(
+            PyFunceble.CONFIGURATION.dns_lookup_concurrency if prefetch_dns else 1,
+            PyFunceble.CONFIGURATION.http_code_concurrency if prefetch_http_code else 1,
+        )
+
+        lines = iter(lines)
+
+        while True:
+            chunk = list(islice(lines, chunk_size))
+
+            if not chunk:
+                break
+
+            checked, to_prefetch = self.__check_chunk(
+                chunk, ignore_inactive_db_check=ignore_inactive_db_check
             )
 
-            if isinstance(temp_file, str):
-                temp_file = open(temp_file, "a+b")
-            temp_file.write(to_write.encode("utf-8"))
+            if prefetch_dns:
+                PyFunceble.DNSLOOKUP.prefetch(to_prefetch)
+
+            if prefetch_http_code:
+                PyFunceble.lookup.HTTPCode.prefetch(
+                    [
+                        (
+                            x,
+                            "ipv6"
+                            if "url" not in self.file_type
+                            and PyFunceble.Check(x).is_ipv6()
+                            else f"file_{self.file_type}",
+                        )
+                        for x in to_prefetch
+                    ]
+                )
+
+            yield from checked
+
+    def get_already_tested(self, ignore_inactive_db_check=False):
+        """
+        Provides the set of subjects we do not have to test (anymore).
+
+        .. note::
+            We construct it once before the construction of the shadow file
+            so that we do not have to ask our databases for each subject.
+
+        :param bool ignore_inactive_db_check:
+            Tells us to ignore the content of the inactive database.
+
+        :rtype: set
+        """
+
+        result = set()
+
+        if self.autocontinue.authorized:
+            result.update(self.autocontinue.get_already_tested() or set())
+
+        if not ignore_inactive_db_check and self.inactive_db.authorized:
+            result.update(self.inactive_db.get_already_tested() or set())
+
+        return result
+
+    @classmethod
+    def filter_shadow_file_chunk(
+        cls, lines, already_tested, ignore_inactive_db_check=False
+    ):
+        """
+        Filters the given chunk of lines and provides what we have to
+        write into the shadow file.
+
+        :param list lines: The lines to filter.
+        :param set already_tested: The subjects we do not have to test.
+        :param bool ignore_inactive_db_check:
+            Tells us to ignore the content of the inactive database.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (the content to write, the progress to print)
+
+        :rtype: tuple
+        """
+
+        to_write = []
+        progress = []
+
+        for line in lines:
+            subjects = [
+                x
+                for x in cls.get_subjects(line) or []
+                if x not in already_tested
+                and not cls.should_be_ignored(
+                    x, None, None, ignore_inactive_db_check=ignore_inactive_db_check
+                )
+            ]
+
+            if subjects:
+                to_write.extend(subjects)
+                progress.append("S")
+            else:
+                progress.append("I")
+
+        return "".join(f"{x}\n" for x in to_write), "".join(progress)
+
+    def get_shadow_file_chunks(self, file_stream, ignore_inactive_db_check=False):
+        """
+        Reads the given stream by chunk and yields - in order - what we have
+        to write into the shadow file.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (the number of read lines, the content to write, the progress to print)
+
+        :rtype: tuple
+        """
+
+        already_tested = self.get_already_tested(
+            ignore_inactive_db_check=ignore_inactive_db_check
+        )
+        lines = iter(file_stream)
+
+        while True:
+            chunk = list(islice(lines, self.shadow_file_chunk_size))
+
+            if not chunk:
+                break
+
+            yield (len(chunk),) + self.filter_shadow_file_chunk(
+                chunk, already_tested, ignore_inactive_db_check=ignore_inactive_db_check
+            )
 
     def construct_and_get_shadow_file(
         self, file_stream, ignore_inactive_db_check=False
@@ -609,23 +842,33 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         and what we still have to test.
         """
 
-        if PyFunceble.CONFIGURATION.shadow_file:
-            with NamedTemporaryFile(delete=False) as temp_file:
-                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                    print("")
-
-                for line in file_stream:
-                    self.write_in_shadow_file_if_needed(
-                        line,
-                        temp_file,
-                        ignore_inactive_db_check=ignore_inactive_db_check,
-                    )
+        if not PyFunceble.CONFIGURATION.shadow_file:
+            return file_stream.name
+
+        print_progress = self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots
+        read_lines = 0
+
+        with NamedTemporaryFile("w", encoding="utf-8", delete=False) as temp_file:
+            if print_progress:
+                print("")
 
-                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                    print("")
+            for number_of_lines, to_write, progress in self.get_shadow_file_chunks(
+                file_stream, ignore_inactive_db_check=ignore_inactive_db_check
+            ):
+                temp_file.write(to_write)
+                read_lines += number_of_lines
+
+                PyFunceble.LOGGER.info(
+                    f"Shadow file: {read_lines} lines of {self.file!r} processed."
+                )
 
-                return temp_file.name
-        return file_stream.name
+                if print_progress:
+                    print(progress, end="", flush=True)
+
+            if print_progress:
+                print("")
+
+            return temp_file.name
 
     def run_test(self):
         """
@@ -640,7 +883,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             minimum_position = tracker.get_position()
             file_position = 0
 
-            for line in shadow_file:
+            for line, subjects in self.__prefetch_records(shadow_file):
                 if tracker.authorized and file_position < minimum_position:
                     file_position += len(line)
 
@@ -652,7 +895,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
 
                     continue
 
-                self.__test_line(line)
+                self.__test_line(line, subjects=subjects)
 
                 file_position += len(line)
                 tracker.set_position(file_position)
@@ -662,6 +905,9 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         if PyFunceble.CONFIGURATION.shadow_file:
             PyFunceble.helpers.File(shadow_file_name).delete()
 
+        # The following steps read what we wrote into the database.
+        self.flush_database_writer()
+
         if self.autocontinue.is_empty():
             with open(self.file, "r", encoding="utf-8") as file_stream, open(
                 self.construct_and_get_shadow_file(
@@ -670,23 +916,33 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
                 "r",
                 encoding="utf-8",
             ) as shadow_file:
-                for line in shadow_file:
-                    self.__test_line(line, ignore_inactive_db_check=True)
+                for line, subjects in self.__prefetch_records(
+                    shadow_file, ignore_inactive_db_check=True
+                ):
+                    self.__test_line(
+                        line, ignore_inactive_db_check=True, subjects=subjects
+                    )
 
                 shadow_file_name = shadow_file.name
 
         if PyFunceble.CONFIGURATION.shadow_file:
             PyFunceble.helpers.File(shadow_file_name).delete()
 
-        for subject in self.inactive_db.get_to_retest():
-            self.__test_line(subject)
+        self.flush_database_writer()
+
+        for line, subjects in self.__prefetch_records(self.inactive_db.get_to_retest()):
+            self.__test_line(line, subjects=subjects)
 
+        self.flush_database_writer()
         self.complements_test_started = True
 
-        for subject in self.get_complements(self.autocontinue):
-            self.__test_line(subject)
+        for line, subjects in self.__prefetch_records(
+            self.get_complements(self.autocontinue)
+        ):
+            self.__test_line(line, subjects=subjects)
 
         self.complements_test_started = False
+        self.flush_database_writer()
 
         for index, subject in self.mining.list_of_mined():
             self.__test_line(subject)
@@ -51,9 +51,9 @@ License:
 """
 
 import sys
-from itertools import chain
-from multiprocessing import Manager, Pipe, Process, active_children
-from tempfile import NamedTemporaryFile
+from itertools import chain, islice
+from multiprocessing import Manager, Pipe, Process
+from multiprocessing.connection import wait
 from traceback import format_exc
 
 import domain2idna
@@ -64,6 +64,7 @@ import PyFunceble
 
 from .api import APICore
 from .file import FileCore
+from .worker_pool import WorkerPool
 
 
 class OurProcessWrapper(Process):
@@ -101,6 +102,10 @@ class OurProcessWrapper(Process):
 
             # We send the exception and its traceback to the pipe.
             self.conn2.send((exception, traceback))
+        finally:
+            # We write what is still waiting to be written as we are
+            # not going to exit normally.
+            PyFunceble.output.Writer.close()
 
     @property
     def exception(self):
@@ -141,19 +146,10 @@ class MultiprocessCore(
     def __init__(self, file, file_content_type="domain"):
         super().__init__(file, file_content_type=file_content_type)
 
-    # pylint: disable=arguments-differ
-    def test(
-        self,
-        subject,
-        file_content_type,
-        loader,
-        manager_data,
-        intern,
-        ignore_inactive_db_check=False,
-        custom=None,
-    ):
+    @classmethod
+    def load_in_child(cls, loader, intern, custom=None):
         """
-        Tests the given subject and return the result.
+        Loads and injects the configuration into the current (child) process.
         """
 
         PyFunceble.LOADER = loader
@@ -168,6 +164,28 @@ class MultiprocessCore(
 
         PyFunceble.INTERN.update(intern)
 
+    @classmethod
+    def get_child_custom_config(cls):
+        """
+        Provides the custom configuration to apply into the child processes.
+        """
+
+        return {
+            "api_file_generation": PyFunceble.CONFIGURATION.db_type
+            in ["json", "journal"],
+            "inactive_database": False,
+            "auto_continue": False,
+            "quiet": PyFunceble.CONFIGURATION.quiet,
+        }
+
+    def test_in_child(self, subject, file_content_type, ignore_inactive_db_check=False):
+        """
+        Tests the given subject from an already configured child process.
+
+        :return: The result of the test or :code:`None` if the subject was skipped.
+        :rtype: dict, None
+        """
+
         if PyFunceble.CONFIGURATION.idna_conversion:
             subject = domain2idna.domain2idna(subject)
 
@@ -199,21 +217,108 @@ class MultiprocessCore(
             self.generate_complement_status_file(result["tested"], result["status"])
             self.save_into_database(result, self.file)
 
+            return result
+
+        if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
+            PyFunceble.LOGGER.info(f"Skipped {subject!r}.")
+            print(".", end="")
+
+        return None
+
+    def __child_post_test_treatment(self, result):
+        """
+        Runs the post test treatment from inside a child process.
+        """
+
+        self.post_test_treatment(
+            result,
+            self.file_type,
+            complements_test_started=self.complements_test_started,
+            auto_continue_db=self.autocontinue,
+            inactive_db=self.inactive_db,
+            mining=self.mining,
+            whois_db=self.whois_db,
+        )
+
+    # pylint: disable=arguments-differ
+    def test(
+        self,
+        subject,
+        file_content_type,
+        loader,
+        manager_data,
+        intern,
+        ignore_inactive_db_check=False,
+        custom=None,
+    ):
+        """
+        Tests the given subject and return the result.
+        """
+
+        self.load_in_child(loader, intern, custom=custom)
+
+        result = self.test_in_child(
+            subject,
+            file_content_type,
+            ignore_inactive_db_check=ignore_inactive_db_check,
+        )
+
+        if result:
             if manager_data is not None:
                 manager_data.append(result)
             else:
-                self.post_test_treatment(
-                    result,
+                self.__child_post_test_treatment(result)
+
+        # We write what we have to write before exiting.
+        self.flush_database_writer()
+
+    def work_pool_process(
+        self, task_queue, result_queue, loader, intern, custom=None
+    ):  # pylint: disable=too-many-arguments
+        """
+        Work process of a long-lived worker of the worker pool.
+
+        The configuration is loaded once, then we test every subject we
+        get from the task queue until we get :code:`None`.
+
+        Each processed task is acknowledged into the result queue with a tuple
+        in the following format.
+
+        ::
+
+            (result, traceback)
+
+        .. note::
+            The result is only transmitted to the parent process when the
+            JSON format is used for the database.
+            Otherwise, we run the post test treatment from the worker.
+        """
+
+        try:
+            self.load_in_child(loader, intern, custom=custom)
+
+            for subject, ignore_inactive_db_check in iter(task_queue.get, None):
+                result = self.test_in_child(
+                    subject,
                     self.file_type,
-                    complements_test_started=self.complements_test_started,
-                    auto_continue_db=self.autocontinue,
-                    inactive_db=self.inactive_db,
-                    mining=self.mining,
-                    whois_db=self.whois_db,
+                    ignore_inactive_db_check=ignore_inactive_db_check,
                 )
-        elif self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-            PyFunceble.LOGGER.info(f"Skipped {subject!r}.")
-            print(".", end="")
+
+                if result and PyFunceble.CONFIGURATION.db_type not in [
+                    "json",
+                    "journal",
+                ]:
+                    self.__child_post_test_treatment(result)
+                    result = None
+
+                result_queue.put((result, None))
+
+            # We write what we have to write before exiting.
+            self.flush_database_writer()
+        except Exception:  # pylint: disable=broad-except
+            PyFunceble.LOGGER.exception()
+
+            result_queue.put((None, format_exc()))
 
     def __merge_processes_data(self, manager_data, tracker=None):
         """
@@ -251,45 +356,43 @@ class MultiprocessCore(
 
             manager_data[:] = []
 
-        self.autocontinue.save()
-        self.inactive_db.save()
-        self.mining.save()
-
         self.cleanup(self.autocontinue, self.autosave, test_completed=False)
 
-    def __check_exception(self, processes, manager_data):
+    def __check_exception(self, finished_processes, processes, manager_data):
         """
         Checks if an exception is present into the given pool of processes.
 
-        :param list processes. A list of running processes.
+        :param list finished_processes:
+            A list of processes which finished.
+        :param list processes:
+            A list of processes which are still running. They are all
+            terminated if an exception is found.
         """
 
-        exception_present = False
-
-        for process in processes:
-            # We loop through the list of processes.
+        for process in finished_processes:
+            # We loop through the list of finished processes.
 
             try:
-                if process.exception and not exception_present:
-                    # There in an exception in the currently
-                    # read process.
+                if not process.exception:
+                    continue
+            except AttributeError:
+                continue
 
-                    # We get the traceback
-                    _, traceback = process.exception
+            # There in an exception in the currently
+            # read process.
 
-                    # We print the traceback.
-                    print(traceback)
-                    PyFunceble.LOGGER.error(traceback)
+            # We get the traceback
+            _, traceback = process.exception
 
-                    exception_present = True
+            # We print the traceback.
+            print(traceback)
+            PyFunceble.LOGGER.error(traceback)
 
-                if exception_present:
-                    # We kill the process.
-                    process.terminate()
-            except AttributeError:
-                continue
+            for running_process in processes:
+                # We kill the processes which are still running.
+                running_process.terminate()
+                running_process.join()
 
-        if exception_present:
             # We finally exit.
             self.__merge_processes_data(manager_data)
 
@@ -298,6 +401,9 @@ class MultiprocessCore(
     def __start_process(self, subject, manager_data, ignore_inactive_db_check=False):
         """
         Starts a new process.
+
+        :return: The started process or :code:`None` if the subject was skipped.
+        :rtype: OurProcessWrapper, None
         """
 
         if subject in self.autocontinue:
@@ -318,13 +424,7 @@ class MultiprocessCore(
                     manager_data,
                     original_intern,
                     ignore_inactive_db_check,
-                    {
-                        "api_file_generation": PyFunceble.CONFIGURATION.db_type
-                        == "json",
-                        "inactive_database": False,
-                        "auto_continue": False,
-                        "quiet": PyFunceble.CONFIGURATION.quiet,
-                    },
+                    self.get_child_custom_config(),
                 ),
             )
             process.name = f"PyF {subject}"
@@ -335,6 +435,43 @@ class MultiprocessCore(
 
             PyFunceble.INTERN.update(original_intern)
 
+            return process
+
+        return None
+
+    @classmethod
+    def __wait_for_processes(cls, processes, maximal=1):
+        """
+        Blocks until less than the given maximal number of processes
+        are still running.
+
+        .. note::
+            We sleep on the sentinels of the processes instead of
+            looping over :code:`active_children()`.
+
+        :param list processes:
+            The list of running processes. The finished ones are removed
+            from it.
+        :param int maximal:
+            The maximal number of processes we allow to keep running.
+
+        :return: The list of processes which finished.
+        :rtype: list
+        """
+
+        finished_processes = []
+
+        while processes and len(processes) >= maximal:
+            wait([x.sentinel for x in processes])
+
+            for process in [x for x in processes if not x.is_alive()]:
+                process.join()
+
+                processes.remove(process)
+                finished_processes.append(process)
+
+        return finished_processes
+
     def __process_live_merging(self, finished, manager_data, tracker):
         """
         Processes the live merging.
@@ -351,20 +488,134 @@ class MultiprocessCore(
 
         return False
 
-    def __process_end_merging(self, finished, manager_data, tracker):
+    def __process_end_merging(self, finished, processes, manager_data, tracker):
         """
         Processes the end merging.
         """
 
         if finished or self.autosave.is_time_exceed():
-            while "PyF" in " ".join([x.name for x in reversed(active_children())]):
-                continue
+            self.__check_exception(
+                self.__wait_for_processes(processes), processes, manager_data
+            )
 
             self.__merge_processes_data(manager_data, tracker=tracker)
 
             return True
         return False
 
+    def __get_subjects_to_test(self, stream, tracker=None):
+        """
+        Provides the subjects to test from the given stream.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (the mining index or None, the subject)
+
+        :rtype: tuple
+        """
+
+        minimum_position = tracker.get_position() if tracker else 0
+        file_position = 0
+
+        for line in stream:
+            index = None
+
+            if isinstance(line, tuple):
+                index, line = line
+
+            if tracker and tracker.authorized and file_position < minimum_position:
+                file_position += len(line)
+
+                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
+                    PyFunceble.LOGGER.info(f"Skipped {line!r}: insufficient position.")
+                    print(".", end="")
+
+                continue
+
+            subjects = self.get_subjects(line)
+
+            if not isinstance(subjects, list):
+                subjects = [subjects]
+
+            for subject in subjects:
+                yield index, subject
+
+            if tracker and tracker.authorized:
+                file_position += len(line)
+
+    def __get_worker_pool_result(self, pool, pool_data, tracker):
+        """
+        Waits for the next acknowledgement of the workers and
+        merges it (if needed).
+        """
+
+        result, traceback = pool.get()
+
+        if traceback:
+            pool.abort(traceback)
+
+            self.__merge_processes_data(pool_data)
+
+            sys.exit(1)
+
+        if result:
+            pool_data.append(result)
+
+        if (
+            PyFunceble.CONFIGURATION.multiprocess_merging_mode == "live"
+            and len(pool_data) >= PyFunceble.CONFIGURATION.maximal_processes
+        ):
+            self.__merge_processes_data(pool_data, tracker=tracker)
+
+    def __run_worker_pool_test(
+        self, stream, ignore_inactive_db_check=False, tracker=None
+    ):
+        """
+        Tests the content of the given stream through a pool
+        of long-lived workers.
+        """
+
+        self.print_header()
+
+        pool_data = []
+        pending = 0
+        # We limit the number of queued tasks so that we never
+        # load the whole input into memory.
+        maximal_pending = PyFunceble.CONFIGURATION.maximal_processes * 2
+
+        with WorkerPool(
+            self.work_pool_process, args=(self.get_child_custom_config(),)
+        ) as pool:
+            for index, subject in self.__get_subjects_to_test(stream, tracker=tracker):
+                if self.autosave.is_time_exceed():
+                    break
+
+                if subject in self.autocontinue:
+                    if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
+                        PyFunceble.LOGGER.info(f"Skipped {subject!r}: already tested.")
+                        print(".", end="")
+                else:
+                    pool.put((subject, ignore_inactive_db_check))
+                    pending += 1
+
+                if index is not None:
+                    # An index was given, we remove the index and subject from
+                    # the mining database.
+                    self.mining.remove(index, subject)
+
+                while pending >= maximal_pending:
+                    self.__get_worker_pool_result(pool, pool_data, tracker)
+                    pending -= 1
+
+            while pending:
+                self.__get_worker_pool_result(pool, pool_data, tracker)
+                pending -= 1
+
+        self.__merge_processes_data(pool_data, tracker=tracker)
+
     # pylint: disable=too-many-nested-blocks,too-many-branches
     def __run_multiprocess_test(
         self, stream, manager, ignore_inactive_db_check=False, tracker=None
@@ -373,12 +624,20 @@ class MultiprocessCore(
         Tests the content of the given file.
         """
 
+        if PyFunceble.CONFIGURATION.multiprocess_worker_pool:
+            self.__run_worker_pool_test(
+                stream,
+                ignore_inactive_db_check=ignore_inactive_db_check,
+                tracker=tracker,
+            )
+            return
+
         self.print_header()
 
         finished = False
         index = "funilrys"
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             manager_data = manager.list()
         else:
             manager_data = None
@@ -386,9 +645,11 @@ class MultiprocessCore(
         minimum_position = tracker.get_position() if tracker else 0
         file_position = 0
 
+        processes = []
+
         while True:
             while (
-                len(active_children()) <= PyFunceble.CONFIGURATION.maximal_processes
+                len(processes) < PyFunceble.CONFIGURATION.maximal_processes
                 and not self.autosave.is_time_exceed()
             ):
                 try:
@@ -419,10 +680,12 @@ class MultiprocessCore(
 
                     if isinstance(subjects, list):
                         for subject in subjects:
-                            self.__start_process(
-                                subject,
-                                manager_data,
-                                ignore_inactive_db_check=ignore_inactive_db_check,
+                            processes.append(
+                                self.__start_process(
+                                    subject,
+                                    manager_data,
+                                    ignore_inactive_db_check=ignore_inactive_db_check,
+                                )
                             )
 
                             if index != "funilrys":
@@ -430,10 +693,12 @@ class MultiprocessCore(
                                 # the mining database.
                                 self.mining.remove(index, subject)
                     else:
-                        self.__start_process(
-                            subjects,
-                            manager_data,
-                            ignore_inactive_db_check=ignore_inactive_db_check,
+                        processes.append(
+                            self.__start_process(
+                                subjects,
+                                manager_data,
+                                ignore_inactive_db_check=ignore_inactive_db_check,
+                            )
                         )
 
                         if index != "funilrys":
@@ -444,119 +709,163 @@ class MultiprocessCore(
                     if tracker and tracker.authorized:
                         file_position += len(line)
 
+                    # We only keep track of the processes we actually started.
+                    processes[:] = [x for x in processes if x is not None]
+
                     continue
                 except StopIteration:
                     finished = True
                     break
 
-            self.__check_exception(active_children(), manager_data)
-
-            while len(
-                active_children()
-            ) >= PyFunceble.CONFIGURATION.maximal_processes and "PyF" in " ".join(
-                [x.name for x in reversed(active_children())]
-            ):
-                self.__process_live_merging(finished, manager_data, tracker)
-                continue
+            # We sleep until at least one process finished.
+            self.__check_exception(
+                self.__wait_for_processes(
+                    processes, maximal=PyFunceble.CONFIGURATION.maximal_processes
+                ),
+                processes,
+                manager_data,
+            )
 
             if self.__process_live_merging(finished, manager_data, tracker):
                 continue
 
-            if self.__process_end_merging(finished, manager_data, tracker):
+            if self.__process_end_merging(finished, processes, manager_data, tracker):
                 break
 
-    def work_process(self, *args):
-        """
-        Work process for :code`construct_and_get_shadow_file`.
+    def work_shadow_file_process(
+        self,
+        task_queue,
+        result_queue,
+        loader,
+        intern,
+        already_tested,
+        *,
+        ignore_inactive_db_check=False,
+    ):  # pylint: disable=too-many-arguments
         """
+        Work process of a long-lived worker of the shadow file pool.
 
-        PyFunceble.LOADER = args[-2]
+        We filter every chunk we get from the task queue until we get
+        :code:`None`.
 
-        if not PyFunceble.LOADER.was_configuration_loaded():
-            PyFunceble.LOADER.get_config()
+        Each processed chunk is sent into the result queue with a tuple
+        in the following format.
 
-        PyFunceble.LOADER.inject_all()
+        ::
+
+            (
+                (
+                    chunk index,
+                    (the number of lines, the content to write, the progress to print)
+                ),
+                traceback
+            )
+        """
 
-        PyFunceble.INTERN.update(args[-1])
+        try:
+            self.load_in_child(loader, intern)
 
-        self.write_in_shadow_file_if_needed(*args[:-2])
+            for index, lines in iter(task_queue.get, None):
+                result = self.filter_shadow_file_chunk(
+                    lines,
+                    already_tested,
+                    ignore_inactive_db_check=ignore_inactive_db_check,
+                )
 
-    def construct_and_get_shadow_file(
-        self, file_stream, ignore_inactive_db_check=False
-    ):
-        """
-        Provides a path to a file which contain the list to file.
+                result_queue.put(((index, (len(lines),) + result), None))
+        except Exception:  # pylint: disable=broad-except
+            PyFunceble.LOGGER.exception()
+
+            result_queue.put((None, format_exc()))
 
-        The idea is to do a comparison between what we already tested
-        and what we still have to test.
+    def get_shadow_file_chunks(self, file_stream, ignore_inactive_db_check=False):
         """
+        Reads the given stream by chunk and yields - in order - what we have
+        to write into the shadow file.
 
-        def start_process(*args):
+        The chunks are filtered by a fixed pool of workers which get the
+        set of already tested subjects once at startup.
 
-            original_config = PyFunceble.CONFIGURATION.copy()
-            origin_intern = PyFunceble.INTERN.copy()
+        :return:
+            A tuple in the following format.
 
-            args += (PyFunceble.LOADER,)
-            args += (origin_intern,)
+            ::
 
-            process = OurProcessWrapper(target=self.work_process, args=args)
-            process.name = f"PyF shadow {line}"
-            process.start()
+                (the number of read lines, the content to write, the progress to print)
 
-            PyFunceble.LOADER.config.update(original_config)
-            PyFunceble.LOADER.inject_all()
-            PyFunceble.INTERN.update(origin_intern)
+        :rtype: tuple
+        """
 
-        if PyFunceble.CONFIGURATION.shadow_file:
-            with NamedTemporaryFile(delete=False) as temp_file:
-                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                    print("")
+        if PyFunceble.CONFIGURATION.maximal_processes <= 1:
+            yield from super().get_shadow_file_chunks(
+                file_stream, ignore_inactive_db_check=ignore_inactive_db_check
+            )
+            return
 
-                finished = False
+        lines = iter(file_stream)
 
-                while True:
-                    while (
-                        len(active_children())
-                        <= PyFunceble.CONFIGURATION.maximal_processes
-                    ):
-                        try:
-                            line = next(file_stream)
-
-                            start_process(
-                                line,
-                                temp_file.name,
-                                ignore_inactive_db_check,
-                                self.autocontinue,
-                                self.inactive_db,
-                            )
+        with WorkerPool(
+            self.work_shadow_file_process,
+            args=(
+                self.get_already_tested(
+                    ignore_inactive_db_check=ignore_inactive_db_check
+                ),
+            ),
+            kwargs={"ignore_inactive_db_check": ignore_inactive_db_check},
+            name="PyF shadow",
+        ) as pool:
+            yield from pool.imap(
+                iter(lambda: list(islice(lines, self.shadow_file_chunk_size)), [])
+            )
 
-                            active_children()
-                            continue
-                        except StopIteration:
-                            finished = True
-                            break
+    @classmethod
+    def __share_dns_cache(cls, dns_cache):
+        """
+        Shares the given DNS cache with the processes we are going to start.
+        """
 
-                    while len(
-                        active_children()
-                    ) >= PyFunceble.CONFIGURATION.maximal_processes and "shadow" in " ".join(
-                        [x.name for x in reversed(active_children())]
-                    ):
-                        active_children()
+        PyFunceble.LOADER.dns_cache = dns_cache
+        PyFunceble.DNSLOOKUP.cache = dns_cache
 
-                    if finished:
-                        break
+    def run_test(self):
+        """
+        Runs the test of the content of the given file.
+        """
 
-                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                    print("")
+        if not PyFunceble.CONFIGURATION.dns_lookup_cache:
+            self.__run_test()
+            return
 
-                return temp_file.name
-        return file_stream.name
+        local_dns_cache = PyFunceble.LOADER.dns_cache
 
-    def run_test(self):
+        with PyFunceble.lookup.DNSCacheManager() as dns_cache_manager:
+            # We share a single DNS cache across all our processes.
+            self.__share_dns_cache(
+                # The proxy factory is registered at runtime.
+                # pylint: disable=no-member
+                dns_cache_manager.DNSCache(
+                    PyFunceble.CONFIGURATION.dns_lookup_cache_size
+                )
+            )
+
+            try:
+                self.__run_test()
+            finally:
+                self.__share_dns_cache(local_dns_cache)
+
+    def __run_test(self):
         """
         Runs the test of the content of the given file.
         """
 
+        if (
+            PyFunceble.CONFIGURATION.reputation
+            or PyFunceble.CONFIGURATION.use_reputation_data
+        ):
+            # We index the reputation file before starting our processes so
+            # that they share the index instead of building their own.
+            PyFunceble.lookup.IPv4Reputation()
+
         with open(self.file, "r", encoding="utf-8") as file_stream, open(
             self.construct_and_get_shadow_file(file_stream), "r", encoding="utf-8"
         ) as shadow_file:
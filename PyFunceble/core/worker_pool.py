@@ -0,0 +1,286 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the pool of long-lived workers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import sys
+from multiprocessing import Queue
+from multiprocessing.connection import wait
+from queue import Empty
+
+import PyFunceble
+
+
+class WorkerPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Provides a fixed pool of long-lived workers.
+
+    Each worker is started with the following arguments and is expected to
+    process the tasks of the task queue until it gets :code:`None`.
+
+    ::
+
+        (task queue, result queue, loader, intern, *args)
+
+    Each processed task should be acknowledged into the result queue
+    with a tuple in the following format.
+
+    ::
+
+        (result, traceback)
+
+    :param target: The work method of our workers.
+    :param tuple args: The additional arguments to give to our workers.
+    :param dict kwargs: The keyword arguments to give to our workers.
+    :param str name: The prefix of the name of our workers.
+    :param int size:
+        The number of workers to start.
+
+        .. note::
+            Defaults to the maximal number of processes.
+    """
+
+    def __init__(self, target, args=(), kwargs=None, name="PyF worker", size=None):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.name = name
+        self.size = size if size else PyFunceble.CONFIGURATION.maximal_processes
+
+        self.task_queue = Queue()
+        self.result_queue = Queue()
+        self.workers = []
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.stop()
+        else:
+            self.terminate()
+
+    def start(self):
+        """
+        Starts our workers.
+        """
+
+        original_config = PyFunceble.CONFIGURATION.copy()
+        original_intern = PyFunceble.INTERN.copy()
+
+        for index in range(self.size):
+            worker = PyFunceble.core.multiprocess.OurProcessWrapper(
+                target=self.target,
+                args=(
+                    self.task_queue,
+                    self.result_queue,
+                    PyFunceble.LOADER,
+                    original_intern,
+                )
+                + tuple(self.args),
+                kwargs=self.kwargs,
+            )
+            worker.name = f"{self.name} {index}"
+            worker.start()
+
+            self.workers.append(worker)
+
+        PyFunceble.LOADER.config.update(original_config)
+        PyFunceble.LOADER.inject_all()
+
+        PyFunceble.INTERN.update(original_intern)
+
+    def put(self, task):
+        """
+        Gives the given task to the next available worker.
+        """
+
+        self.task_queue.put(task)
+
+    def get(self):
+        """
+        Waits for the next acknowledgement of our workers.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (result, traceback)
+
+            .. note::
+                The traceback is :code:`None` unless a worker failed or died.
+
+        .. note::
+            We sleep on the result queue and on the sentinels of our workers
+            instead of waking up periodically.
+
+        :rtype: tuple
+        """
+
+        while True:
+            try:
+                return self.result_queue.get(block=False)
+            except Empty:
+                pass
+
+            died = [x for x in self.workers if x.exitcode not in [None, 0]]
+
+            if died:
+                return (
+                    None,
+                    f"{died[0].name} died with exit code {died[0].exitcode}.",
+                )
+
+            running = [x for x in self.workers if x.exitcode is None]
+
+            if not running:
+                return (None, "Our workers exited before acknowledging our tasks.")
+
+            # The reader of the queue is readable once an acknowledgement
+            # is available.
+            # pylint: disable=protected-access
+            wait([self.result_queue._reader] + [x.sentinel for x in running])
+
+    def imap(self, tasks):
+        """
+        Gives the given tasks to our workers and yields - in the same
+        order - their results.
+
+        Each worker gets the tasks in the following format.
+
+        ::
+
+            (index of the task, task)
+
+        and should acknowledge them with a tuple in the following format.
+
+        ::
+
+            ((index of the task, result), traceback)
+
+        .. note::
+            We limit the number of queued tasks so that we never
+            load all tasks into memory.
+
+        :param tasks: The tasks to give to our workers.
+        :type tasks: iterable
+        """
+
+        tasks = iter(tasks)
+        maximal_pending = self.size * 2
+
+        finished = {}
+        submitted = next_index = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and submitted - next_index < maximal_pending:
+                try:
+                    self.put((submitted, next(tasks)))
+                    submitted += 1
+                except StopIteration:
+                    exhausted = True
+
+            if next_index == submitted:
+                break
+
+            result, traceback = self.get()
+
+            if traceback:
+                self.abort(traceback)
+
+                sys.exit(1)
+
+            index, value = result
+            finished[index] = value
+
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+
+    def abort(self, traceback):
+        """
+        Prints the given traceback and terminates our workers.
+        """
+
+        print(traceback)
+        PyFunceble.LOGGER.error(traceback)
+
+        self.terminate()
+
+    def stop(self):
+        """
+        Asks our workers to stop once the pending tasks are processed
+        and waits for them.
+        """
+
+        for _ in self.workers:
+            self.task_queue.put(None)
+
+        for worker in self.workers:
+            worker.join()
+
+        self.workers = []
+
+    def terminate(self):
+        """
+        Terminates our workers without waiting for the pending tasks.
+        """
+
+        for worker in self.workers:
+            worker.terminate()
+
+        for worker in self.workers:
+            worker.join()
+
+        self.workers = []
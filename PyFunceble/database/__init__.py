@@ -51,4 +51,5 @@ License:
 """
 
 from .inactive import InactiveDB as Inactive
+from .journal import Journal
 from .whois import WhoisDB as Whois
@@ -70,14 +70,21 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
     is_present_cache = {}
     database = {}
     filename = None
+    journal = None
 
     def __init__(self, filename, parent_process=False):
         self.one_day = timedelta(days=1)
         self.database_file = ""
+        self.journal = None
+
+        # The already tested subjects of our file (SQL databases only).
+        self.already_tested = None
 
         self.parent = parent_process
         self.authorized = self.authorization()
 
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(self.save)
+
         PyFunceble.LOGGER.debug(f"Authorization: {self.authorized}")
 
         if self.authorized:
@@ -86,12 +93,15 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 days=PyFunceble.CONFIGURATION.days_between_inactive_db_clean
             )
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 self.database_file = "{0}{1}".format(
                     PyFunceble.CONFIG_DIRECTORY,
                     PyFunceble.OUTPUTS.default_files.inactive_db,
                 )
 
+            if PyFunceble.CONFIGURATION.db_type == "journal":
+                self.journal = PyFunceble.database.Journal(self.database_file)
+
             self.filename = filename
 
             self.to_retest = self.get_to_retest()
@@ -100,9 +110,18 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
             self.initiate()
 
+            if self.parent and PyFunceble.CONFIGURATION.db_type in [
+                "mariadb",
+                "mysql",
+                "sqlite",
+            ]:
+                # We construct it once so that our children inherit it
+                # instead of requesting the database for each subject.
+                self.already_tested = self.get_already_tested()
+
     def __contains__(self, subject):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if subject not in self.is_present_cache:
                     self.is_present_cache[subject] = False
                     if self[subject]:
@@ -110,7 +129,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
                 return self.is_present_cache[subject]
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 with session.Session() as db_session:
                     try:
                         # pylint: disable=no-member
@@ -137,7 +156,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
     def __getitem__(self, subject):
         if (
             self.authorized
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
             and self.filename in self.database
             and subject in self.database[self.filename]
         ):
@@ -145,7 +164,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         return {}
 
     def __setitem__(self, subject, data):
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             actual_state = self[subject]
 
             if actual_state:
@@ -177,10 +196,18 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 else:
                     self.database[self.filename][subject] = data
 
+            if self.journal is not None:
+                self.journal.set(
+                    [self.filename, subject], self.database[self.filename][subject]
+                )
+
     def __delitem__(self, subject):
-        if PyFunceble.CONFIGURATION.db_type == "json" and self[subject]:
+        if PyFunceble.CONFIGURATION.db_type in ["json", "journal"] and self[subject]:
             del self.database[self.filename][subject]
 
+            if self.journal is not None:
+                self.journal.delete([self.filename, subject])
+
     @classmethod
     def authorization(cls):
         """
@@ -195,7 +222,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         has already been set into the database.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             database_content = PyFunceble.helpers.Dict().from_json_file(
                 self.database_file
             )
@@ -235,8 +262,10 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         Loads the content of the database file.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
-            if PyFunceble.helpers.File(self.database_file).exists():
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+            if self.journal is not None and self.journal.exists():
+                self.database = self.journal.load()
+            elif PyFunceble.helpers.File(self.database_file).exists():
                 self._merge()
             else:
                 self.database = {self.filename: {}}
@@ -244,6 +273,10 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             if self.filename not in self.database:  # pragma: no cover
                 self.database[self.filename] = {}
 
+            if self.journal is not None and self.parent and not self.journal.exists():
+                # We initiate the journal with the current state of the database.
+                self.journal.compact(self.database)
+
             PyFunceble.LOGGER.info(
                 "Database content loaded in memory. (DATASET WONT BE LOGGED)"
             )
@@ -256,12 +289,17 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            if self.journal is not None:
+                self.journal.write(self.database)
+            else:
+                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+        self.save_scheduler.reset()
+
     def clean(self):
         """
         Cleans everything which is not needed anymore.
@@ -303,7 +341,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 current_datetime = self.datetime()
 
                 if self[subject]:
@@ -326,11 +364,12 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                     f"{repr(status)} into {repr(self.filename)} database's."
                 )
 
-                self.save()
-
-            # We ignore the mariadb/mysql case because
-            # we are sure that the data will be added in the database
-            # by the system.
+                self.save_scheduler.schedule()
+            elif self.already_tested is not None:
+                # We do not add it into the mariadb/mysql database because
+                # we are sure that the data will be added in the database
+                # by the system. But we have to keep our set up to date.
+                self.already_tested.add(subject)
 
     def remove(self, subject):
         """
@@ -340,17 +379,19 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if self[subject]:
                     del self[subject]
 
                     PyFunceble.LOGGER.info(
                         "Cleaned the data related to " f"{repr(subject)}."
                     )
-                    self.save()
-            # We don't implement the mysql/mariadb because,
-            # instead of removing, the system will update the status
-            # automatically.
+                    self.save_scheduler.schedule()
+            elif self.already_tested is not None:
+                # We don't implement the mysql/mariadb because,
+                # instead of removing, the system will update the status
+                # automatically. But we have to keep our set up to date.
+                self.already_tested.discard(subject)
 
     def get_to_retest(self):
         """
@@ -366,7 +407,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             and PyFunceble.CONFIGURATION.days_between_db_retest >= 0
             and self.filename in self.database
         ):
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 result = set()
 
                 if (
@@ -391,7 +432,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
                 return result
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 with session.Session() as db_session:
                     try:
                         # pylint: disable=no-member
@@ -425,7 +466,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         )
 
         if self.authorized and PyFunceble.CONFIGURATION.days_between_db_retest >= 0:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 result = set()
 
                 if (
@@ -434,7 +475,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 ):  # pragma: no cover
                     self.load()
 
-                for subject, info in self.database[self.filename].items():
+                for subject, info in self.database.get(self.filename, {}).items():
                     if (
                         "last_retested_at_epoch" in info
                         and info["last_retested_at_epoch"]
@@ -450,6 +491,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             if PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
                 # pylint: disable=no-member
                 with session.Session() as db_session:
@@ -461,7 +503,9 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                         .filter(
                             Status.status.notin_(PyFunceble.core.CLI.get_up_statuses())
                         )
-                        .filter(datetime.utcnow() < Status.tested_at + self.days)
+                        # We compare the column itself so that the
+                        # comparison also works under SQLite.
+                        .filter(Status.tested_at > datetime.utcnow() - self.days)
                         .all()
                     )
 
@@ -469,6 +513,50 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                         return {x.tested for x in result}
         return set()
 
+    def is_already_tested(self, subject):
+        """
+        Checks if the given subject is into the list of already
+        tested subjects.
+
+        Contrary to :func:`get_already_tested` this method does
+        not construct the whole set of already tested subjects
+        at each call.
+
+        .. note::
+            Under the mariadb/mysql/sqlite databases, the set of already
+            tested subjects is constructed once per file and kept up
+            to date by :func:`add` and :func:`remove`.
+
+        :param str subject: The subject to check.
+        :rtype: bool
+        """
+
+        if self.authorized and PyFunceble.CONFIGURATION.days_between_db_retest >= 0:
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+                if (
+                    PyFunceble.CONFIGURATION.multiprocess
+                    and get_start_method() == "spawn"
+                ):  # pragma: no cover
+                    self.load()
+
+                # The database is indexed by subject, so we can
+                # directly look into it.
+                return (
+                    self.filename in self.database
+                    and subject in self.database[self.filename]
+                )
+
+            if PyFunceble.CONFIGURATION.db_type in [
+                "mariadb",
+                "mysql",
+                "sqlite",
+            ]:
+                if self.already_tested is None:
+                    self.already_tested = self.get_already_tested()
+
+                return subject in self.already_tested
+        return False
+
     def get_to_clean(self):
         """
         Returns a set of subject to clean from the database.
@@ -483,7 +571,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             and PyFunceble.CONFIGURATION.days_between_inactive_db_clean >= 0
             and self.filename in self.database
         ):
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 result = set()
 
                 for subject, info in self.database[self.filename].items():
@@ -0,0 +1,267 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the journal (append-only) storage of our databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from json import decoder, dumps, loads
+from os import fsync, replace
+from os.path import abspath, dirname, getsize, splitext
+
+import PyFunceble
+
+
+class Journal:
+    """
+    Provides the journal (append-only) storage of one of our databases.
+
+    Instead of rewriting the whole database at each save, we append the
+    changes - one JSON encoded change per line - to the journal file.
+    The database is reconstructed by replaying all changes.
+
+    Once the journal grows bigger than twice its last compacted size,
+    it is compacted into a single snapshot of the database.
+
+    :param str database_file:
+        The path to the (JSON) database file.
+
+        .. note::
+            The journal is stored next to it, with the :code:`.jsonl`
+            extension.
+    """
+
+    # Saves the minimal size (in bytes) of a journal before
+    # we compact it.
+    minimal_compaction_size = 1024 * 1024
+
+    def __init__(self, database_file):
+        self.path = f"{splitext(database_file)[0]}.jsonl"
+
+        # Saves the changes which are not written yet.
+        self.changes = []
+        # Saves the current size of the journal.
+        self.size = 0
+        # Saves the size of the journal after its last compaction.
+        self.compacted_size = 0
+
+    def exists(self):
+        """
+        Checks if the journal file exists.
+        """
+
+        return PyFunceble.helpers.File(self.path).exists()
+
+    def set(self, keys, value):
+        """
+        Registers that the given value was set at the given location.
+
+        :param list keys: The path (keys) to the location to set.
+        :param value: The value to set.
+        """
+
+        self.changes.append(["set", keys, value])
+
+    def delete(self, keys):
+        """
+        Registers that the given location was deleted.
+
+        :param list keys: The path (keys) to the location to delete.
+        """
+
+        self.changes.append(["delete", keys, None])
+
+    def append(self, keys, value):
+        """
+        Registers that the given value was appended to the list
+        at the given location.
+
+        :param list keys: The path (keys) to the list to append to.
+        :param value: The value to append.
+        """
+
+        self.changes.append(["append", keys, value])
+
+    @classmethod
+    def apply(cls, database, change):
+        """
+        Applies the given change to the given database.
+
+        :param dict database: The database to update.
+        :param list change: The change to apply.
+        """
+
+        action, keys, value = change
+
+        if not keys:
+            if action == "set":
+                database.clear()
+                database.update(value)
+            return
+
+        parent = database
+
+        for key in keys[:-1]:
+            parent = parent.setdefault(key, {})
+
+        if action == "set":
+            parent[keys[-1]] = value
+        elif action == "delete":
+            parent.pop(keys[-1], None)
+        elif action == "append":
+            parent.setdefault(keys[-1], []).append(value)
+
+    def load(self):
+        """
+        Reconstructs the database from the journal file.
+
+        .. note::
+            A last change which was not completely written is dropped
+            from the journal file.
+
+        :rtype: dict
+        """
+
+        database = {}
+
+        if self.exists():
+            torn_size = 0
+
+            with open(self.path, "rb") as file_stream:
+                for line in file_stream:
+                    if not line.endswith(b"\n"):
+                        # A change which were not completely written. This may
+                        # happen if we were stopped in the middle of a write.
+                        torn_size = len(line)
+                        break
+
+                    try:
+                        self.apply(database, loads(line))
+                    except (decoder.JSONDecodeError, ValueError):
+                        continue
+
+            if torn_size:
+                # We drop it so that our next changes are not appended to it.
+                with open(self.path, "r+b") as file_stream:
+                    file_stream.truncate(getsize(self.path) - torn_size)
+
+            self.size = self.compacted_size = getsize(self.path)
+
+        self.changes = []
+
+        PyFunceble.LOGGER.info(f"Replayed {self.path!r}. (DATASET WONT BE LOGGED)")
+
+        return database
+
+    def write(self, database=None):
+        """
+        Appends the pending changes to the journal file.
+
+        :param dict database:
+            The complete database.
+
+            .. note::
+                If given, the journal is compacted (into it)
+                when it's too big.
+        """
+
+        if self.changes:
+            with open(self.path, "a", encoding="utf-8") as file_stream:
+                file_stream.write(
+                    "".join(dumps(x, ensure_ascii=False) + "\n" for x in self.changes)
+                )
+
+                self.size = file_stream.tell()
+
+            PyFunceble.LOGGER.info(
+                f"Appended {len(self.changes)} change(s) into {self.path!r}."
+            )
+
+            self.changes = []
+
+        if database is not None and self.size > max(
+            self.minimal_compaction_size, 2 * self.compacted_size
+        ):
+            self.compact(database)
+
+    def compact(self, database):
+        """
+        Replaces the content of the journal file with a snapshot
+        of the given database.
+
+        :param dict database: The complete database.
+
+        .. note::
+            The snapshot is first written (and synced) into a temporary
+            file which then replaces the journal file. That way, the
+            journal file is never left half-written.
+        """
+
+        temp_path = f"{self.path}.tmp"
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file_stream:
+                file_stream.write(
+                    dumps(["set", [], database], ensure_ascii=False) + "\n"
+                )
+
+                file_stream.flush()
+                fsync(file_stream.fileno())
+
+                self.size = self.compacted_size = file_stream.tell()
+
+            replace(temp_path, self.path)
+        except BaseException:
+            PyFunceble.helpers.File(temp_path).delete()
+            raise
+
+        PyFunceble.helpers.Directory(dirname(abspath(self.path))).fsync()
+
+        self.changes = []
+
+        PyFunceble.LOGGER.info(f"Compacted {self.path!r}.")
@@ -57,6 +57,7 @@ from sqlalchemy.orm.exc import NoResultFound
 import PyFunceble
 from PyFunceble.engine.database.loader import session
 from PyFunceble.engine.database.schemas import WhoisRecord
+from PyFunceble.engine.database.writer import BulkWriter
 
 
 class WhoisDB:
@@ -68,18 +69,29 @@ class WhoisDB:
 
     database_file = None
 
+    journal = None
+
     def __init__(self, parent_process=False):
         # Get the authorization.
         self.database_file = ""
+        # We preset the journal of the database.
+        self.journal = None
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             # We set the location of the database file.
             self.database_file = "{0}{1}".format(
                 PyFunceble.CONFIG_DIRECTORY, PyFunceble.OUTPUTS.default_files.whois_db
             )
 
+        if PyFunceble.CONFIGURATION.db_type == "journal":
+            # We initiate the journal of the database.
+            self.journal = PyFunceble.database.Journal(self.database_file)
+
         self.parent = parent_process
 
+        # We initiate the scheduler of our saves.
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(self.save)
+
         PyFunceble.LOGGER.debug(f"DB (File): {self.database_file}")
 
         # We load the configuration.
@@ -87,7 +99,7 @@ class WhoisDB:
 
     def __contains__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if index in self.database:
                     PyFunceble.LOGGER.info(f"{index} is present into the database.")
                     return True
@@ -95,7 +107,11 @@ class WhoisDB:
                 PyFunceble.LOGGER.info(f"{index} is not present into the database.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                if BulkWriter.get_instance().get_whois_record(index):
+                    PyFunceble.LOGGER.info(f"{index} is present into the database.")
+                    return True
+
                 with session.Session() as db_session:
                     try:
                         # pylint: disable=no-member
@@ -116,13 +132,22 @@ class WhoisDB:
 
     def __getitem__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if index in self.database:
                     return self.database[index]
                 return None
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-                fetched = None
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                fetched = BulkWriter.get_instance().get_whois_record(index)
+
+                if fetched:
+                    # The record is not written yet.
+                    return {
+                        "epoch": fetched["epoch"],
+                        "expiration_date": fetched["expiration_date"],
+                        "state": fetched["state"],
+                        "record": fetched.get("record"),
+                    }
 
                 with session.Session() as db_session:
                     try:
@@ -163,42 +188,26 @@ class WhoisDB:
         else:
             self.database[index] = value
 
+        if self.journal is not None:
+            # We register the change into the journal.
+            self.journal.set([index], self.database[index])
+
         PyFunceble.LOGGER.info(
             f"Inserted {repr(value)} into the subset of {repr(index)}"
         )
 
     @classmethod
     def __setitem_mysql(cls, index, value):
-        with session.Session() as db_session:
-            try:
-                # pylint: disable=no-member
-                record = (
-                    db_session.query(WhoisRecord)
-                    .filter(WhoisRecord.subject == index)
-                    .one()
-                )
-            except NoResultFound:
-                record = WhoisRecord(
-                    subject=index,
-                )
-
-        for db_key, db_value in value.items():
-            if not PyFunceble.CONFIGURATION.store_whois_record and db_key == "record":
-                continue
-            setattr(record, db_key, db_value)
-
-        with session.Session() as db_session:
-            # pylint: disable=no-member
-            db_session.add(record)
-            db_session.commit()
-
-            PyFunceble.LOGGER.info(f"Inserted into the database: \n {value}")
+        # The record is written along with the other pending rows.
+        BulkWriter.get_instance().add_whois_record(index, value)
+
+        PyFunceble.LOGGER.info(f"Inserted into the database: \n {value}")
 
     def __setitem__(self, index, value):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 self.__setitem_json(index, value)
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 self.__setitem_mysql(index, value)
 
     @property
@@ -227,7 +236,7 @@ class WhoisDB:
         # We initiate a local place to save our results.
         result = {}
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             for index, data in old.items():
                 # We loop through all indexes and data of the database.
 
@@ -256,9 +265,21 @@ class WhoisDB:
         """
 
         if (
+            self.authorized
+            and self.journal is not None
+            and self.journal.exists()
+            and PyFunceble.CONFIGURATION.db_type == "journal"
+        ):
+            # * We are authorized to operate.
+            # and
+            # * The journal exists.
+
+            # We merge the content of the journal into already initiated one.
+            self.database.update(self.journal.load())
+        elif (
             self.authorized
             and PyFunceble.helpers.File(self.database_file).exists()
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
             # * We are authorized to operate.
             # and
@@ -277,6 +298,15 @@ class WhoisDB:
             # the loaded data.
             self.save()
 
+        if (
+            self.authorized
+            and self.parent
+            and self.journal is not None
+            and not self.journal.exists()
+        ):
+            # We initiate the journal with the current state of the database.
+            self.journal.compact(self.database)
+
     def save(self):
         """
         Saves the database into the database file.
@@ -285,15 +315,21 @@ class WhoisDB:
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
             # We are authorized to operate.
 
-            # We save the current state of the datbase.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            if self.journal is not None:
+                # We append the changes to the journal.
+                self.journal.write(self.database)
+            else:
+                # We save the current state of the datbase.
+                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+        self.save_scheduler.reset()
+
     def is_time_older(self, subject):
         """
         Checks if the expiration time of the given subject is
@@ -384,5 +420,5 @@ class WhoisDB:
             # We save everything into the database.
             self[subject] = data
 
-            # We save everything.
-            self.save()
+            # We schedule the save of everything.
+            self.save_scheduler.schedule()
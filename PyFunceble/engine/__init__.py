@@ -52,8 +52,10 @@ License:
 
 from .auto_continue import AutoContinue
 from .auto_save import AutoSave
+from .external_sort import ExternalSort
 from .hashes_tracker import HashesTracker
 from .logger import Logger
 from .mining import Mining
+from .save_scheduler import SaveScheduler
 from .sort import Sort
 from .user_agent import UserAgent
@@ -71,10 +71,20 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
     database_file = None
     # Save the filename we are working with.
     filename = None
+    # Save the set of already tested subjects of the currently tested file.
+    tested_index = None
+    # Save the journal of the database (if needed).
+    journal = None
 
     def __init__(self, filename, parent_process=False):
         # We get the operation authorization.
         self.database_file = ""
+        # We preset the journal of the database.
+        self.journal = None
+        # We preset the index of the already tested subjects.
+        self.tested_index = None
+        # We initiate the scheduler of our saves.
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(self.save)
         # We share the filename.
         self.filename = filename
         # We preset the filename namespace.
@@ -92,7 +102,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
             PyFunceble.LOGGER.info("Process authorized.")
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 # We set the location of the database file.
                 self.database_file = (
                     PyFunceble.OUTPUT_DIRECTORY
@@ -100,6 +110,10 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     + PyFunceble.OUTPUTS.logs.filenames.auto_continue
                 )
 
+            if PyFunceble.CONFIGURATION.db_type == "journal":
+                # We initiate the journal of the database.
+                self.journal = PyFunceble.database.Journal(self.database_file)
+
             PyFunceble.LOGGER.debug(f"DB (File): {self.database_file}")
 
             # We load the backup (if existant).
@@ -116,6 +130,19 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
                 # We clean the output directory.
                 PyFunceble.output.Clean(file_path=self.filename)
+
+            if self.parent and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+                # We restore the counters of the previous session (if any).
+                self.update_counters()
+
+            if self.parent and PyFunceble.CONFIGURATION.db_type in [
+                "mariadb",
+                "mysql",
+                "sqlite",
+            ]:
+                # We construct it once so that our children inherit it
+                # instead of requesting the database for each subject.
+                self.tested_index = self.get_already_tested()
         elif self.parent:
             # We are not authorized to operate.
 
@@ -129,41 +156,22 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
     def __contains__(self, index):  # pragma: no cover
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
-                if self.filename in self.database:
-                    for status, status_data in self.database[self.filename].items():
-                        if status == "complements":
-                            continue
-
-                        if index in status_data:
-                            PyFunceble.LOGGER.info(
-                                f"{index} is present into the database."
-                            )
-                            return True
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+                if index in self.__get_tested_index():
+                    PyFunceble.LOGGER.info(f"{index} is present into the database.")
+                    return True
 
                 PyFunceble.LOGGER.info(f"{index} is not present into the database.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-                with session.Session() as db_session:
-                    try:
-                        # pylint: disable=no-member, singleton-comparison
-                        _ = (
-                            db_session.query(Status)
-                            .join(File)
-                            .filter(Status.tested == index)
-                            .filter(File.path == self.filename)
-                            .one()
-                        )
-                    except NoResultFound:
-                        PyFunceble.LOGGER.info(
-                            f"{index} is not present into the database."
-                        )
-                        return False
-
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                if self.is_already_tested(index):
                     PyFunceble.LOGGER.info(f"{index} is present into the database.")
                     return True
 
+                PyFunceble.LOGGER.info(f"{index} is not present into the database.")
+                return False
+
         PyFunceble.LOGGER.info(
             f"Could not check if {index} is present into the database. "
             "Unauthorized action."
@@ -181,6 +189,29 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             and not PyFunceble.CONFIGURATION.no_files
         )
 
+    def __get_tested_index(self):
+        """
+        Provides the index (set) of the already tested subjects
+        of the currently tested file.
+
+        .. note::
+            The index is constructed from the database the first time
+            we need it. Afterwards, it is updated along with the database.
+        """
+
+        if self.tested_index is None:
+            if self.filename in self.database:
+                self.tested_index = {
+                    y
+                    for state, x in self.database[self.filename].items()
+                    for y in x
+                    if state not in ["complements", "counters"]
+                }
+            else:
+                self.tested_index = set()
+
+        return self.tested_index
+
     def is_empty(self):
         """
         Checks if the database related to the currently tested
@@ -188,7 +219,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if (
                     self.filename not in self.database
                     or not self.database[self.filename]
@@ -199,7 +230,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 PyFunceble.LOGGER.info("File to test was previously indexed.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 # Here we don't really check if it is empty.
                 # What we do, is that we check that everything was
                 # tested.
@@ -234,7 +265,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if self.filename in self.database:
                     # We already have something related
                     # to the file we are testing.
@@ -254,13 +285,26 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     # We initiate the file index.
                     self.database[self.filename] = {status: [subject]}
 
+                if self.journal is not None:
+                    # We register the change into the journal.
+                    self.journal.append([self.filename, status], subject)
+
+                if self.tested_index is not None:
+                    # We keep the index of the already tested up to date.
+                    self.tested_index.add(subject)
+
                 PyFunceble.LOGGER.info(
                     f"Indexed {repr(subject)} with the status "
                     f"{repr(status)} into {repr(self.filename)} database's."
                 )
 
-                # We save everything.
-                self.save()
+                # We schedule the save of everything.
+                self.save_scheduler.schedule()
+            elif self.tested_index is not None:
+                # We do not add it into the mariadb/mysql/sqlite database
+                # because the system saves the status of every tested subject.
+                # But we have to keep our index up to date.
+                self.tested_index.add(subject)
 
     def save(self):
         """
@@ -270,24 +314,49 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
             # We are authoried to operate.
 
-            # We save the current database state.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            if self.database.get(self.filename):
+                # We save our counters along with the database so that
+                # we don't have to recount everything when we continue.
+                self.database[self.filename]["counters"] = PyFunceble.INTERN["counter"][
+                    "number"
+                ].to_dict()
+
+                if self.journal is not None:
+                    # We register the change into the journal.
+                    self.journal.set(
+                        [self.filename, "counters"],
+                        self.database[self.filename]["counters"],
+                    )
+
+            if self.journal is not None:
+                # We append the changes to the journal.
+                self.journal.write(self.database)
+            else:
+                # We save the current database state.
+                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+        self.save_scheduler.reset()
+
     def load(self):
         """
         Loads previously saved database.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             # We are authorized to operate.
 
-            if PyFunceble.helpers.File(self.database_file).exists():
+            if self.journal is not None and self.journal.exists():
+                # The journal exists.
+
+                # We reconstruct the database from it.
+                self.database = self.journal.load()
+            elif PyFunceble.helpers.File(self.database_file).exists():
                 # The database file exists.
 
                 # We get its content and save it inside backup_content.
@@ -300,6 +369,14 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 # We initiate an empty database.
                 self.database = {self.filename: {}}
 
+            if self.journal is not None and self.parent and not self.journal.exists():
+                # We initiate the journal with the current state of the database.
+                self.journal.compact(self.database)
+
+            # We reset the index of the already tested, it will be
+            # reconstructed when needed.
+            self.tested_index = None
+
             PyFunceble.LOGGER.info(f"Loaded {repr(self.database_file)} in memory.")
 
     def clean(self):
@@ -310,12 +387,23 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 # We empty the database.
                 self.database[self.filename] = {}
+                # And its index.
+                self.tested_index = set()
 
-                # And we save the current database state.
-                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+                if self.journal is not None:
+                    # We register the change into the journal and write it.
+                    self.journal.set([self.filename], {})
+                    self.journal.write(self.database)
+                else:
+                    # And we save the current database state.
+                    PyFunceble.helpers.Dict(self.database).to_json_file(
+                        self.database_file
+                    )
+
+                self.save_scheduler.reset()
 
                 PyFunceble.LOGGER.info(
                     "Cleaned the data related to "
@@ -324,6 +412,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             elif PyFunceble.CONFIGURATION.db_type in [
                 "mysql",
                 "mariadb",
+                "sqlite",
             ]:  # pragma: no cover
                 with session.Session() as db_session:
                     # pylint: disable=no-member, singleton-comparison
@@ -365,6 +454,10 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                         db_session.add(status_object)
                         db_session.commit()
 
+                # We reset the index of the already tested, it will be
+                # reconstructed when needed.
+                self.tested_index = None
+
     def update_counters(self):  # pragma: no cover
         """
         Updates the counters.
@@ -373,6 +466,25 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized and self.parent:
             # We are authorized to operate.
 
+            if (
+                PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
+                and self.filename in self.database
+                and "counters" in self.database[self.filename]
+            ):
+                # Our counters were saved along with the database.
+
+                # We restore them instead of counting everything again.
+                PyFunceble.INTERN["counter"]["number"].reset()
+                PyFunceble.INTERN["counter"]["number"].update(
+                    self.database[self.filename]["counters"]
+                )
+
+                PyFunceble.LOGGER.debug(
+                    "Counters restored: "
+                    f"{PyFunceble.INTERN['counter']['number'].to_dict()}."
+                )
+                return
+
             # We create a list of all status we are working with.
             statuses = PyFunceble.STATUS.official.keys()
 
@@ -382,7 +494,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             for status in statuses:
                 # We loop through the list of status.
 
-                if PyFunceble.CONFIGURATION.db_type == "json":
+                if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                     try:
                         # We get the number of tested of the currently read
                         # status.
@@ -406,19 +518,18 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     except KeyError:
                         PyFunceble.INTERN["counter"]["number"][status] = 0
                         continue
-                elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                     with session.Session() as db_session:
                         # pylint: disable=no-member, singleton-comparison
-                        result = (
+                        fetched = (
                             db_session.query(Status)
                             .join(File)
                             .filter(File.path == self.filename)
                             .filter(Status.status == PyFunceble.STATUS.official[status])
                             .filter(Status.test_completed == True)
-                            .all()
+                            .count()
                         )
 
-                        fetched = len(result)
                         PyFunceble.INTERN["counter"]["number"][status] = fetched
 
                         PyFunceble.LOGGER.debug(
@@ -444,7 +555,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         # raise Exception("AUTHORIZED", self.authorized)
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if (
                     PyFunceble.CONFIGURATION.multiprocess
                     and get_start_method() == "spawn"
@@ -456,11 +567,11 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                         y
                         for state, x in self.database[self.filename].items()
                         for y in x
-                        if state not in ["complements"]
+                        if state not in ["complements", "counters"]
                     }
                 except KeyError:  # pragma: no cover
                     pass
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 with session.Session() as db_session:
                     # pylint: disable=no-member, singleton-comparison
                     result = (
@@ -476,6 +587,45 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
         return set()  # pragma: no cover
 
+    def is_already_tested(self, subject):
+        """
+        Checks if the given subject was already tested.
+
+        Contrary to :func:`get_already_tested` this method does
+        not construct the whole set of already tested subjects
+        at each call.
+
+        .. note::
+            Under the mariadb/mysql/sqlite databases, the set of already
+            tested subjects is constructed once per file and kept up
+            to date by :func:`add` and :func:`clean`.
+
+        :param str subject: The subject to check.
+        :rtype: bool
+        """
+
+        if self.authorized:
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+                if (
+                    PyFunceble.CONFIGURATION.multiprocess
+                    and get_start_method() == "spawn"
+                ):  # pragma: no cover
+                    self.load()
+
+                return subject in self.__get_tested_index()
+
+            if PyFunceble.CONFIGURATION.db_type in [
+                "mariadb",
+                "mysql",
+                "sqlite",
+            ]:
+                if self.tested_index is None:
+                    self.tested_index = self.get_already_tested()
+
+                return subject in self.tested_index
+
+        return False  # pragma: no cover
+
     def __generate_complements(self):  # pragma: no cover
         """
         Generates the complements from the given list of tested.
@@ -508,6 +658,13 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We save the constructed list of complements
             self.database[self.filename]["complements"] = list(result)
 
+            if self.journal is not None:
+                # We register the change into the journal.
+                self.journal.set(
+                    [self.filename, "complements"],
+                    self.database[self.filename]["complements"],
+                )
+
             self.save()
         else:
             # We get the complements we still have to test.
@@ -581,9 +738,9 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized and PyFunceble.CONFIGURATION.generate_complements:
             # We aer authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 return self.__get_or_generate_complements_json()
-            if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]:
                 return self.__get_or_generate_complements_mysql()
 
         return list()
@@ -226,6 +226,8 @@ class CIBase:
 
         if self.authorized:
             PyFunceble.output.Percentage().log()
+            # We write what is still buffered so that it is part of the commit.
+            PyFunceble.output.Writer.flush()
             self.permissions()
 
             commands = [
@@ -280,6 +282,8 @@ class CIBase:
 
         if self.authorized:
             PyFunceble.output.Percentage().log()
+            # We write what is still buffered so that it is part of the commit.
+            PyFunceble.output.Writer.flush()
             self.permissions()
 
             command = 'git add --all && git commit -a -m "{0}"'.format(
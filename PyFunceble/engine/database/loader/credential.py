@@ -232,6 +232,14 @@ class Credential:
         Provides the sqlalchemy URI.
         """
 
+        if PyFunceble.CONFIGURATION.db_type == "sqlite":
+            # The SQLite database does not need any credential.
+            return (
+                "sqlite:///"
+                f"{PyFunceble.CONFIG_DIRECTORY}"
+                f"{PyFunceble.abstracts.Infrastructure.SQLITE_DB_FILENAME}"
+            )
+
         if not self.credentials:
             self.load()
 
@@ -50,9 +50,13 @@ License:
     limitations under the License.
 """
 
-from sqlalchemy import create_engine
+from os import getpid
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
+
+import PyFunceble
 
 from .credential import Credential
 
@@ -60,12 +64,21 @@ from .credential import Credential
 class Session:
     """
     Provides our database session interface,
+
+    .. note::
+        The engines - and their pool of connections - are shared by all
+        sessions of the current process.
     """
 
     migration_effective = False
     current_session = None
     uri = None
 
+    # Saves the session factories (one per URI) of the current process.
+    factories = {}
+    # Saves the PID of the process which owns the factories.
+    factories_owner = None
+
     def __init__(self):
         self.uri = Credential().get_uri()
 
@@ -75,13 +88,71 @@ class Session:
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
+    @classmethod
+    def __set_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        """
+        Configures a freshly opened SQLite connection.
+
+        The WAL journal mode let our readers work while a writer is writing.
+        """
+
+        # pylint: disable=unused-argument
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @classmethod
+    def __make_engine(cls, uri):
+        """
+        Provides a new engine for the given URI.
+        """
+
+        if PyFunceble.CONFIGURATION.db_type == "sqlite":
+            # The timeout let us wait for the other processes to finish writing.
+            engine = create_engine(
+                uri,
+                poolclass=QueuePool,
+                connect_args={"timeout": 30, "check_same_thread": False},
+            )
+            event.listen(engine, "connect", cls.__set_sqlite_pragmas)
+        else:
+            engine = create_engine(
+                uri, poolclass=QueuePool, pool_pre_ping=True, pool_recycle=3600
+            )
+
+        return engine
+
+    @classmethod
+    def get_factory(cls, uri):
+        """
+        Provides the session factory of the given URI.
+
+        The factory is created once per process, so that we reuse the
+        connections of its engine instead of opening a new one for
+        each session.
+        """
+
+        if cls.factories_owner != getpid():
+            # The connections of our parent process can't be shared with us.
+            cls.factories = {}
+            cls.factories_owner = getpid()
+
+        if uri not in cls.factories:
+            cls.factories[uri] = sessionmaker(
+                autocommit=False, autoflush=False, bind=cls.__make_engine(uri)
+            )
+
+        return cls.factories[uri]
+
     def __make_session(self):
         """
         Provides a new session to work with.
         """
 
-        engine = create_engine(self.uri, poolclass=NullPool)
-        return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        return self.get_factory(self.uri)
 
     def query(self, *args, **kwargs):
         """
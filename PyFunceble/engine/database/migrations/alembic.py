@@ -52,10 +52,14 @@ License:
 
 from alembic import command
 from alembic.config import Config
+from alembic.migration import MigrationContext
 from pkg_resources import resource_filename
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 
 import PyFunceble
 
+from ..loader.base import DatabaseBase
 from .old2new import CleanupOldTables
 
 
@@ -85,7 +89,7 @@ class Alembic:
         Provides the authorization to run.
         """
 
-        return PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]
+        return PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]
 
     def configure(self):
         """
@@ -109,10 +113,39 @@ class Alembic:
         """
 
         if self.authorized:
-            command.upgrade(self.alembic_config, revision)
+            if PyFunceble.CONFIGURATION.db_type == "sqlite":
+                self.__upgrade_sqlite(revision)
+            else:
+                command.upgrade(self.alembic_config, revision)
 
             CleanupOldTables(self.credentials).start()
 
+    def __upgrade_sqlite(self, revision="head"):
+        """
+        Upgrades the structure of a SQLite database.
+
+        Our first revisions are MySQL/MariaDB specific. Therefore, a new
+        SQLite database is created from our schemas and stamped with the
+        given revision. The following revisions are then applied as usual.
+        """
+
+        engine = create_engine(self.credentials.get_uri(), poolclass=NullPool)
+
+        with engine.connect() as connection:
+            current_revision = MigrationContext.configure(
+                connection
+            ).get_current_revision()
+
+        if current_revision is None:
+            DatabaseBase.metadata.create_all(engine)
+            engine.dispose()
+
+            command.stamp(self.alembic_config, revision)
+        else:
+            engine.dispose()
+
+            command.upgrade(self.alembic_config, revision)
+
     def downgrade(self, revision="head"):
         """
         Downgrades the database structure.
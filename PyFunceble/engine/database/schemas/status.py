@@ -85,7 +85,7 @@ class Status(DatabaseBase):
     url_syntax_validation = Column(Boolean(), default=False, nullable=True)
     is_complement = Column(Boolean(), default=False, nullable=True)
     test_completed = Column(Boolean(), default=False, nullable=False)
-    tested_at = Column(DateTime(), default=datetime.utcnow, nullable=False)
+    tested_at = Column(DateTime(), default=datetime.utcnow, nullable=False, index=True)
 
     file = relationship("File", uselist=False, back_populates="subjects")
     mined = relationship("Mined", uselist=True, back_populates="subject")
@@ -0,0 +1,430 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our bulk writer of the SQL databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from datetime import datetime
+from os import getpid
+
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+import PyFunceble
+
+from .loader import session
+from .schemas import File, Mined, Status, WhoisRecord
+
+
+class BulkWriter:
+    """
+    Provides a way to write our rows into the SQL databases in batches.
+
+    Instead of opening a session - and committing - for each tested
+    subject, the status, WHOIS and mined rows are kept in memory and written
+    with multi-row :code:`INSERT ... ON DUPLICATE KEY UPDATE` statements
+    (:code:`INSERT ... ON CONFLICT DO UPDATE` under SQLite) once the
+    configured batch size is reached.
+
+    .. note::
+        Each process has its own writer. Please use :code:`get_instance`
+        instead of the constructor.
+
+    :param int batch_size:
+        The maximal number of pending rows.
+    """
+
+    # Saves the default maximal number of pending rows.
+    default_batch_size = 100
+
+    # Saves the maximal number of variables of a SQLite statement.
+    sqlite_maximal_variables = 999
+
+    # Saves the writer of each process.
+    instances = {}
+
+    def __init__(self, batch_size=None):
+        if batch_size is None:
+            batch_size = PyFunceble.CONFIGURATION.db_batch_size
+
+        self.batch_size = (
+            batch_size if batch_size is not None else self.default_batch_size
+        )
+        self.pid = getpid()
+
+        self.statuses = {}
+        self.whois_records = {}
+        self.mined = {}
+
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(
+            self.flush, threshold=self.batch_size
+        )
+
+    def __len__(self):
+        return len(self.statuses) + len(self.whois_records) + len(self.mined)
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Provides the writer of the current process.
+
+        :rtype: :class:`~PyFunceble.engine.database.writer.BulkWriter`
+        """
+
+        pid = getpid()
+
+        if pid not in cls.instances:
+            cls.instances[pid] = cls()
+
+        return cls.instances[pid]
+
+    @classmethod
+    def get_upsert(cls, table, rows, index_elements, to_update):
+        """
+        Provides the statement which inserts or updates the given rows.
+
+        :param table: The table to write into.
+        :param list rows: The rows to write.
+        :param list index_elements:
+            The columns of the unique key to check the conflicts against.
+        :param list to_update:
+            The columns to update when a row already exists.
+        """
+
+        if PyFunceble.CONFIGURATION.db_type == "sqlite":
+            statement = sqlite_insert(table).values(rows)
+
+            return statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={x: statement.excluded[x] for x in to_update},
+            )
+
+        statement = mysql_insert(table).values(rows)
+
+        return statement.on_duplicate_key_update(
+            {x: statement.inserted[x] for x in to_update}
+        )
+
+    def get_chunks(self, rows):
+        """
+        Splits the given rows into chunks we can write at once.
+
+        :param list rows: The rows to split.
+        """
+
+        size = self.batch_size
+
+        if PyFunceble.CONFIGURATION.db_type == "sqlite" and rows:
+            size = min(size, self.sqlite_maximal_variables // len(rows[0]))
+
+        size = max(1, size)
+
+        for index in range(0, len(rows), size):
+            yield rows[index : index + size]
+
+    @classmethod
+    def group_by_columns(cls, rows):
+        """
+        Groups the given rows by their columns, as all rows of
+        a multi-row statement should provide the same columns.
+
+        :param list rows: The rows to group.
+        :rtype: dict
+        """
+
+        result = {}
+
+        for row in rows:
+            result.setdefault(tuple(sorted(row)), []).append(row)
+
+        return result
+
+    def add_status(self, filename, data):
+        """
+        Registers the status of a tested subject.
+
+        :param str filename: The path of the tested file.
+        :param dict data: The columns of the status row.
+        """
+
+        self.statuses[(filename, data["tested"])] = data
+        self.save_scheduler.schedule()
+
+    def add_whois_record(self, subject, data):
+        """
+        Registers the WHOIS record of a subject.
+
+        :param str subject: The subject.
+        :param dict data: The columns of the WHOIS record row.
+        """
+
+        data = data.copy()
+        data["subject"] = subject
+
+        if not PyFunceble.CONFIGURATION.store_whois_record:
+            data.pop("record", None)
+
+        self.whois_records[subject] = data
+        self.save_scheduler.schedule()
+
+    def add_mined(self, tested, mined):
+        """
+        Registers the subject(s) mined from a tested subject.
+
+        :param str tested: The tested subject.
+        :param mined: The mined subject(s).
+        :type mined: str, list
+        """
+
+        if not isinstance(mined, list):
+            mined = [mined]
+
+        for subject in mined:
+            self.mined[(tested, subject)] = {"tested": tested, "mined": subject}
+            self.save_scheduler.schedule()
+
+    def get_whois_record(self, subject):
+        """
+        Provides the pending WHOIS record of the given subject (if any).
+
+        :rtype: dict, None
+        """
+
+        return self.whois_records.get(subject)
+
+    def __get_file_ids(self, db_session, paths):
+        """
+        Provides the ID of the given files. The missing ones are created.
+
+        :rtype: dict
+        """
+
+        # pylint: disable=no-member
+        result = dict(
+            db_session.query(File.path, File.id).filter(File.path.in_(paths)).all()
+        )
+        missing = [x for x in paths if x not in result]
+
+        if missing:
+            now = datetime.utcnow()
+
+            for chunk in self.get_chunks(
+                [
+                    {
+                        "path": x,
+                        "created": now,
+                        "modified": now,
+                        "test_completed": False,
+                    }
+                    for x in missing
+                ]
+            ):
+                db_session.execute(
+                    self.get_upsert(File.__table__, chunk, ["path"], ["modified"])
+                )
+
+            result.update(
+                db_session.query(File.path, File.id)
+                .filter(File.path.in_(missing))
+                .all()
+            )
+
+        return result
+
+    def __flush_statuses(self, db_session):
+        """
+        Writes the pending status rows.
+        """
+
+        if not self.statuses:
+            return
+
+        file_ids = self.__get_file_ids(db_session, list({x for x, _ in self.statuses}))
+
+        # pylint: disable=no-member
+        known = {
+            (x.file_id, x.tested): x.id
+            for x in db_session.query(Status.id, Status.file_id, Status.tested)
+            .filter(Status.file_id.in_(list(file_ids.values())))
+            .filter(Status.tested.in_(list({x for _, x in self.statuses})))
+            .all()
+        }
+
+        now = datetime.utcnow()
+        rows = []
+
+        for (filename, tested), data in self.statuses.items():
+            row = data.copy()
+            row["file_id"] = file_ids[filename]
+            # The rows we already know are updated through their primary key.
+            row["id"] = known.get((row["file_id"], tested))
+            row["created"] = now
+            row["modified"] = now
+
+            rows.append(row)
+
+        for columns, group in self.group_by_columns(rows).items():
+            to_update = [x for x in columns if x not in ["id", "created"]]
+
+            for chunk in self.get_chunks(group):
+                db_session.execute(
+                    self.get_upsert(Status.__table__, chunk, ["id"], to_update)
+                )
+
+    def __flush_whois_records(self, db_session):
+        """
+        Writes the pending WHOIS record rows.
+        """
+
+        if not self.whois_records:
+            return
+
+        now = datetime.utcnow()
+        rows = []
+
+        for data in self.whois_records.values():
+            row = data.copy()
+            row["created"] = now
+            row["modified"] = now
+
+            rows.append(row)
+
+        for columns, group in self.group_by_columns(rows).items():
+            to_update = [x for x in columns if x not in ["subject", "created"]]
+
+            for chunk in self.get_chunks(group):
+                db_session.execute(
+                    self.get_upsert(
+                        WhoisRecord.__table__, chunk, ["subject"], to_update
+                    )
+                )
+
+    def __flush_mined(self, db_session):
+        """
+        Writes the pending mined rows.
+        """
+
+        if not self.mined:
+            return
+
+        subjects = {}
+
+        # pylint: disable=no-member
+        for status in (
+            db_session.query(Status.id, Status.file_id, Status.tested)
+            .filter(Status.tested.in_(list({x for x, _ in self.mined})))
+            .all()
+        ):
+            subjects.setdefault(status.tested, status)
+
+        known = {
+            (x.subject_id, x.mined)
+            for x in db_session.query(Mined.subject_id, Mined.mined)
+            .filter(Mined.subject_id.in_([x.id for x in subjects.values()]))
+            .all()
+        }
+
+        now = datetime.utcnow()
+        rows = []
+
+        for (tested, mined), data in self.mined.items():
+            if tested not in subjects:
+                PyFunceble.LOGGER.info(
+                    f"Skipped {mined!r}: {tested!r} is not into the database."
+                )
+                continue
+
+            if (subjects[tested].id, mined) in known:
+                continue
+
+            rows.append(
+                {
+                    "subject_id": subjects[tested].id,
+                    "file_id": subjects[tested].file_id,
+                    "mined": data["mined"],
+                    "created": now,
+                    "modified": now,
+                }
+            )
+
+        for chunk in self.get_chunks(rows):
+            db_session.execute(Mined.__table__.insert().values(chunk))
+
+    def flush(self):
+        """
+        Writes all pending rows.
+        """
+
+        if self.pid != getpid():
+            # The rows are the one of our parent process. It writes them.
+            self.statuses.clear()
+            self.whois_records.clear()
+            self.mined.clear()
+
+            return
+
+        if len(self) == 0:
+            return
+
+        PyFunceble.LOGGER.info(f"Writing {len(self)} rows into the database.")
+
+        with session.Session() as db_session:
+            # The mined rows are linked to the status rows.
+            # Therefore, the status rows have to be written first.
+            self.__flush_statuses(db_session)
+            self.__flush_whois_records(db_session)
+            self.__flush_mined(db_session)
+
+            db_session.commit()
+
+        self.statuses.clear()
+        self.whois_records.clear()
+        self.mined.clear()
+
+        self.save_scheduler.reset()
@@ -0,0 +1,232 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our external (file) sorting engine.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+from heapq import merge
+from itertools import islice
+from shutil import copymode
+from tempfile import NamedTemporaryFile
+
+
+class ExternalSort:
+    """
+    Sorts - and deduplicates - the lines of a file without loading the
+    whole file into memory.
+
+    The file is read by chunks which are sorted and written into temporary
+    files (runs). The runs are finally merged into the sorted file.
+
+    :param str file_path: The file to sort.
+
+    :param key_method:
+        A function or method to use to format the read lines before sorting.
+    :type key_method: function|method
+
+    :param int header_limit:
+        The number of lines - at the top of the file - to keep as they are.
+
+    :param int chunk_size:
+        The maximal number of lines to sort in memory.
+    """
+
+    chunk_size = 100000
+    """
+    The default maximal number of lines to sort in memory.
+    """
+
+    def __init__(self, file_path, key_method, header_limit=0, chunk_size=None):
+        self.file_path = file_path
+        self.key_method = key_method
+        self.header_limit = header_limit
+
+        if chunk_size:
+            self.chunk_size = chunk_size
+
+    def get_sorted_chunk(self, lines):
+        """
+        Provides the given lines - deduplicated and sorted.
+
+        .. note::
+            The key of each line is only computed once.
+
+        :param list lines: The lines to sort.
+        :rtype: list
+        """
+
+        decorated = [(self.key_method(x), x) for x in set(lines)]
+        decorated.sort()
+
+        return [x for _, x in decorated]
+
+    def __write_run(self, lines):
+        """
+        Writes the given (sorted) lines into a temporary file.
+
+        :return: The path to the temporary file.
+        :rtype: str
+        """
+
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", suffix=".run", delete=False
+        ) as run_file:
+            run_file.writelines(f"{x}\n" for x in lines)
+
+        return run_file.name
+
+    def __read_run(self, run_path):
+        """
+        Yields the decorated lines of the given run.
+        """
+
+        with open(run_path, "r", encoding="utf-8") as run_file:
+            for line in run_file:
+                line = line[:-1]
+
+                yield self.key_method(line), line
+
+    def __get_sorted_lines(self, chunks, runs):
+        """
+        Provides the sorted lines of the given chunks.
+
+        :param chunks: An iterator of chunks of lines.
+        :param list runs:
+            The list of runs we created. This method appends
+            the created runs into it.
+
+        :rtype: iterator
+        """
+
+        first_chunk = next(chunks, [])
+        second_chunk = next(chunks, None)
+
+        if second_chunk is None:
+            # Everything fit into a single chunk, we do not need any run.
+            return iter(self.get_sorted_chunk(first_chunk))
+
+        for chunk in [first_chunk, second_chunk]:
+            runs.append(self.__write_run(self.get_sorted_chunk(chunk)))
+
+        for chunk in chunks:
+            runs.append(self.__write_run(self.get_sorted_chunk(chunk)))
+
+        # The decorated lines are compared key first. Therefore, the same
+        # lines are next to each other.
+        merged = merge(*[self.__read_run(x) for x in runs])
+
+        return self.__deduplicate(x for _, x in merged)
+
+    @classmethod
+    def __deduplicate(cls, lines):
+        """
+        Yields the given sorted lines without their (consecutive) duplicates.
+        """
+
+        previous = None
+
+        for line in lines:
+            if line != previous:
+                yield line
+
+            previous = line
+
+    def __write_sorted(self, file_stream, destination, runs):
+        """
+        Writes the sorted content of the given stream into the given destination.
+        """
+
+        for line in islice(file_stream, self.header_limit):
+            destination.write(line if line.endswith("\n") else f"{line}\n")
+
+        chunks = iter(
+            lambda: [x.rstrip("\n") for x in islice(file_stream, self.chunk_size)],
+            [],
+        )
+
+        destination.writelines(f"{x}\n" for x in self.__get_sorted_lines(chunks, runs))
+
+    def sort(self):
+        """
+        Sorts the file.
+
+        .. note::
+            If the lines can't be compared, the file is kept as it is.
+        """
+
+        runs = []
+
+        with NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=os.path.dirname(os.path.abspath(self.file_path)),
+            prefix=".",
+            suffix=".sorting",
+            delete=False,
+        ) as sorted_file:
+            pass
+
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file_stream, open(
+                sorted_file.name, "w", encoding="utf-8"
+            ) as destination:
+                self.__write_sorted(file_stream, destination, runs)
+
+            copymode(self.file_path, sorted_file.name)
+            os.replace(sorted_file.name, self.file_path)
+        except TypeError:
+            # The lines can't be compared.
+            pass
+        finally:
+            for run in runs:
+                os.remove(run)
+
+            if os.path.isfile(sorted_file.name):
+                os.remove(sorted_file.name)
@@ -67,6 +67,9 @@ class HashesTracker:
 
         self.tracker[filename] = dict()
 
+        # We initiate the scheduler of our saves.
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(self.save)
+
         if self.authorized:
             self.hashes_file = (
                 PyFunceble.CONFIG_DIRECTORY
@@ -112,6 +115,8 @@ class HashesTracker:
 
             PyFunceble.LOGGER.info(f"Saved tracked into {self.hashes_file!r}.")
 
+        self.save_scheduler.reset()
+
     def __set_current_hash(self):
         """
         Provides the hash of the current file.
@@ -165,7 +170,7 @@ class HashesTracker:
             except KeyError:
                 self.tracker[self.filename]["position"] = position
 
-            self.save()
+            self.save_scheduler.schedule()
 
     def set_position(self, position):
         """
@@ -175,7 +180,7 @@ class HashesTracker:
         if self.authorized:
             self.tracker[self.filename]["position"] = position
 
-            self.save()
+            self.save_scheduler.schedule()
 
     def get_position(self):
         """
@@ -195,6 +200,8 @@ class HashesTracker:
         if self.authorized:
             self.set_position(0)
 
+            self.save()
+
     def __reset_if_changed(self):
         """
         Resets the hashes.
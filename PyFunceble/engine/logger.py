@@ -51,17 +51,57 @@ License:
 """
 
 import logging
-from logging.handlers import RotatingFileHandler
+import sys
+from atexit import register as register_at_exit
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
 from os import sep as directory_separator
-from traceback import format_exc, format_stack
+from queue import SimpleQueue
+from traceback import format_exc
 
 import PyFunceble
 
 
+class LoggerQueueListener(QueueListener):  # pragma: no cover
+    """
+    Provides the listener which writes - from a background thread - the
+    records our loggers put into their queue.
+
+    Contrary to the default one, each record is only given to the handler
+    of the logger which emitted it.
+
+    :param queue: The queue to listen to.
+    :param dict handlers:
+        The handler to use for each logger.
+
+        ::
+
+            {
+                "PyFunceble.info": handler
+            }
+    """
+
+    def __init__(self, queue, handlers):
+        super().__init__(queue, *handlers.values(), respect_handler_level=True)
+
+        self.handlers_by_logger = handlers
+
+    def handle(self, record):
+        record = self.prepare(record)
+        handler = self.handlers_by_logger.get(record.name)
+
+        if handler and record.levelno >= handler.level:
+            handler.handle(record)
+
+
 # pylint: disable=too-many-instance-attributes
 class Logger:  # pragma: no cover
     """
     Provides our logging logic.
+
+    .. note::
+        A message can be given as a callable. In that case, it is only
+        called - to construct the message - when the logging is authorized.
     """
 
     format_to_apply = "[%(asctime)s::%(levelname)s::%(origin_path)s:%(origin_line)s@%(origin_func)s](PID%(process)s:%(processName)s): %(message)s"  # pylint: disable=line-too-long
@@ -76,6 +116,11 @@ class Logger:  # pragma: no cover
     The format to parse to the root logger (if used).
     """
 
+    queue_listener = None
+    """
+    The listener of the queue our loggers write into (if used).
+    """
+
     def __init__(self, debug=False, on_screen=False, output_directory=None):
         self.on_screen = (
             on_screen
@@ -86,6 +131,9 @@ class Logger:  # pragma: no cover
                 "DEBUG_PYFUNCEBLE_ON_SCREEN"
             ).exists()
         )
+        self.queued = PyFunceble.helpers.EnvironmentVariable(
+            "PYFUNCEBLE_DEBUG_QUEUE"
+        ).exists()
 
         self.authorized = self.authorization(debug)
 
@@ -171,6 +219,8 @@ class Logger:  # pragma: no cover
             self.critical_logger = logging.getLogger("PyFunceble.critical")
             self.critical_logger.setLevel(logging.CRITICAL)
 
+            handlers = {}
+
             for logger_name in self.__dict__:
                 if not logger_name.endswith("_logger"):
                     continue
@@ -180,13 +230,72 @@ class Logger:  # pragma: no cover
                 current_logger = getattr(self, logger_name)
 
                 if not current_logger.hasHandlers():
-                    current_logger.addHandler(self.__get_handler(handler_type))
+                    handlers[current_logger.name] = self.__get_handler(handler_type)
+
+            if self.queued and handlers:
+                self.__init_queue(handlers)
+            else:
+                for logger_name, handler in handlers.items():
+                    logging.getLogger(logger_name).addHandler(handler)
+
+    @classmethod
+    def __init_queue(cls, handlers):
+        """
+        Let our loggers write into a queue which is written - to the
+        given handlers - by a background thread.
+        """
+
+        log_queue = SimpleQueue()
+
+        for logger_name in handlers:
+            logging.getLogger(logger_name).addHandler(QueueHandler(log_queue))
+
+        cls.queue_listener = LoggerQueueListener(log_queue, handlers)
+        cls.queue_listener.start()
+
+        register_at_exit(cls.stop_queue)
+
+        if hasattr(os, "register_at_fork"):
+            # The background thread is not running into our (forked) children.
+            os.register_at_fork(after_in_child=cls.remove_queue)
 
     @classmethod
-    def get_origin_info(cls):
+    def stop_queue(cls):
+        """
+        Writes what is still into the queue and stops its background thread.
+        """
+
+        if cls.queue_listener is not None:
+            cls.queue_listener.stop()
+
+    @classmethod
+    def remove_queue(cls):
+        """
+        Let our loggers write directly into their handlers instead of the queue.
+        """
+
+        if cls.queue_listener is not None:
+            for logger_name, handler in cls.queue_listener.handlers_by_logger.items():
+                current_logger = logging.getLogger(logger_name)
+
+                for queue_handler in [
+                    x for x in current_logger.handlers if isinstance(x, QueueHandler)
+                ]:
+                    current_logger.removeHandler(queue_handler)
+
+                current_logger.addHandler(handler)
+
+            cls.queue_listener = None
+
+    @classmethod
+    def get_origin_info(cls, depth=2):
         """
         Returns the information about where the logger was triggered.
 
+        :param int depth:
+            The depth of the frame to look at. The default one is the
+            caller of the method which called us.
+
         :return:
             A tuple, which is composed of the following.
 
@@ -195,10 +304,13 @@ class Logger:  # pragma: no cover
         :rtype: tuple
         """
 
-        stackback = [y for x in [x.split("\n") for x in format_stack()] for y in x if y]
-        interest = stackback[-6].split(",")
+        try:
+            # pylint: disable=protected-access
+            frame = sys._getframe(depth)
+        except ValueError:
+            return "(unknown file)", "0", "(unknown function)"
 
-        complete_file = interest[0].strip()[6:-1].split(directory_separator)
+        complete_file = frame.f_code.co_filename.split(directory_separator)
 
         try:
             if complete_file[-2] != PyFunceble.NAME:
@@ -208,10 +320,7 @@ class Logger:  # pragma: no cover
         except IndexError:
             file = "/".join(complete_file)
 
-        line = interest[1].strip().split()[-1].strip()
-        func_name = interest[2].strip()[3:]
-
-        return file, line, func_name
+        return file, str(frame.f_lineno), frame.f_code.co_name
 
     def __get_handler(self, handler_type):
         """
@@ -237,101 +346,73 @@ class Logger:  # pragma: no cover
 
         return None
 
-    def info(self, message):
+    def __log(self, logger, level, message, args):
+        """
+        Logs the given message with the given logger.
+
+        .. warning::
+            This method should only be called by our logging methods
+            as we look for the caller of our caller.
+        """
+
+        if callable(message):
+            message = message()
+
+        file, line, func_name = self.get_origin_info(depth=3)
+        logger.log(
+            level,
+            message,
+            *args,
+            extra={"origin_path": file, "origin_line": line, "origin_func": func_name},
+        )
+
+    def info(self, message, *args):
         """
         Logs the info message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.info_logger.info(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
-
-    def debug(self, message):
+            self.__log(self.info_logger, logging.INFO, message, args)
+
+    def debug(self, message, *args):
         """
         Logs the debug message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.debug_logger.debug(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
-
-    def warning(self, message):
+            self.__log(self.debug_logger, logging.DEBUG, message, args)
+
+    def warning(self, message, *args):
         """
         Logs the warning message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.warning_logger.warning(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
-
-    def error(self, message):
+            self.__log(self.warning_logger, logging.WARNING, message, args)
+
+    def error(self, message, *args):
         """
         Logs the error message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.error_logger.error(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
-
-    def fatal(self, message):
+            self.__log(self.error_logger, logging.ERROR, message, args)
+
+    def fatal(self, message, *args):
         """
         Logs the fatal message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.fatal_logger.fatal(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
-
-    def critical(self, message):
+            self.__log(self.fatal_logger, logging.FATAL, message, args)
+
+    def critical(self, message, *args):
         """
         Logs the critical message.
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.critical_logger.critical(
-                message,
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
+            self.__log(self.critical_logger, logging.CRITICAL, message, args)
 
     def exception(self):
         """
@@ -339,12 +420,4 @@ class Logger:  # pragma: no cover
         """
 
         if self.authorized:
-            file, line, func_name = self.get_origin_info()
-            self.error_logger.error(
-                f"\n{format_exc()}",
-                extra={
-                    "origin_path": file,
-                    "origin_line": line,
-                    "origin_func": func_name,
-                },
-            )
+            self.__log(self.error_logger, logging.ERROR, f"\n{format_exc()}", ())
@@ -51,12 +51,12 @@ License:
 """
 import socket
 
-from sqlalchemy.orm.exc import NoResultFound
 from urllib3 import exceptions as urllib3_exceptions
 
 import PyFunceble
 from PyFunceble.engine.database.loader import session
 from PyFunceble.engine.database.schemas import File, Mined, Status
+from PyFunceble.engine.database.writer import BulkWriter
 
 
 class Mining:  # pylint: disable=too-many-instance-attributes
@@ -67,12 +67,15 @@ class Mining:  # pylint: disable=too-many-instance-attributes
     database = {}
     is_subject_present_cache = {}
     database_file = None
+    journal = None
 
     filename = None
     headers = {}
 
     def __init__(self, filename, parent_process=False):  # pragma: no cover
         self.database_file = ""
+        # We preset the journal of the database.
+        self.journal = None
         # We save the file we are working with.
         self.filename = filename
         # Se create the current file namespace.
@@ -84,6 +87,9 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
         PyFunceble.LOGGER.debug(f"Authorization: {self.authorized}")
 
+        # We initiate the scheduler of our saves.
+        self.save_scheduler = PyFunceble.engine.SaveScheduler(self.save)
+
         user_agent = PyFunceble.engine.UserAgent().get()
 
         if user_agent:
@@ -96,24 +102,28 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 # We get the file we are going to save our data.
                 self.database_file = (
                     PyFunceble.CONFIG_DIRECTORY
                     + PyFunceble.OUTPUTS.default_files.mining
                 )
 
+            if PyFunceble.CONFIGURATION.db_type == "journal":
+                # We initiate the journal of the database.
+                self.journal = PyFunceble.database.Journal(self.database_file)
+
             PyFunceble.LOGGER.debug(f"DB (File): {self.database_file}")
 
             self.load()
 
     def __getitem__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 if index in self.database[self.filename]:
                     return self.database[self.filename][index]
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 with session.Session() as db_session:
                     # pylint: disable=no-member
                     fetched = (
@@ -129,7 +139,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
     def __setitem__(self, index, value):  # pylint: disable=too-many-branches
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 actual_value = self[index]
 
                 if actual_value:
@@ -155,51 +165,31 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
                     self.database[self.filename][index] = value
 
+                if self.journal is not None:
+                    # We register the change into the journal.
+                    self.journal.set(
+                        [self.filename, index], self.database[self.filename][index]
+                    )
+
                 PyFunceble.LOGGER.info(
                     f"Inserted {repr(value)} into the subset of {repr(index)}"
                 )
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-                with session.Session() as db_session:
-                    try:
-                        # pylint: disable=no-member
-                        status = (
-                            db_session.query(Status)
-                            .filter(Status.tested == index)
-                            .one()
-                        )
-                    except NoResultFound:
-                        pass
-
-                with session.Session() as db_session:
-                    # pylint: disable=no-member, singleton-comparison
-                    in_db = (
-                        db_session.query(Mined)
-                        .filter(Mined.mined == value)
-                        .filter(Mined.subject_id == status.id)
-                        .all()
-                    )
-
-                if not in_db:
-                    mined = Mined(
-                        subject_id=status.id,
-                        mined=value,
-                        file_id=status.file_id,
-                    )
-
-                    with session.Session() as db_session:
-                        # pylint: disable=no-member, singleton-comparison
-                        db_session.add(mined)
-                        db_session.commit()
-                        db_session.refresh(mined)
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                # The mined subjects are written along with the other pending rows.
+                BulkWriter.get_instance().add_mined(index, value)
 
     def __delitem__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
                 actual_value = self[index]
 
                 if actual_value:
                     del self.database[self.filename][index]
 
+                    if self.journal is not None:
+                        # We register the change into the journal.
+                        self.journal.delete([self.filename, index])
+
                     PyFunceble.LOGGER.info(
                         "Cleaned the data related to "
                         f"{repr(index)} and {repr(self.filename)} "
@@ -208,6 +198,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
             elif PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
                 with session.Session() as db_session:
                     # pylint: disable=no-member
@@ -313,7 +304,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
 
                 for subject in self.database[self.filename].keys():
                     # We loop through the available list of status
@@ -324,7 +315,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         # the currently read status.
 
                         result.append((subject, element))
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 with session.Session() as db_session:
                     # pylint: disable=no-member
                     fetched = (
@@ -347,10 +338,15 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         Loads the content of the database file.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
             # We are authorized to operate.
 
-            if PyFunceble.helpers.File(self.database_file).exists():
+            if self.journal is not None and self.journal.exists():
+                # The journal exists.
+
+                # We update the database with the content of the journal.
+                self.database.update(self.journal.load())
+            elif PyFunceble.helpers.File(self.database_file).exists():
                 # The database file exists.
 
                 # We update the database with the content of the file.
@@ -362,6 +358,10 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                     "Database content loaded in memory. (DATASET WONT BE LOGGED)"
                 )
 
+            if self.journal is not None and self.parent and not self.journal.exists():
+                # We initiate the journal with the current state of the database.
+                self.journal.compact(self.database)
+
     def save(self):
         """
         Saves the content of the database into the database file.
@@ -370,15 +370,21 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "journal"]
         ):
             # We are authorized to operate.
 
-            # We save the database into the file.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            if self.journal is not None:
+                # We append the changes to the journal.
+                self.journal.write(self.database)
+            else:
+                # We save the database into the file.
+                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+        self.save_scheduler.reset()
+
     # pylint: disable=too-many-branches
     def mine(self, subject, subject_type):  # pragma: no cover
         """
@@ -477,8 +483,32 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         # We save into the database.
                         self[subject] = [local_result]
 
-            # We save the database.
-            self.save()
+            # We schedule the save of the database.
+            self.save_scheduler.schedule()
+
+    def __remove_from_subset(self, subject, subset, history_member):
+        """
+        Removes the given history member from the given (JSON) subset
+        of the given subject.
+
+        :param str subject: The subject we are working with.
+        :param list subset: The subset of the given subject.
+        :param str history_member: The history member to delete.
+        """
+
+        try:
+            subset.remove(history_member)
+
+            if self.journal is not None:
+                # We register the change into the journal.
+                self.journal.set([self.filename, subject], subset)
+
+            PyFunceble.LOGGER.info(
+                f"Removed {repr(history_member)} (mined) "
+                f"From the subset of {repr(subject)}."
+            )
+        except ValueError:  # pragma: no cover
+            pass
 
     def remove(self, subject, history_member):
         """
@@ -498,17 +528,13 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                     and history_member in actual_value
                 ):
 
-                    if PyFunceble.CONFIGURATION.db_type == "json":
-                        try:
-                            actual_value.remove(history_member)
-
-                            PyFunceble.LOGGER.info(
-                                f"Removed {repr(history_member)} (mined) "
-                                f"From the subset of {repr(subject)}."
-                            )
-                        except ValueError:  # pragma: no cover
-                            pass
-                    elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                    if PyFunceble.CONFIGURATION.db_type in ["json", "journal"]:
+                        self.__remove_from_subset(subject, actual_value, history_member)
+                    elif PyFunceble.CONFIGURATION.db_type in [
+                        "mariadb",
+                        "mysql",
+                        "sqlite",
+                    ]:
                         # We construct the query string.
 
                         with session.Session() as db_session:
@@ -544,4 +570,4 @@ class Mining:  # pylint: disable=too-many-instance-attributes
             if not self[subject]:  # pragma: no cover
                 del self[subject]
 
-            self.save()
+            self.save_scheduler.schedule()
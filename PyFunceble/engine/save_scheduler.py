@@ -0,0 +1,190 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the save scheduler of our (local) databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+from atexit import register as register_exit
+from time import time
+from weakref import WeakMethod, WeakSet
+
+import PyFunceble
+
+
+class SaveScheduler:
+    """
+    Provides a way to batch the saving of our (local) databases.
+
+    Instead of rewriting a database file after each change, we only
+    save it once a given number of changes are pending or once a given
+    number of seconds passed since its last save.
+
+    The pending changes of all living schedulers are saved when we exit
+    or when we are asked to terminate. A (forked) child never saves the
+    schedulers it inherited from its parent at that time.
+
+    :param save_method:
+        The method to call in order to save the database.
+    :param int threshold:
+        The maximal number of pending changes.
+    :param int interval:
+        The maximal number of seconds between two saves.
+    """
+
+    # Saves the default maximal number of pending changes.
+    default_threshold = 500
+    # Saves the default maximal number of seconds between two saves.
+    default_interval = 30
+
+    # Saves all living schedulers.
+    schedulers = WeakSet()
+
+    def __init__(self, save_method, threshold=None, interval=None):
+        self.save_method = WeakMethod(save_method)
+
+        if threshold is None:
+            threshold = PyFunceble.CONFIGURATION.db_save_threshold
+
+        if interval is None:
+            interval = PyFunceble.CONFIGURATION.db_save_interval
+
+        self.threshold = threshold if threshold is not None else self.default_threshold
+        self.interval = interval if interval is not None else self.default_interval
+
+        self.pending = 0
+        self.last_save = time()
+
+        # The process which registered the scheduler.
+        self.pid = os.getpid()
+
+        self.schedulers.add(self)
+
+    def __getstate__(self):  # pragma: no cover
+        # The weak reference can't be pickled. As only the parent process
+        # is allowed to save our databases, we don't transmit it.
+        state = self.__dict__.copy()
+        state["save_method"] = None
+
+        return state
+
+    def __setstate__(self, state):  # pragma: no cover
+        self.__dict__.update(state)
+
+    def schedule(self):
+        """
+        Registers a new change and saves the database if the
+        maximal number of pending changes or the maximal number
+        of seconds between two saves is reached.
+        """
+
+        self.pending += 1
+
+        if self.pending >= self.threshold or time() - self.last_save >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Saves the pending changes (if any).
+        """
+
+        if self.pending:
+            save_method = self.save_method() if self.save_method else None
+
+            if save_method is not None:
+                save_method()
+
+            self.reset()
+
+    def reset(self):
+        """
+        Resets the counter of pending changes.
+
+        .. note::
+            This method should be called when the database is
+            saved outside of the scheduler.
+        """
+
+        self.pending = 0
+        self.last_save = time()
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Saves the pending changes of all living schedulers
+        which were registered by the current process.
+
+        .. note::
+            Our (forked) children inherit our schedulers along with a copy
+            of our databases. We don't want them to overwrite our databases
+            with their (outdated) copy.
+        """
+
+        current_pid = os.getpid()
+
+        for scheduler in list(cls.schedulers):
+            if scheduler.pid == current_pid:
+                scheduler.flush()
+
+    @classmethod
+    def handle_signal(cls, signum, frame):  # pylint: disable=unused-argument
+        """
+        Saves the pending changes of all living schedulers before
+        exiting.
+
+        .. note::
+            This method is meant to be given to :func:`signal.signal`.
+        """
+
+        cls.flush_all()
+
+        raise SystemExit(128 + signum)
+
+
+register_exit(SaveScheduler.flush_all)
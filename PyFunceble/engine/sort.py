@@ -49,10 +49,9 @@ License:
     See the License for the specific language governing permissions and
     limitations under the License.
 """
+from re import compile as re_compile
 from urllib.parse import urlparse
 
-import PyFunceble
-
 
 class Sort:  # pylint: disable=too-few-public-methods
     """
@@ -60,13 +59,31 @@ class Sort:  # pylint: disable=too-few-public-methods
     parse to :py:class:`PyFunceble.helpers.list.List.custom_format`.
     """
 
+    # The special characters to delete.
+    special_characters = re_compile(r"[^a-zA-Z0-9\.]")
+
+    # The numbers to convert.
+    numbers = re_compile(r"(\d+)")
+
+    url_schemes = ("http:", "https:")
+
+    cache = {}
+    """
+    The keys we already computed (per key method).
+    """
+
+    cache_max_size = 100000
+    """
+    The maximal number of keys to cache per key method.
+    """
+
     @classmethod
     def __get_url_base(cls, element):
         """
         Provides the URL base if needed.
         """
 
-        if element.startswith("http:") or element.startswith("https:"):
+        if element.startswith(cls.url_schemes):
             parsed = urlparse(element)
 
             if parsed.netloc:
@@ -74,6 +91,33 @@ class Sort:  # pylint: disable=too-few-public-methods
 
         return element
 
+    @classmethod
+    def __is_ascii(cls, element):
+        """
+        Checks if the given element only contains ASCII characters.
+        """
+
+        try:
+            return element.isascii()
+        except AttributeError:  # pragma: no cover
+            # Python < 3.7.
+            return len(element) == len(element.encode("utf-8"))
+
+    @classmethod
+    def __get_number_key(cls, number):
+        """
+        Provides the key of the given number.
+
+        .. note::
+            The key starts with a character which is lower than all characters
+            we keep and is followed by the length of the number. Therefore
+            the numbers are compared numerically.
+        """
+
+        number = number.lstrip("0")
+
+        return f"\x00{chr(len(number))}{number}"
+
     @classmethod
     def standard(cls, element):
         """
@@ -83,22 +127,34 @@ class Sort:  # pylint: disable=too-few-public-methods
 
         :return: The formatted element.
         :rtype: str
+
+        .. note::
+            The numbers are compared numerically.
         """
 
-        element = cls.__get_url_base(element)
-        regex_replace = r"[^a-zA-Z0-9\.]"
+        element = cls.__get_url_base(element).strip()
+
+        without_dots = element.replace(".", "")
+
+        if without_dots.isalnum() and cls.__is_ascii(element):
+            # There is no special character to remove.
 
-        # We remove all special characters and return the formatted string.
-        cleaned = (
-            PyFunceble.helpers.Regex(regex_replace)
-            .replace_match(element.strip(), "")
-            .lower()
-        )
+            if without_dots.isalpha():
+                # There is no number to convert.
+                return element.lower()
 
-        return [
-            int(x) if x.isdigit() else x
-            for x in PyFunceble.helpers.Regex(r"(\d+)").split(cleaned)
-        ]
+            cleaned = element.lower()
+        else:
+            # We remove all special characters.
+            cleaned = cls.special_characters.sub("", element).lower()
+
+        result = cls.numbers.split(cleaned)
+
+        if len(result) > 1:
+            # The numbers are always at the odd positions.
+            result[1::2] = [cls.__get_number_key(x) for x in result[1::2]]
+
+        return "".join(result)
 
     @classmethod
     def hierarchical(cls, element):
@@ -132,3 +188,32 @@ class Sort:  # pylint: disable=too-few-public-methods
         element = cls.__get_url_base(element)
 
         return cls.standard(".".join(reversed(element.strip().split("."))))
+
+    @classmethod
+    def cached(cls, key_method):
+        """
+        Provides a version of the given key method which caches
+        the keys it computes.
+
+        This is useful when we sort the same elements again and again.
+
+        :param key_method: The key method to cache.
+        :type key_method: function|method
+
+        :rtype: function
+        """
+
+        cache = cls.cache.setdefault(key_method.__name__, {})
+
+        def get_key(element):
+            try:
+                return cache[element]
+            except KeyError:
+                if len(cache) >= cls.cache_max_size:
+                    cache.clear()
+
+                cache[element] = key_method(element)
+
+            return cache[element]
+
+        return get_key
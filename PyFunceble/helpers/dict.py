@@ -51,10 +51,14 @@ License:
 """
 
 from json import decoder, dump, dumps, loads
+from os import fsync, replace
+from os.path import abspath, dirname
+from uuid import uuid4
 
 from yaml import dump as yaml_dump
 from yaml import safe_load as yaml_load
 
+from .directory import Directory
 from .file import File
 
 
@@ -220,16 +224,34 @@ class Dict:
         :param bool ensure_ascii: Avoids unicode.
         :param int indent: The indentation to apply.
         :param bool sortkeys: Sorts the keys.
+
+        .. note::
+            The content is first written (and synced) into a temporary
+            file which then replaces the given file path. That way, the
+            given file is never left half-written.
         """
 
-        with open(file_path, "w", encoding=encoding) as file_stream:
-            dump(
-                self.main,
-                file_stream,
-                ensure_ascii=ensure_ascii,
-                indent=indent,
-                sort_keys=sort_keys,
-            )
+        temp_file_path = f"{file_path}.{uuid4().hex}.tmp"
+
+        try:
+            with open(temp_file_path, "w", encoding=encoding) as file_stream:
+                dump(
+                    self.main,
+                    file_stream,
+                    ensure_ascii=ensure_ascii,
+                    indent=indent,
+                    sort_keys=sort_keys,
+                )
+
+                file_stream.flush()
+                fsync(file_stream.fileno())
+
+            replace(temp_file_path, file_path)
+        except BaseException:
+            File(temp_file_path).delete()
+            raise
+
+        Directory(dirname(abspath(file_path))).fsync()
 
     @classmethod
     def from_json_file(cls, file_path, encoding="utf-8", return_dict_on_error=True):
@@ -50,7 +50,11 @@ License:
     limitations under the License.
 """
 
-from os import getcwd, makedirs, path
+from os import O_RDONLY
+from os import close as close_descriptor
+from os import fsync, getcwd, makedirs
+from os import open as open_descriptor
+from os import path
 from os import sep as directory_separator
 from shutil import rmtree
 
@@ -156,3 +160,28 @@ class Directory:
             rmtree(dir_path)
 
         return not self.exists(dir_path=dir_path)
+
+    def fsync(self, dir_path=None):
+        """
+        Syncs the given directory path so that a file replacement
+        into it survives a crash.
+
+        .. note::
+            Not all platforms (e.g. Windows) let us open a directory.
+            In that case, we do nothing.
+        """
+
+        if not dir_path:
+            dir_path = self.path
+
+        try:
+            directory_descriptor = open_descriptor(dir_path, O_RDONLY)
+        except OSError:  # pragma: no cover
+            return
+
+        try:
+            fsync(directory_descriptor)
+        except OSError:  # pragma: no cover
+            pass
+        finally:
+            close_descriptor(directory_descriptor)
@@ -49,11 +49,11 @@ License:
     See the License for the specific language governing permissions and
     limitations under the License.
 """
+from collections import OrderedDict
 from re import MULTILINE
 from re import compile as re_compile
 from re import escape as re_escape
-from re import split as re_split
-from re import sub as re_sub
+from threading import Lock
 
 
 class Regex:
@@ -62,21 +62,90 @@ class Regex:
 
     :param str regex: The regex to use.
     :param bool escape: Escapes the given regex.
+
+    .. note::
+        The compiled regex are cached (and shared) across all instances
+        of the current process.
     """
 
+    # Saves the compiled regex. The keys are in the (regex, flags) format.
+    compiled = OrderedDict()
+    # Saves the maximal number of compiled regex to keep.
+    compiled_max_size = 512
+    # Saves the number of cache hits.
+    hits = 0
+    # Saves the number of cache misses.
+    misses = 0
+
+    lock = Lock()
+
     def __init__(self, regex, escape=False):
         if escape:
             self.regex = re_escape(regex)
         else:
             self.regex = regex
 
+    @classmethod
+    def get_compiled(cls, regex, flags=0):
+        """
+        Provides the compiled version of the given regex.
+
+        :param str regex: The regex to compile.
+        :param int flags: The flags to compile with.
+
+        :rtype: :py:class:`re.Pattern`
+        """
+
+        key = (regex, flags)
+
+        with cls.lock:
+            if key in cls.compiled:
+                cls.compiled.move_to_end(key)
+                cls.hits += 1
+
+                return cls.compiled[key]
+
+            cls.misses += 1
+
+        result = re_compile(regex, flags)
+
+        with cls.lock:
+            cls.compiled[key] = result
+
+            while len(cls.compiled) > cls.compiled_max_size:
+                cls.compiled.popitem(last=False)
+
+        return result
+
+    @classmethod
+    def get_statistics(cls):
+        """
+        Provides the statistics of the cache of compiled regex.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "hits": 0,
+                    "misses": 0,
+                    "size": 0
+                }
+
+        :rtype: dict
+        """
+
+        with cls.lock:
+            return {"hits": cls.hits, "misses": cls.misses, "size": len(cls.compiled)}
+
     def get_not_matching_list(self, data):
         """
         Returns the strings which does not the match the regex
         in the given data.
         """
 
-        pre_result = re_compile(self.regex)
+        pre_result = self.get_compiled(self.regex)
 
         return [x for x in data if not pre_result.search(str(x))]
 
@@ -86,7 +155,7 @@ class Regex:
         in the given data.
         """
 
-        pre_result = re_compile(self.regex)
+        pre_result = self.get_compiled(self.regex)
 
         return [x for x in data if pre_result.search(str(x))]
 
@@ -105,7 +174,7 @@ class Regex:
             Return the part that match the given regex string.
         """
         result = []
-        to_match = re_compile(self.regex)
+        to_match = self.get_compiled(self.regex)
 
         if rematch:
             pre_result = to_match.findall(data)
@@ -148,12 +217,8 @@ class Regex:
         """
 
         if isinstance(replacement, str):
-            return re_sub(
-                self.regex,
-                replacement,
-                data,
-                occurences,
-                flags=MULTILINE if multiline else 0,
+            return self.get_compiled(self.regex, MULTILINE if multiline else 0).sub(
+                replacement, data, occurences
             )
         return data
 
@@ -165,4 +230,4 @@ class Regex:
         :rtype: list
         """
 
-        return re_split(self.regex, data)
+        return self.get_compiled(self.regex).split(data)
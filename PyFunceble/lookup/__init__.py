@@ -50,11 +50,17 @@ License:
     limitations under the License.
 """
 
+from .async_dns import AsyncDNSLookup as AsyncDns
+from .async_http_code import AsyncHTTPCode
 from .dns import DNSLookup as Dns
+from .dns_cache import DNSCache, DNSCacheManager
 from .http_code import HTTPCode
 from .iana import Iana
 from .ipv4_reputation import IPv4Reputation
 from .publicsuffix import PublicSuffix
 from .referer import Referer
+from .referer_cache import RefererCache
 from .requests import Requests
+from .reserved_ip import ReservedIP
 from .whois import WhoisLookup as Whois
+from .whois_limiter import WhoisLimiter
@@ -0,0 +1,450 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the asynchronous DNS lookup interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import os
+
+import dns.asyncresolver
+import dns.reversename
+from dns.exception import DNSException
+from dns.resolver import NXDOMAIN
+
+import PyFunceble
+
+from .dns_cache import DNSCache
+
+
+class AsyncDNSLookup:
+    """
+    Asynchronous DNS lookup interface.
+
+    It let us keep a lot of DNS queries in flight from a single process.
+
+    :param dns_lookup:
+        The DNS lookup interface to take the resolver settings from.
+        If not given, we use :code:`PyFunceble.DNSLOOKUP`.
+    :type dns_lookup: :class:`~PyFunceble.lookup.dns.DNSLookup`
+    :param int concurrency:
+        The maximal number of queries to keep in flight.
+        If not given, we use :code:`CONFIGURATION.dns_lookup_concurrency`.
+    """
+
+    default_concurrency = 100
+
+    # The record types we request for a subject which is not an IP.
+    # The order is the one of the fallback chain.
+    not_ip_record_types = ["NS", "CNAME", "DNAME", "A", "AAAA"]
+
+    def __init__(self, dns_lookup=None, concurrency=None):
+        if dns_lookup is None:
+            dns_lookup = PyFunceble.DNSLOOKUP
+
+        if concurrency is None:
+            concurrency = PyFunceble.CONFIGURATION.dns_lookup_concurrency
+
+        if not isinstance(concurrency, int) or concurrency < 1:
+            concurrency = self.default_concurrency
+
+        self.concurrency = concurrency
+        self.tcp = dns_lookup.tcp
+        self.fan_out = dns_lookup.fan_out
+        self.cache = dns_lookup.cache
+        self.resolver = self.__get_resolver(dns_lookup.resolver)
+
+        # Our event loop and the PID of the process which created it.
+        self.loop = None
+        self.loop_pid = None
+
+        PyFunceble.LOGGER.debug(f"Async DNS Resolver concurrency: {self.concurrency}")
+
+    @classmethod
+    def __get_resolver(cls, resolver):
+        """
+        Provides an asynchronous resolver with the same settings
+        as the given one.
+        """
+
+        async_resolver = dns.asyncresolver.Resolver(configure=False)
+
+        async_resolver.port = resolver.port
+        async_resolver.nameserver_ports = dict(resolver.nameserver_ports)
+        async_resolver.nameservers = list(resolver.nameservers)
+
+        async_resolver.timeout = resolver.timeout
+        async_resolver.lifetime = resolver.lifetime
+
+        return async_resolver
+
+    async def __resolve(self, subject, record_type, tcp=False):
+        """
+        Resolves the given record type of the given subject
+        through the cache (if given) and the resolver.
+
+        :rtype: list
+        :raise DNSException: When the record could not be resolved.
+        """
+
+        if self.cache is None:
+            return [
+                str(x)
+                for x in await self.resolver.resolve(subject, record_type, tcp=tcp)
+            ]
+
+        found, result = self.cache.get(subject, record_type, self.resolver.nameservers)
+
+        if found:
+            PyFunceble.LOGGER.debug(
+                f"Cache hit for the {record_type} record of {repr(subject)}."
+            )
+
+            if result is None:
+                raise NXDOMAIN()
+            return result
+
+        try:
+            answer = await self.resolver.resolve(subject, record_type, tcp=tcp)
+        except NXDOMAIN as exception:
+            self.cache.put(
+                subject,
+                record_type,
+                self.resolver.nameservers,
+                None,
+                DNSCache.get_negative_ttl_of(exception),
+            )
+            raise
+
+        result = [str(x) for x in answer]
+
+        self.cache.put(
+            subject,
+            record_type,
+            self.resolver.nameservers,
+            result,
+            DNSCache.get_ttl_of(answer),
+        )
+
+        return result
+
+    async def record(self, subject, record_type, tcp=None, raise_nxdomain=False):
+        """
+        Return the record of the given type of the given subject (if found).
+
+        :param str subject: The subject we are working with.
+        :param str record_type: The record type to query.
+        :param bool tcp: Tell us to use TCP for query.
+        :param bool raise_nxdomain:
+            Tell us to raise when the subject does not exist.
+
+        :return: A list of record(s).
+        :rtype: list, None
+        :raise ValueError: When a non string :code:`subject` is given.
+        :raise NXDOMAIN:
+            When the subject does not exist and :code:`raise_nxdomain` is given.
+        """
+
+        if not subject or not isinstance(subject, str):
+            raise ValueError(f"<subject> must be of type {str} and not empty.")
+
+        if tcp is None:
+            tcp = self.tcp
+
+        if record_type == "PTR":
+            # We get the reverse name we are going to request.
+            to_request = dns.reversename.from_address(subject)
+        else:
+            to_request = subject
+
+        try:
+            PyFunceble.LOGGER.info(f"Getting {record_type} record of {repr(subject)}")
+
+            result = await self.__resolve(to_request, record_type, tcp=tcp)
+            PyFunceble.LOGGER.info(
+                f"Could get {record_type} record of {repr(subject)}: {result}"
+            )
+
+            return result
+        except DNSException as exception:
+            PyFunceble.LOGGER.error(
+                f"Could not get {record_type} record of {repr(subject)}"
+            )
+
+            if raise_nxdomain and isinstance(exception, NXDOMAIN):
+                raise
+
+        return None
+
+    async def __fan_out_not_ip(self, subject, tcp=None):
+        """
+        Requests all record types concurrently and stops at the first
+        positive answer or at the first NXDOMAIN.
+
+        :rtype: dict
+        """
+
+        pending = {
+            asyncio.ensure_future(
+                self.record(subject, x, tcp=tcp, raise_nxdomain=True)
+            ): x
+            for x in self.not_ip_record_types
+        }
+
+        result = {}
+        nxdomain = False
+
+        try:
+            while pending and not result and not nxdomain:
+                done, _ = await asyncio.wait(
+                    list(pending), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    record_type = pending.pop(task)
+
+                    try:
+                        result[record_type] = task.result()
+                    except NXDOMAIN:
+                        # The subject does not exist. There is no need to wait
+                        # for the other record types.
+                        nxdomain = True
+
+                result = {x: y for x, y in result.items() if y}
+        finally:
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.wait(list(pending))
+
+        return result
+
+    async def __request_not_ip(self, subject, tcp=None):
+        """
+        Handle the request for a subject which is not an IP.
+
+        .. note::
+            We follow the same fallback chain as
+            :class:`~PyFunceble.lookup.dns.DNSLookup` unless
+            the fan-out is activated.
+
+        :rtype: dict
+        """
+
+        if self.fan_out:
+            result = await self.__fan_out_not_ip(subject, tcp=tcp)
+        else:
+            result = {}
+
+            for record_type in self.not_ip_record_types:
+                result[record_type] = await self.record(subject, record_type, tcp=tcp)
+
+                if result[record_type]:
+                    break
+
+            result = {x: y for x, y in result.items() if y}
+
+        if result:
+            result["nameservers"] = self.resolver.nameservers
+
+        PyFunceble.LOGGER.debug(
+            "Records for %r (with %s):\n%s",
+            subject,
+            self.resolver.nameservers,
+            result,
+        )
+
+        return result
+
+    async def __request_ip(self, subject, tcp=None):
+        """
+        Handle the request for a subject which is an IP.
+
+        :rtype: dict
+        """
+
+        result = {}
+
+        # We get the PTR record of the given subject.
+        ptr_record = await self.record(subject, "PTR", tcp=tcp)
+
+        if ptr_record:
+            result["PTR"] = ptr_record
+            result["nameservers"] = self.resolver.nameservers
+        else:
+            PyFunceble.LOGGER.error(f"PTR record for {repr(subject)} not found.")
+
+            PyFunceble.LOGGER.info(f"Getting hosts by addr for {repr(subject)}")
+
+            # asyncio.get_running_loop() does not exist under Python 3.6.
+            loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+
+            # We do not want to block the event loop.
+            result = await loop.run_in_executor(
+                None, PyFunceble.lookup.Dns.get_host_by_addr, subject
+            )
+
+        PyFunceble.LOGGER.debug("Request result: \n%s", result)
+
+        return result
+
+    async def request(self, subject, tcp=None):
+        """
+        Perform a DNS lookup/requests.
+
+        :param str subject: The subject we are working with.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return:
+            The same as :meth:`PyFunceble.lookup.dns.DNSLookup.request`.
+        :rtype: dict
+        :raise ValueError: When a non string :code:`subject` is given.
+        """
+
+        if not subject or not isinstance(subject, str):
+            raise ValueError(f"<subject> must be of type {str} and not empty.")
+
+        result = {}
+
+        if not PyFunceble.Check(subject).is_ip():
+            temp_result = await self.__request_not_ip(subject, tcp=tcp)
+        else:
+            temp_result = await self.__request_ip(subject, tcp=tcp)
+
+        if isinstance(temp_result, dict):
+            result.update(temp_result)
+
+        return result
+
+    async def __limited_request(self, semaphore, subject, tcp=None):
+        """
+        Perform a DNS lookup/requests once the given semaphore let us.
+
+        :return: A tuple in the following format: :code:`(subject, result)`.
+        :rtype: tuple
+        """
+
+        async with semaphore:
+            return subject, await self.request(subject, tcp=tcp)
+
+    async def __request_many(self, subjects, tcp=None):
+        """
+        Perform the DNS lookup/requests of the given subjects.
+
+        :rtype: dict
+        """
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        return dict(
+            await asyncio.gather(
+                *[self.__limited_request(semaphore, x, tcp=tcp) for x in subjects]
+            )
+        )
+
+    def request_many(self, subjects, tcp=None):
+        """
+        Perform the DNS lookup/requests of the given subjects concurrently.
+
+        :param list subjects: The subjects we are working with.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "subject": {}  # The result of the request.
+                }
+
+        :rtype: dict
+        :raise ValueError: When a non string subject is given.
+        """
+
+        subjects = set(subjects)
+
+        if not subjects:
+            return {}
+
+        return self.get_loop().run_until_complete(
+            self.__request_many(subjects, tcp=tcp)
+        )
+
+    def get_loop(self):
+        """
+        Provides our event loop.
+
+        .. note::
+            We keep the same loop for all our requests. A new one is only
+            created into a forked process because the selector of the
+            inherited one is shared with its parent.
+        """
+
+        if self.loop is None or self.loop.is_closed() or self.loop_pid != os.getpid():
+            self.loop = asyncio.new_event_loop()
+            self.loop_pid = os.getpid()
+
+        return self.loop
+
+    def close(self):
+        """
+        Closes our event loop.
+        """
+
+        if (
+            self.loop is not None
+            and not self.loop.is_closed()
+            and self.loop_pid == os.getpid()
+        ):
+            self.loop.close()
+
+        self.loop = None
+        self.loop_pid = None
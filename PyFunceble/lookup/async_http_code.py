@@ -0,0 +1,462 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the asynchronous HTTP status code lookup interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import asyncio
+import ssl
+from ipaddress import ip_address
+from math import ceil
+from urllib.parse import urlparse
+
+import PyFunceble
+
+
+class AsyncHTTPCode:  # pylint: disable=too-many-instance-attributes
+    """
+    Asynchronous HTTP status code lookup interface.
+
+    It let us keep a lot of :code:`HEAD` requests in flight from a single
+    process. The connections are kept alive and reused for the next
+    requests to the same host.
+
+    .. note::
+        A URL which could not be requested within the timeout budget is
+        simply not returned. It is then requested - as usual - by
+        :class:`~PyFunceble.lookup.http_code.HTTPCode`.
+
+    :param int concurrency:
+        The maximal number of requests to keep in flight.
+        If not given, we use :code:`CONFIGURATION.http_code_concurrency`.
+    :param int host_concurrency:
+        The maximal number of requests to keep in flight for a single host.
+        If not given, we use :code:`CONFIGURATION.http_code_host_concurrency`.
+    :param float timeout:
+        The timeout of a single request.
+        If not given, we use :code:`CONFIGURATION.timeout`.
+    """
+
+    default_concurrency = 100
+    default_host_concurrency = 6
+    default_timeout = 5.0
+    # The number of timeouts we give to a whole batch of requests.
+    budget_factor = 3
+    # The maximal size of the headers we read.
+    max_headers_size = 65536
+
+    def __init__(self, concurrency=None, host_concurrency=None, timeout=None):
+        if concurrency is None:
+            concurrency = PyFunceble.CONFIGURATION.http_code_concurrency
+
+        if host_concurrency is None:
+            host_concurrency = PyFunceble.CONFIGURATION.http_code_host_concurrency
+
+        if timeout is None:
+            timeout = PyFunceble.CONFIGURATION.timeout
+
+        if not isinstance(concurrency, int) or concurrency < 1:
+            concurrency = self.default_concurrency
+
+        if not isinstance(host_concurrency, int) or host_concurrency < 1:
+            host_concurrency = self.default_host_concurrency
+
+        if not isinstance(timeout, (int, float)) or timeout <= 0:
+            timeout = self.default_timeout
+
+        self.concurrency = concurrency
+        self.host_concurrency = host_concurrency
+        self.timeout = float(timeout)
+
+        self.headers = {"Accept": "*/*"}
+
+        user_agent = PyFunceble.engine.UserAgent().get()
+
+        if user_agent:
+            self.headers["User-Agent"] = user_agent
+
+        self.ssl_context = self.__get_ssl_context()
+
+        # hostname -> task resolving the hostname.
+        self.__resolutions = {}
+        # (scheme, ip, port, hostname) -> idle connections.
+        self.__pool = {}
+        # hostname -> semaphore.
+        self.__host_semaphores = {}
+
+        PyFunceble.LOGGER.debug(
+            f"Async HTTP Code concurrency: {self.concurrency} "
+            f"(per host: {self.host_concurrency})"
+        )
+
+    @classmethod
+    def __get_ssl_context(cls):
+        """
+        Provides the SSL context to use.
+        """
+
+        context = ssl.create_default_context()
+
+        if not PyFunceble.CONFIGURATION.verify_ssl_certificate:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+
+        return context
+
+    @classmethod
+    def is_ip(cls, hostname):
+        """
+        Checks if the given hostname is an IP.
+
+        :rtype: bool
+        """
+
+        try:
+            ip_address(hostname)
+            return True
+        except ValueError:
+            return False
+
+    async def __resolve(self, hostname):
+        """
+        Resolves the given hostname through the asynchronous interface
+        of our DNS lookup. That way, the configured nameservers, the
+        TCP setting and the DNS cache are shared with the other lookups.
+
+        :return: The IP of the hostname or :code:`None`.
+        :rtype: str, None
+        """
+
+        if self.is_ip(hostname):
+            return hostname
+
+        if hostname not in self.__resolutions:
+            self.__resolutions[hostname] = asyncio.ensure_future(
+                PyFunceble.DNSLOOKUP.get_async_dns().record(hostname, "A")
+            )
+
+        records = await self.__resolutions[hostname]
+
+        if records:
+            return records[0]
+        return None
+
+    def __get_request(self, parsed_url):
+        """
+        Provides the raw :code:`HEAD` request of the given (parsed) URL.
+
+        :rtype: bytes
+        """
+
+        path = parsed_url.path or "/"
+
+        if parsed_url.query:
+            path += f"?{parsed_url.query}"
+
+        if ":" in parsed_url.hostname:
+            host = f"[{parsed_url.hostname}]"
+        else:
+            host = parsed_url.hostname
+
+        headers = {"Host": host, **self.headers, "Connection": "keep-alive"}
+
+        return (
+            f"HEAD {path} HTTP/1.1\r\n"
+            + "".join(f"{x}: {y}\r\n" for x, y in headers.items())
+            + "\r\n"
+        ).encode("utf-8")
+
+    @classmethod
+    def __parse_headers(cls, data):
+        """
+        Parses the given raw headers.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (status code, keep the connection alive)
+
+        :rtype: tuple
+        :raise ValueError: When the headers could not be parsed.
+        """
+
+        lines = data.decode("iso-8859-1").split("\r\n")
+        protocol, status_code = lines[0].split(" ", 2)[:2]
+
+        if not protocol.startswith("HTTP/"):
+            raise ValueError(f"Unknown protocol: {protocol}")
+
+        connection = ""
+
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+
+            if name.strip().lower() == "connection":
+                connection = value.strip().lower()
+
+        if protocol == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+
+        return int(status_code), keep_alive
+
+    async def __get_connection(self, key):
+        """
+        Provides an idle connection of the pool or a new one.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (reader, writer, reused)
+
+        :rtype: tuple
+        """
+
+        scheme, ip, port, hostname = key
+
+        while self.__pool.get(key):
+            reader, writer = self.__pool[key].pop()
+
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+
+            writer.close()
+
+        if scheme == "https":
+            reader, writer = await asyncio.open_connection(
+                ip, port, ssl=self.ssl_context, server_hostname=hostname
+            )
+        else:
+            reader, writer = await asyncio.open_connection(ip, port)
+
+        return reader, writer, False
+
+    def __release_connection(self, key, reader, writer, keep_alive):
+        """
+        Gives the given connection back to the pool (or closes it).
+        """
+
+        idle = self.__pool.setdefault(key, [])
+
+        if keep_alive and len(idle) < self.host_concurrency:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def __head(self, parsed_url, ip):
+        """
+        Sends a :code:`HEAD` request to the given (parsed) URL.
+
+        :return: The status code.
+        :rtype: int
+        """
+
+        port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+        key = (parsed_url.scheme, ip, port, parsed_url.hostname)
+        request = self.__get_request(parsed_url)
+
+        while True:
+            reader, writer, reused = await self.__get_connection(key)
+
+            try:
+                writer.write(request)
+                await writer.drain()
+
+                while True:
+                    status_code, keep_alive = self.__parse_headers(
+                        await reader.readuntil(b"\r\n\r\n")
+                    )
+
+                    if status_code != 100:
+                        break
+            except (OSError, asyncio.IncompleteReadError):
+                writer.close()
+
+                if reused:
+                    # The server closed the idle connection. We retry
+                    # with a new one.
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+
+            self.__release_connection(key, reader, writer, keep_alive)
+
+            return status_code
+
+    async def request(self, url):
+        """
+        Provides the HTTP status code of the given URL.
+
+        :param str url: The URL to request.
+
+        :return: The HTTP status code or :code:`None`.
+        :rtype: int, None
+        """
+
+        parsed_url = urlparse(url)
+
+        if parsed_url.scheme not in ["http", "https"] or not parsed_url.hostname:
+            return None
+
+        if parsed_url.hostname not in self.__host_semaphores:
+            self.__host_semaphores[parsed_url.hostname] = asyncio.Semaphore(
+                self.host_concurrency
+            )
+
+        try:
+            async with self.__host_semaphores[parsed_url.hostname]:
+                ip = await asyncio.wait_for(
+                    self.__resolve(parsed_url.hostname), self.timeout
+                )
+
+                if not ip:
+                    return None
+
+                status_code = await asyncio.wait_for(
+                    self.__head(parsed_url, ip), self.timeout
+                )
+        except (
+            OSError,
+            ValueError,
+            UnicodeError,
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ):
+            PyFunceble.LOGGER.exception()
+
+            return None
+
+        PyFunceble.LOGGER.debug(f"Status Code of {repr(url)}: {status_code}")
+
+        return status_code
+
+    async def __limited_request(self, semaphore, url):
+        """
+        Provides the HTTP status code of the given URL once the given
+        semaphore let us.
+
+        :return: A tuple in the following format: :code:`(url, status code)`.
+        :rtype: tuple
+        """
+
+        async with semaphore:
+            return url, await self.request(url)
+
+    async def __request_many(self, urls):
+        """
+        Provides the HTTP status code of the given URLs.
+
+        :rtype: dict
+        """
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.ensure_future(self.__limited_request(semaphore, x)) for x in urls
+        ]
+
+        budget = self.timeout * self.budget_factor * ceil(len(urls) / self.concurrency)
+
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            PyFunceble.LOGGER.info(
+                f"Could not get the HTTP status code of {len(pending)} URL(s) "
+                "within the timeout budget."
+            )
+
+            await asyncio.wait(pending)
+
+        for connections in self.__pool.values():
+            for _, writer in connections:
+                writer.close()
+
+        self.__pool.clear()
+
+        return dict(x.result() for x in done if not x.cancelled())
+
+    def request_many(self, urls):
+        """
+        Provides the HTTP status code of the given URLs concurrently.
+
+        :param list urls: The URLs we are working with.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "url": 200  # The status code or None.
+                }
+
+        :rtype: dict
+        """
+
+        urls = set(urls)
+
+        if not urls:
+            return {}
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            return loop.run_until_complete(self.__request_many(urls))
+        finally:
+            loop.close()
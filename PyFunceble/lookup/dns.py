@@ -58,6 +58,8 @@ from dns.exception import DNSException
 
 import PyFunceble
 
+from .dns_cache import DNSCache
+
 
 class DNSLookup:  # pylint: disable=too-few-public-methods
     """
@@ -67,18 +69,33 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
     :param dns_server: The DNS server we are working with.
     :type dns_server: list|tuple|str
     :param int lifetime: Set the lifetime of a query.
+    :param bool tcp: Tell us to use TCP for query.
+    :param bool fan_out:
+        Tell us to request the record types of a subject concurrently.
+    :param cache: The DNS answer cache to use.
+    :type cache: :class:`~PyFunceble.lookup.dns_cache.DNSCache`
     """
 
-    def __init__(self, dns_server=None, lifetime=3, tcp=False):
+    def __init__(
+        self, dns_server=None, lifetime=3, tcp=False, fan_out=False, cache=None
+    ):
         if PyFunceble.CONFIGURATION is None:
             PyFunceble.load_config()
 
         self.given_dns_server = dns_server
         self.resolver = self.__get_resolver(dns_server)
 
+        # Our (long-lived) asynchronous interface. Created on first use.
+        self.async_dns = None
+
         self.update_nameserver(dns_server)
         self.update_lifetime(lifetime)
         self.tcp = tcp
+        self.fan_out = fan_out
+        self.cache = cache
+
+        # Saves the results of the last prefetching.
+        self.prefetched = {}
 
         PyFunceble.LOGGER.debug(
             f"DNS Resolver Nameservers: {self.resolver.nameservers}"
@@ -90,6 +107,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         PyFunceble.LOGGER.debug(f"DNS Resolver timeout: {self.resolver.timeout}")
         PyFunceble.LOGGER.debug(f"DNS Resolver lifetime: {self.resolver.lifetime}")
         PyFunceble.LOGGER.debug(f"DNS Resolver over TCP: {self.tcp}")
+        PyFunceble.LOGGER.debug(f"DNS Resolver fan-out: {self.fan_out}")
 
         PyFunceble.INTERN["dns_lookup"] = {
             "resolver": self.resolver,
@@ -129,6 +147,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         Updates the lifetime of a query.
         """
 
+        self.drop_async_dns()
+
         self.resolver.timeout = 2.0
 
         if isinstance(lifetime, (int, float)):
@@ -144,6 +164,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         Updates the nameserver to query.
         """
 
+        self.drop_async_dns()
+
         if nameserver:
             nameserver = (
                 [nameserver]
@@ -234,6 +256,55 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         return result
 
+    def __resolve(self, subject, record_type, tcp=False):
+        """
+        Resolves the given record type of the given subject
+        through the cache (if given) and the resolver.
+
+        :rtype: list
+        :raise DNSException: When the record could not be resolved.
+        """
+
+        if self.cache is None:
+            return [
+                str(x) for x in self.resolver.resolve(subject, record_type, tcp=tcp)
+            ]
+
+        found, result = self.cache.get(subject, record_type, self.resolver.nameservers)
+
+        if found:
+            PyFunceble.LOGGER.debug(
+                f"Cache hit for the {record_type} record of {repr(subject)}."
+            )
+
+            if result is None:
+                raise dns.resolver.NXDOMAIN()
+            return result
+
+        try:
+            answer = self.resolver.resolve(subject, record_type, tcp=tcp)
+        except dns.resolver.NXDOMAIN as exception:
+            self.cache.put(
+                subject,
+                record_type,
+                self.resolver.nameservers,
+                None,
+                DNSCache.get_negative_ttl_of(exception),
+            )
+            raise
+
+        result = [str(x) for x in answer]
+
+        self.cache.put(
+            subject,
+            record_type,
+            self.resolver.nameservers,
+            result,
+            DNSCache.get_ttl_of(answer),
+        )
+
+        return result
+
     def a_record(self, subject, tcp=None):
         """
         Return the A record of the given subject (if found).
@@ -257,7 +328,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting A record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "A", tcp=tcp)]
+            result = self.__resolve(subject, "A", tcp=tcp)
             PyFunceble.LOGGER.info(f"Could get A record of {repr(subject)}: {result}")
 
             return result
@@ -289,7 +360,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting AAAA record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "AAAA", tcp=tcp)]
+            result = self.__resolve(subject, "AAAA", tcp=tcp)
             PyFunceble.LOGGER.info(
                 f"Could get AAAA record of {repr(subject)}: {result}"
             )
@@ -323,7 +394,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting CNAME record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "CNAME", tcp=tcp)]
+            result = self.__resolve(subject, "CNAME", tcp=tcp)
             PyFunceble.LOGGER.info(
                 f"Could get CNAME record of {repr(subject)}: {result}"
             )
@@ -357,7 +428,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting DNAME record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "DNAME", tcp=tcp)]
+            result = self.__resolve(subject, "DNAME", tcp=tcp)
             PyFunceble.LOGGER.info(
                 f"Could get DNAME record of {repr(subject)}: {result}"
             )
@@ -390,7 +461,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting MX record of {repr(subject)}")
             # We get the MX record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "MX", tcp=tcp)]
+            result = self.__resolve(subject, "MX", tcp=tcp)
 
             PyFunceble.LOGGER.info(f"Could get MX record of {repr(subject)}: {result}")
 
@@ -423,7 +494,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting NS record of {repr(subject)}")
             # We get the NS record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "NS", tcp=tcp)]
+            result = self.__resolve(subject, "NS", tcp=tcp)
             PyFunceble.LOGGER.info(f"Could get NS record of {repr(subject)}: {result}")
 
             return result
@@ -455,7 +526,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting TXT record of {repr(subject)}")
             # We get the TXT record of the given subject.
-            result = [str(x) for x in self.resolver.resolve(subject, "TXT", tcp=tcp)]
+            result = self.__resolve(subject, "TXT", tcp=tcp)
             PyFunceble.LOGGER.info(f"Could get TXT record of {repr(subject)}: {result}")
 
             return result
@@ -493,7 +564,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
                 to_request = subject
 
             # We get the PTR record of the currently read A record.
-            result = [str(x) for x in self.resolver.resolve(to_request, "PTR", tcp=tcp)]
+            result = self.__resolve(to_request, "PTR", tcp=tcp)
             PyFunceble.LOGGER.info(f"Could get PTR record of {repr(subject)}: {result}")
 
             return result
@@ -502,6 +573,47 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         return None
 
+    def get_async_dns(self):
+        """
+        Provides our asynchronous interface.
+
+        :rtype: :class:`~PyFunceble.lookup.async_dns.AsyncDNSLookup`
+        """
+
+        if self.async_dns is None:
+            self.async_dns = PyFunceble.lookup.AsyncDns(self)
+        else:
+            # Those may have been switched since its creation.
+            self.async_dns.tcp = self.tcp
+            self.async_dns.fan_out = self.fan_out
+            self.async_dns.cache = self.cache
+
+        return self.async_dns
+
+    def drop_async_dns(self):
+        """
+        Drops our asynchronous interface so that the next one
+        takes our current settings.
+        """
+
+        if self.async_dns is not None:
+            self.async_dns.close()
+            self.async_dns = None
+
+    def prefetch(self, subjects, tcp=None):
+        """
+        Requests the DNS records of the given subjects concurrently
+        and keep them for the next call of :meth:`request`.
+
+        .. note::
+            The results of the previous prefetching are dropped.
+
+        :param list subjects: The subjects we are working with.
+        :param bool tcp: Tell us to use TCP for query.
+        """
+
+        self.prefetched = self.get_async_dns().request_many(subjects, tcp=tcp)
+
     @classmethod
     def get_addr_info(cls, subject):  # pragma: no cover
         """
@@ -673,6 +785,13 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         PyFunceble.LOGGER.debug(f"{repr(subject)} is not IP. Requesting record.")
 
+        if self.fan_out and not complete:
+            # We request all record types concurrently and stop at the
+            # first positive answer (or NXDOMAIN).
+            result = self.get_async_dns().request_many([subject], tcp=tcp)
+
+            return result[subject]
+
         result = {}
 
         # We get the NS record of the given subject.
@@ -725,7 +844,10 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
             result["nameservers"] = self.resolver.nameservers
 
         PyFunceble.LOGGER.debug(
-            f"Records for {repr(subject)} (with {self.resolver.nameservers}):\n{result}"
+            "Records for %r (with %s):\n%s",
+            subject,
+            self.resolver.nameservers,
+            result,
         )
 
         return result
@@ -768,7 +890,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
             result = self.get_host_by_addr(subject)
 
-        PyFunceble.LOGGER.debug(f"Request result: \n{result}")
+        PyFunceble.LOGGER.debug("Request result: \n%s", result)
 
         return result
 
@@ -818,6 +940,11 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if tcp is None:
             tcp = self.tcp
 
+        if not complete and subject in self.prefetched:
+            PyFunceble.LOGGER.debug(f"Using the prefetched records of {repr(subject)}.")
+
+            return self.prefetched.pop(subject)
+
         result = {}
 
         if not PyFunceble.Check(subject).is_ip():
@@ -0,0 +1,260 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the DNS answer cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from collections import OrderedDict
+from multiprocessing.managers import BaseManager
+from threading import Lock
+from time import time
+
+import dns.rdatatype
+
+
+class DNSCache:
+    """
+    Bounded (LRU) cache of DNS answers.
+
+    The answers are keyed by :code:`(qname, rdtype, nameservers)` and
+    expire with the TTL of the records.
+    NXDOMAIN answers are also cached with the negative TTL given by the
+    SOA record of the zone.
+
+    :param int max_size: The maximal number of answers to keep.
+    """
+
+    default_max_size = 10000
+
+    def __init__(self, max_size=None):
+        if not isinstance(max_size, int) or max_size < 1:
+            max_size = self.default_max_size
+
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__data = OrderedDict()
+        self.__lock = Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_DNSCache__lock"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    @classmethod
+    def get_key(cls, qname, rdtype, nameservers):
+        """
+        Provides the key of the given query.
+
+        .. note::
+            A :code:`None` :code:`rdtype` represents a NXDOMAIN answer.
+
+        :rtype: tuple
+        """
+
+        return (str(qname).lower().rstrip("."), rdtype, tuple(nameservers or []))
+
+    @classmethod
+    def get_ttl_of(cls, answer):
+        """
+        Provides the TTL of the given answer.
+
+        :return: The TTL or :code:`None` if it can't be found.
+        :rtype: int, None
+        """
+
+        try:
+            return answer.rrset.ttl
+        except AttributeError:
+            return None
+
+    @classmethod
+    def get_negative_ttl_of(cls, exception):
+        """
+        Provides the TTL to use for the given NXDOMAIN exception.
+
+        .. note::
+            Following the RFC 2308, we use the minimum between the TTL
+            of the SOA record and its :code:`MINIMUM` field.
+
+        :return: The TTL or :code:`None` if it can't be found.
+        :rtype: int, None
+        """
+
+        try:
+            responses = exception.responses()
+        except (AttributeError, KeyError):
+            return None
+
+        for response in responses.values():
+            for rrset in response.authority:
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    return min([rrset.ttl] + [x.minimum for x in rrset])
+
+        return None
+
+    def get(self, qname, rdtype, nameservers):
+        """
+        Provides the cached answer of the given query.
+
+        :param str qname: The name we are querying.
+        :param str rdtype: The record type we are querying.
+        :param list nameservers: The nameservers we are querying.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (found, records)
+
+            where :code:`records` is :code:`None` if the name does
+            not exist (NXDOMAIN).
+
+        :rtype: tuple
+        """
+
+        now = time()
+
+        with self.__lock:
+            for key in [
+                self.get_key(qname, rdtype, nameservers),
+                self.get_key(qname, None, nameservers),
+            ]:
+                try:
+                    expiration, records = self.__data[key]
+                except KeyError:
+                    continue
+
+                if expiration <= now:
+                    del self.__data[key]
+                    continue
+
+                self.__data.move_to_end(key)
+                self.hits += 1
+
+                return True, records
+
+            self.misses += 1
+
+        return False, None
+
+    def put(self, qname, rdtype, nameservers, records, ttl):
+        """
+        Saves the answer of the given query.
+
+        :param str qname: The name we queried.
+        :param str rdtype: The record type we queried.
+        :param list nameservers: The nameservers we queried.
+        :param records:
+            The records we got. :code:`None` if the name does not exist (NXDOMAIN).
+        :type records: list, None
+        :param int ttl: The TTL of the answer.
+        """
+
+        if not ttl or ttl < 0:
+            return
+
+        if records is None:
+            # A NXDOMAIN is valid for all record types.
+            rdtype = None
+
+        key = self.get_key(qname, rdtype, nameservers)
+
+        with self.__lock:
+            self.__data[key] = (time() + ttl, records)
+            self.__data.move_to_end(key)
+
+            while len(self.__data) > self.max_size:
+                self.__data.popitem(last=False)
+
+    def flush(self):
+        """
+        Flushes the cache.
+        """
+
+        with self.__lock:
+            self.__data.clear()
+
+    def get_statistics(self):
+        """
+        Provides the statistics of the cache.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "hits": 0,
+                    "misses": 0,
+                    "size": 0
+                }
+
+        :rtype: dict
+        """
+
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.__data)}
+
+
+class DNSCacheManager(BaseManager):
+    """
+    Manager which let us share a :class:`DNSCache` across processes.
+    """
+
+
+DNSCacheManager.register("DNSCache", DNSCache)
@@ -78,55 +78,112 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
         - :code:`ipv6`
     """
 
+    # Saves the results of the last prefetching.
+    prefetched = {}
+    # Saves the headers to send (per user agent configuration).
+    cached_headers = {}
+
     def __init__(self, subject, subject_type):  # pragma: no cover
         subject_type = subject_type.lower()
 
         if subject_type in ["url", "file_url"]:
-            # We should work with full URL which actualy means that we have to get the
-            # http status code from the URL we are currently testing.
-
             # We disable the urllib warning.
             disable_warnings(urllib3_exceptions.InsecureRequestWarning)
 
-            # We initiate the element we have to get.
-            self.subject = subject
-        elif subject_type in ["domain", "file_domain"]:
+        # We initiate the element we have to get.
+        self.subject = self.get_url(subject, subject_type)
+
+        # We share the subject type.
+        self.subject_type = subject_type
+
+        # We set the default status code.
+        self.default = PyFunceble.HTTP_CODE.not_found_default
+
+        self.headers = self.get_headers()
+
+        PyFunceble.LOGGER.debug(f"Subject: {repr(self.subject)}")
+        PyFunceble.LOGGER.debug("Headers:\n%s", self.headers)
+
+    @classmethod
+    def get_url(cls, subject, subject_type):
+        """
+        Provides the URL to request for the given subject.
+
+        :param str subject: The subject we are working with.
+        :param str subject_type: The type of the subject we are working with.
+
+        :rtype: str
+        """
+
+        subject_type = subject_type.lower()
+
+        if subject_type in ["url", "file_url"]:
+            # We should work with full URL which actualy means that we have to get the
+            # http status code from the URL we are currently testing.
+            return subject
+
+        if subject_type in ["domain", "file_domain"]:
             # We are working with domain/IPv4.
 
             # We construct the element we have to get.
             # Note: As we may work with IP, we explicitly set the port we are
             # working with.
-            self.subject = "http://%s:80" % subject
-        elif subject_type in ["ipv6"]:
+            return "http://%s:80" % subject
+
+        if subject_type in ["ipv6"]:
             # We are working with an IPv6
 
             # We construct the element we have to get.
-            self.subject = "http://[%s]:80" % subject
-        else:
-            raise Exception("Unknow subject type.")
+            return "http://[%s]:80" % subject
 
-        # We share the subject type.
-        self.subject_type = subject_type
+        raise Exception("Unknow subject type.")
 
-        # We set the default status code.
-        self.default = PyFunceble.HTTP_CODE.not_found_default
+    @classmethod
+    def get_headers(cls):
+        """
+        Provides the headers to send.
 
-        user_agent = PyFunceble.engine.UserAgent().get()
+        .. note::
+            The headers are only constructed once per user agent configuration.
 
-        if user_agent:
-            # The user-agent is given.
+        :rtype: dict
+        """
 
-            # We append the user agent to the header we are going to parse with
-            # the request.
-            self.headers = {"User-Agent": user_agent}
-        else:
-            # The user-agent is not given or is empty.
+        key = tuple(sorted(PyFunceble.CONFIGURATION.user_agent.items()))
 
-            # We return an empty header.
-            self.headers = {}
+        if key not in cls.cached_headers:
+            user_agent = PyFunceble.engine.UserAgent().get()
 
-        PyFunceble.LOGGER.debug(f"Subject: {repr(self.subject)}")
-        PyFunceble.LOGGER.debug(f"Headers:\n{self.headers}")
+            if user_agent:
+                # The user-agent is given.
+
+                # We append the user agent to the header we are going to parse with
+                # the request.
+                cls.cached_headers[key] = {"User-Agent": user_agent}
+            else:
+                # The user-agent is not given or is empty.
+
+                # We return an empty header.
+                cls.cached_headers[key] = {}
+
+        return cls.cached_headers[key].copy()
+
+    @classmethod
+    def prefetch(cls, subjects):
+        """
+        Requests the HTTP status code of the given subjects concurrently
+        and keep them for the next call of :meth:`get`.
+
+        .. note::
+            The results of the previous prefetching are dropped.
+
+        :param list subjects:
+            A list of :code:`(subject, subject type)`.
+        """
+
+        cls.prefetched = PyFunceble.lookup.AsyncHTTPCode().request_many(
+            [cls.get_url(x, y) for x, y in subjects]
+        )
 
     def _get_it(self):  # pragma: no cover
         """
@@ -136,6 +193,13 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
         :rtype: int|None
         """
 
+        if self.subject in self.prefetched:
+            PyFunceble.LOGGER.debug(
+                f"Using the prefetched status code of {repr(self.subject)}."
+            )
+
+            return self.prefetched.pop(self.subject)
+
         try:
             # We try to get the HTTP status code.
 
@@ -50,14 +50,33 @@ License:
     limitations under the License.
 """
 
+from array import array
+from bisect import bisect_right
+from ipaddress import ip_network
+from os import stat
+from socket import AF_INET, inet_pton
+
 import PyFunceble
 
 
 class IPv4Reputation:
     """
     Let us checks a given IPv4 against the IPv4 reputation file.
+
+    The reputation file is read - once - into 2 compact sorted arrays of
+    integers (the first and the last address of each listed IPv4 or network)
+    so that a lookup is a binary search instead of a scan of the whole file.
+
+    .. note::
+        The index is stored at the class level. As we index the file before
+        starting our processes, they share it instead of building their own.
     """
 
+    # The index: (the starts, the ends).
+    index = (array("L"), array("L"))
+    # The (path, modification time, size) of the indexed file.
+    index_state = None
+
     def __init__(self):
         self.input_file = (
             PyFunceble.CONFIG_DIRECTORY
@@ -67,24 +86,134 @@ class IPv4Reputation:
         if not PyFunceble.helpers.File(self.input_file).exists():
             PyFunceble.downloader.IPv4Reputation()
 
+        self.load()
+
+    @classmethod
+    def __ipv4_to_int(cls, subject):
+        """
+        Converts the given IPv4 into an integer.
+
+        :param str subject: The subject to convert.
+
+        :return: The integer or :code:`None` if the subject is not an IPv4.
+        """
+
+        try:
+            return int.from_bytes(inet_pton(AF_INET, subject), "big")
+        except (OSError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def __get_range(cls, subject):
+        """
+        Provides the range (first and last address as integer) of the given
+        IPv4 or IPv4 network.
+
+        :param str subject: The subject to convert.
+
+        :return: The range or :code:`None` if the subject is not an IPv4.
+        :rtype: tuple
+        """
+
+        address = cls.__ipv4_to_int(subject)
+
+        if address is not None:
+            return address, address
+
+        if "/" not in subject:
+            return None
+
+        try:
+            network = ip_network(subject, strict=False)
+        except ValueError:
+            return None
+
+        if network.version != 4:
+            return None
+
+        return int(network.network_address), int(network.broadcast_address)
+
+    @classmethod
+    def get_index(cls, input_file):
+        """
+        Reads the given reputation file and provides its index.
+
+        :param str input_file: The file to read.
+
+        :return:
+            A tuple in the following format.
+
+            ::
+
+                (the sorted starts, the ends)
+
+        :rtype: tuple
+        """
+
+        ranges = []
+
+        with open(input_file, "r", encoding="utf-8") as file_stream:
+            for line in file_stream:
+                # The subject is the first field of the line.
+                subject_range = cls.__get_range(line.split("#", 1)[0].strip())
+
+                if subject_range:
+                    ranges.append(subject_range)
+
+        starts, ends = array("L"), array("L")
+
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1] + 1:
+                # The range overlaps (or touches) the previous one.
+                ends[-1] = max(ends[-1], end)
+                continue
+
+            starts.append(start)
+            ends.append(end)
+
+        return starts, ends
+
+    def load(self):
+        """
+        Indexes the input file - if it was not already indexed or if it
+        changed since its indexation.
+        """
+
+        try:
+            file_stat = stat(self.input_file)
+        except OSError:
+            return
+
+        state = (self.input_file, file_stat.st_mtime_ns, file_stat.st_size)
+
+        if IPv4Reputation.index_state != state:
+            IPv4Reputation.index = self.get_index(self.input_file)
+            IPv4Reputation.index_state = state
+
     def __is_present(self, subject):
         """
         Checks the given subject against the input file.
         """
 
-        if PyFunceble.Check(subject).is_ipv4():
-            with open(self.input_file, "r", encoding="utf-8") as file_stream:
-                for line in file_stream:
-                    if not line.startswith(subject):
-                        continue
+        starts, ends = self.index
+
+        if not starts:
+            return False
+
+        address = self.__ipv4_to_int(subject)
+
+        if address is None:
+            if PyFunceble.Check(subject).is_ipv4():
+                # We are working with an IPv4 network.
+                address = self.__get_range(subject)[0]
+            else:
+                subjects = PyFunceble.DNSLOOKUP.a_record(subject)
 
-                    return True
-        else:
-            subjects = PyFunceble.DNSLOOKUP.a_record(subject)
+                return any(self.__is_present(x) for x in subjects or [])
 
-            return any([self.__is_present(x) for x in subjects])
+        position = bisect_right(starts, address) - 1
 
-        return False
+        return position >= 0 and address <= ends[position]
 
     def __contains__(self, subject):
         return self.__is_present(subject)
@@ -58,6 +58,7 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
     """
 
     database = {}
+    trie = {}
 
     def __init__(self):
         # We initiate the destination of our database.
@@ -66,6 +67,7 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
         )
 
         self.database = self.__get_content()
+        self.trie = self.__get_trie()
 
     def __contains__(self, extension):
         return extension in self.database
@@ -82,3 +84,56 @@ class PublicSuffix:  # pragma: no cover pylint: disable=too-few-public-methods
         """
 
         return PyFunceble.helpers.Dict().from_json_file(self.destination)
+
+    def __get_trie(self):
+        """
+        Provides a trie of the suffixes of our PSL database.
+
+        The labels of the suffixes are stored from right to left.
+        The complete suffix is stored under the :code:`None` key of the
+        node of its last label.
+
+        ::
+
+            {"uk": {"co": {None: "co.uk", "blogspot": {None: "blogspot.co.uk"}}}}
+        """
+
+        result = {}
+
+        for suffixes in self.database.values():
+            for suffix in suffixes:
+                node = result
+
+                for label in reversed(suffix.split(".")):
+                    node = node.setdefault(label, {})
+
+                node[None] = suffix
+
+        return result
+
+    def get_longest_suffix(self, subject):
+        """
+        Provides the longest suffix which ends the given subject.
+
+        :param str subject: The subject to work with.
+
+        :return:
+            The suffix or :code:`None` if the subject does not
+            end with any of our suffixes.
+        :rtype: str, None
+        """
+
+        node = self.trie
+        result = None
+
+        # The first label is never part of the suffix.
+        for label in reversed(subject.rstrip(".").split(".")[1:]):
+            try:
+                node = node[label]
+            except KeyError:
+                break
+
+            if None in node:
+                result = node[None]
+
+        return result
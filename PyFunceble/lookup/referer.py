@@ -50,10 +50,10 @@ License:
     limitations under the License.
 """
 
-from random import choice
-
 import PyFunceble
 
+from .referer_cache import RefererCache
+
 
 class Referer:  # pragma: no cover pylint: disable=too-few-public-methods
     """
@@ -208,22 +208,13 @@ class Referer:  # pragma: no cover pylint: disable=too-few-public-methods
             f"Extension to get the referer for: {self.domain_extension}"
         )
 
-    def get(self):
+    def get_referer(self):
         """
-        Return the referer aka the WHOIS server of the current domain extension.
-
-        :return:
-
-            - [0] :code:`None` if there is no referer.
-
-            - [0] :code:`False` if the extension is unknown which implicitly means
-               that the subject is :code:`INVALID`
+        Return the referer aka the WHOIS server of the current domain extension
+        without resolving it.
 
-            - [0] :code:`str` The resolved IP to use.
-
-            - [1] :code:`str`, :code:`None` the domain referer.
-
-        :rtype: tuple
+        :return: The domain referer or :code:`None` if there is no referer.
+        :rtype: str, None
         """
 
         if not PyFunceble.CONFIGURATION.local:
@@ -251,21 +242,13 @@ class Referer:  # pragma: no cover pylint: disable=too-few-public-methods
                             )
 
                             # And we handle and return None status.
-                            return None, None
+                            return None
 
                         # The referer is into the database.
 
                         PyFunceble.LOGGER.debug(f"Referer: {referer}")
 
-                        resolved_referer = PyFunceble.DNSLOOKUP.a_record(referer)
-
-                        PyFunceble.LOGGER.debug(f"Resolved Referer: {resolved_referer}")
-
-                        try:
-                            # We return the extracted referer.
-                            return choice(resolved_referer), referer
-                        except (IndexError, TypeError):
-                            return None, referer
+                        return referer
 
                     # We are not authorized to use WHOIS for the test result.
 
@@ -277,4 +260,34 @@ class Referer:  # pragma: no cover pylint: disable=too-few-public-methods
         # We are running a test in a local network.
 
         # We return None.
-        return None, None
+        return None
+
+    def get(self):
+        """
+        Return the referer aka the WHOIS server of the current domain extension.
+
+        :return:
+
+            - [0] :code:`None` if there is no referer.
+
+            - [0] :code:`False` if the extension is unknown which implicitly means
+               that the subject is :code:`INVALID`
+
+            - [0] :code:`str` The resolved IP to use.
+
+            - [1] :code:`str`, :code:`None` the domain referer.
+
+        :rtype: tuple
+        """
+
+        referer = self.get_referer()
+
+        if not referer:
+            return None, None
+
+        resolved_referer = RefererCache().get(referer)
+
+        PyFunceble.LOGGER.debug(f"Resolved Referer: {resolved_referer}")
+
+        # We return the extracted referer.
+        return resolved_referer, referer
@@ -0,0 +1,171 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the cache of the resolved WHOIS servers (referers).
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from random import choice
+from threading import Lock
+from time import time
+
+import PyFunceble
+
+
+class RefererCache:
+    """
+    Cache of the resolved WHOIS servers (referers).
+
+    Instead of resolving the WHOIS server of the extension of every
+    subject, we resolve it once per :code:`whois_server_cache_refresh`
+    seconds and we go round-robin over its addresses.
+
+    .. note::
+        The cache is stored at the class level. Our processes inherit the
+        entries which were resolved before their start.
+
+    :param int refresh_interval:
+        The number of seconds before we resolve a server again.
+        :code:`0` disables the cache.
+    """
+
+    default_refresh_interval = 3600
+    # The number of seconds before we try again to resolve a server
+    # which could not be resolved.
+    negative_refresh_interval = 60
+
+    # server -> [expiration, addresses, position]
+    cache = {}
+    lock = Lock()
+
+    def __init__(self, refresh_interval=None):
+        if refresh_interval is None:
+            refresh_interval = PyFunceble.CONFIGURATION.whois_server_cache_refresh
+
+        if not isinstance(refresh_interval, int) or refresh_interval < 0:
+            refresh_interval = self.default_refresh_interval
+
+        self.refresh_interval = refresh_interval
+
+    @classmethod
+    def get_key(cls, server):
+        """
+        Provides the key of the given server.
+
+        :rtype: str
+        """
+
+        return server.lower().rstrip(".")
+
+    @classmethod
+    def resolve(cls, server):
+        """
+        Resolves the given server.
+
+        :return: The addresses of the server.
+        :rtype: list
+        """
+
+        return PyFunceble.DNSLOOKUP.a_record(server) or []
+
+    def get(self, server):
+        """
+        Provides the address to use in order to contact the given server.
+
+        :param str server: The server to resolve.
+
+        :return: The address or :code:`None` if the server could not be resolved.
+        :rtype: str, None
+        """
+
+        if not server:
+            return None
+
+        if not self.refresh_interval:
+            try:
+                return choice(self.resolve(server))
+            except IndexError:
+                return None
+
+        key = self.get_key(server)
+        now = time()
+
+        with self.lock:
+            entry = self.cache.get(key)
+
+            if entry is None or entry[0] <= now:
+                addresses = self.resolve(server)
+
+                entry = self.cache[key] = [
+                    now
+                    + (
+                        self.refresh_interval
+                        if addresses
+                        else min(self.refresh_interval, self.negative_refresh_interval)
+                    ),
+                    addresses,
+                    0,
+                ]
+
+            _, addresses, position = entry
+
+            if not addresses:
+                return None
+
+            entry[2] = (position + 1) % len(addresses)
+
+            return addresses[position]
+
+    @classmethod
+    def flush(cls):
+        """
+        Flushes the cache.
+        """
+
+        with cls.lock:
+            cls.cache.clear()
@@ -58,15 +58,28 @@ from urllib3.exceptions import InsecureRequestWarning
 
 import PyFunceble
 
+from .dns_cache import DNSCache
+
 
 class HostSSLAdapter(requests.adapters.HTTPAdapter):
     """
     Extends the build-in HTTP Adapter for urllib3 for our needs.
     """
 
-    def __resolve_with_cache(self, hostname):
+    # The cache we use when the DNS lookup interface does not have one.
+    resolve_cache = DNSCache(max_size=1000)
+    # The number of seconds we keep a resolution in our own cache.
+    resolve_cache_ttl = 60
+
+    @classmethod
+    def resolve_with_cache(cls, hostname):
         """
-        Resolve the IP of the given hostname.
+        Resolve the IP of the given hostname through a cache.
+
+        .. note::
+            When the DNS lookup interface has a cache, we use it. Otherwise,
+            we use our own (bounded) cache which is shared between all
+            adapters.
 
         :param str hostname: The hostname to resolve.
 
@@ -74,13 +87,32 @@ class HostSSLAdapter(requests.adapters.HTTPAdapter):
         :rtype: None, str
         """
 
-        if not hasattr(self, "__resolve_cache"):
-            # pylint:disable=attribute-defined-outside-init
-            self.__resolve_cache = {hostname: self.resolve(hostname)}
-        elif hostname not in self.__resolve_cache:
-            self.__resolve_cache[hostname] = self.resolve(hostname)
+        try:
+            dns_cache = PyFunceble.DNSLOOKUP.cache
+            nameservers = PyFunceble.DNSLOOKUP.resolver.nameservers
+        except AttributeError:
+            dns_cache, nameservers = None, None
 
-        return self.__resolve_cache[hostname]
+        if dns_cache is not None:
+            # The DNS lookup interface keeps the answers until their TTL expire.
+            return cls.resolve(hostname)
+
+        found, records = cls.resolve_cache.get(hostname, "A", nameservers)
+
+        if found:
+            return records[0] if records else None
+
+        result = cls.resolve(hostname)
+
+        cls.resolve_cache.put(
+            hostname,
+            "A",
+            nameservers,
+            [result] if result else None,
+            cls.resolve_cache_ttl,
+        )
+
+        return result
 
     @classmethod
     def resolve(cls, hostname):
@@ -126,7 +158,7 @@ class HostSSLAdapter(requests.adapters.HTTPAdapter):
         """
 
         parsed_url = urlparse(request.url)
-        hostname_ip = self.__resolve_with_cache(parsed_url.hostname)
+        hostname_ip = HostSSLAdapter.resolve_with_cache(parsed_url.hostname)
 
         PyFunceble.LOGGER.info(
             f"{parsed_url}, {hostname_ip}, {parsed_url.scheme}, {kwargs}"
@@ -170,24 +202,6 @@ class HostAdapter(requests.adapters.HTTPAdapter):
     Extends the build-in HTTP Adapter for urllib3 for our needs.
     """
 
-    def __resolve_with_cache(self, hostname):
-        """
-        Resolve the IP of the given hostname.
-
-        :param str hostname: The hostname to resolve.
-
-        :return: The IP of the host name or the hostname itself.
-        :rtype: None, str
-        """
-
-        if not hasattr(self, "__resolve_cache"):
-            # pylint:disable=attribute-defined-outside-init
-            self.__resolve_cache = {hostname: HostSSLAdapter.resolve(hostname)}
-        elif hostname not in self.__resolve_cache:
-            self.__resolve_cache[hostname] = HostSSLAdapter.resolve(hostname)
-
-        return self.__resolve_cache[hostname]
-
     # pylint: disable=arguments-differ
     def send(self, request, **kwargs):
         """
@@ -211,7 +225,7 @@ class HostAdapter(requests.adapters.HTTPAdapter):
         """
 
         parsed_url = urlparse(request.url)
-        hostname_ip = self.__resolve_with_cache(parsed_url.hostname)
+        hostname_ip = HostSSLAdapter.resolve_with_cache(parsed_url.hostname)
 
         PyFunceble.LOGGER.info(
             f"{parsed_url}, {hostname_ip}, {parsed_url.scheme}, {kwargs}"
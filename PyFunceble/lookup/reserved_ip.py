@@ -0,0 +1,316 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the reserved IP lookup interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from bisect import bisect_right
+from ipaddress import IPv6Address, ip_interface, ip_network
+from socket import AF_INET, AF_INET6, inet_pton
+
+
+# pylint: disable=line-too-long
+class ReservedIP:
+    """
+    Let us check if a given IPv4 or IPv6 is reserved.
+
+    The reserved blocks are converted - once - into 2 sorted lists of
+    integers (the first and the last address of each block) so that a lookup
+    is only a conversion into an integer and a binary search.
+
+    .. note::
+        The blocks have been written on basis of the following links:
+
+        * https://en.wikipedia.org/wiki/Reserved_IP_addresses
+
+        * https://www.iana.org/assignments/iana-ipv4-special-registry/iana-ipv4-special-registry.xhtml
+
+        * https://www.iana.org/assignments/iana-ipv6-special-registry/iana-ipv6-special-registry.xhtml
+    """
+
+    RESERVED_IPV4 = [
+        # Match 0.0.0.0–0.255.255.255
+        "0.0.0.0/8",
+        # Match 10.0.0.0–10.255.255.255
+        "10.0.0.0/8",
+        # Match 100.64.0.0–100.127.255.255
+        "100.64.0.0/10",
+        # Match 127.0.0.0–127.255.255.255
+        "127.0.0.0/8",
+        # Match 169.254.0.0–169.254.255.255
+        "169.254.0.0/16",
+        # Match 172.16.0.0–172.31.255.255
+        "172.16.0.0/12",
+        # Match 192.0.0.0–192.0.0.255
+        "192.0.0.0/24",
+        # Match 192.0.2.0–192.0.2.255
+        "192.0.2.0/24",
+        # Match 192.31.196.0–192.31.196.255
+        "192.31.196.0/24",
+        # Match 192.52.193.0–192.52.193.255
+        "192.52.193.0/24",
+        # Match 192.88.99.0–192.88.99.255
+        "192.88.99.0/24",
+        # Match 192.168.0.0–192.168.255.255
+        "192.168.0.0/16",
+        # Match 192.175.48.0-192.175.48.255
+        "192.175.48.0/24",
+        # Match 198.18.0.0–198.19.255.255
+        "198.18.0.0/15",
+        # Match 198.51.100.0–198.51.100.255
+        "198.51.100.0/24",
+        # Match 203.0.113.0–203.0.113.255
+        "203.0.113.0/24",
+        # Match 224.0.0.0–239.255.255.255
+        "224.0.0.0/4",
+        # Match 240.0.0.0–255.255.255.255
+        "240.0.0.0/4",
+    ]
+
+    RESERVED_IPV6 = [
+        # Unspecified, loopback, IPv4-compatible, IPv4-mapped and NAT64.
+        "::/8",
+        # NAT64 (local-use).
+        "64:ff9b:1::/48",
+        # Discard-only and other reserved blocks.
+        "100::/8",
+        "200::/7",
+        "400::/6",
+        "800::/5",
+        "1000::/4",
+        # IETF protocol assignments (includes ORCHIDv2, Teredo, ...).
+        "2001::/23",
+        # Documentation.
+        "2001:db8::/32",
+        # Reserved by IETF.
+        "4000::/3",
+        "6000::/3",
+        "8000::/3",
+        "a000::/3",
+        "c000::/3",
+        "e000::/4",
+        "f000::/5",
+        "f800::/6",
+        # Unique local.
+        "fc00::/7",
+        # Reserved by IETF.
+        "fe00::/9",
+        # Link-local.
+        "fe80::/10",
+        # Multicast.
+        "ff00::/8",
+    ]
+
+    ipv4_table = None
+    ipv6_table = None
+
+    def __init__(self):
+        if self.ipv4_table is None:
+            ReservedIP.ipv4_table = self.__get_table(self.RESERVED_IPV4)
+
+        if self.ipv6_table is None:
+            ReservedIP.ipv6_table = self.__get_table(self.RESERVED_IPV6)
+
+    @classmethod
+    def __get_table(cls, blocks):
+        """
+        Converts the given list of blocks into a tuple of 2 sorted lists:
+        the first and the last address (as integer) of each merged block.
+
+        :param list blocks: The blocks to convert.
+
+        :rtype: tuple
+        """
+
+        starts, ends = [], []
+
+        for start, end in sorted(
+            (int(x.network_address), int(x.broadcast_address))
+            for x in map(ip_network, blocks)
+        ):
+            if ends and start <= ends[-1] + 1:
+                # The block overlaps (or touches) the previous one.
+                ends[-1] = max(ends[-1], end)
+                continue
+
+            starts.append(start)
+            ends.append(end)
+
+        return starts, ends
+
+    @classmethod
+    def __in_table(cls, address, table):
+        """
+        Checks if the given integer address is into the given table.
+
+        :param int address: The address to look for.
+        :param tuple table: The table to look into.
+
+        :rtype: bool
+        """
+
+        starts, ends = table
+        index = bisect_right(starts, address) - 1
+
+        return index >= 0 and address <= ends[index]
+
+    @classmethod
+    def __ipv4_to_int(cls, subject):
+        """
+        Converts the given IPv4 (or the address part of the given IPv4
+        network) into an integer.
+
+        :param str subject: The subject to convert.
+
+        :return: The integer or :code:`None` if the subject is not an IPv4.
+        """
+
+        try:
+            return int.from_bytes(inet_pton(AF_INET, subject), "big")
+        except (OSError, TypeError, ValueError):
+            pass
+
+        if not isinstance(subject, str) or "/" not in subject:
+            return None
+
+        try:
+            interface = ip_interface(subject)
+        except ValueError:
+            try:
+                ip_network(subject, strict=False)
+            except ValueError:
+                return None
+
+            # The prefix is not a valid one for an interface (eg: a netmask).
+            # We only look at the address part.
+            return cls.__ipv4_to_int(subject.split("/", 1)[0])
+
+        if interface.version != 4:
+            return None
+
+        return int(interface.ip)
+
+    @classmethod
+    def __ipv6_to_int(cls, subject):
+        """
+        Converts the given IPv6 into an integer.
+
+        .. note::
+            IPv6 networks are not converted.
+
+        :param str subject: The subject to convert.
+
+        :return: The integer or :code:`None` if the subject is not an IPv6.
+        """
+
+        try:
+            return int.from_bytes(inet_pton(AF_INET6, subject), "big")
+        except (OSError, TypeError, ValueError):
+            pass
+
+        if not isinstance(subject, str) or ":" not in subject or "/" in subject:
+            return None
+
+        try:
+            # Handles, for example, the scope ids.
+            return int(IPv6Address(subject))
+        except ValueError:
+            return None
+
+    def is_reserved_ipv4(self, subject):
+        """
+        Checks if the given subject is a reserved IPv4.
+
+        :param str subject: The subject to check.
+
+        :rtype: bool
+        """
+
+        address = self.__ipv4_to_int(subject)
+
+        return address is not None and self.__in_table(address, self.ipv4_table)
+
+    def is_reserved_ipv6(self, subject):
+        """
+        Checks if the given subject is a reserved IPv6.
+
+        :param str subject: The subject to check.
+
+        :rtype: bool
+        """
+
+        address = self.__ipv6_to_int(subject)
+
+        return address is not None and self.__in_table(address, self.ipv6_table)
+
+    def is_reserved(self, subject):
+        """
+        Checks if the given subject is a reserved IPv4 or IPv6.
+
+        :param str subject: The subject to check.
+
+        :rtype: bool
+        """
+
+        return self.is_reserved_ipv4(subject) or self.is_reserved_ipv6(subject)
+
+    def are_reserved(self, subjects):
+        """
+        Checks if each of the given subjects is a reserved IPv4 or IPv6.
+
+        :param list subjects: The subjects to check.
+
+        :return: A list of :code:`bool` in the same order as the subjects.
+        :rtype: list
+        """
+
+        return [self.is_reserved(x) for x in subjects]
+
+    def __contains__(self, subject):
+        return self.is_reserved(subject)
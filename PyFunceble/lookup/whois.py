@@ -50,7 +50,7 @@ License:
     limitations under the License.
 """
 
-from random import choice
+from re import compile as re_compile
 from socket import AF_INET, SOCK_STREAM
 from socket import error as socket_error
 from socket import socket
@@ -59,6 +59,8 @@ from socket import timeout as socket_timeout
 import PyFunceble
 
 from .referer import Referer
+from .referer_cache import RefererCache
+from .whois_limiter import WhoisLimiter
 
 
 class WhoisLookup:
@@ -85,6 +87,14 @@ class WhoisLookup:
     # Set the size of the buffer which extrating
     # the expiration date.
     buffer_size = 4096
+    # Set the regex which tells us that a server is throttling us.
+    throttled_regex = re_compile(
+        r"(?i)(limit exceeded|exceeded the (query |allowed )?limit|"
+        r"too many (requests|queries|connections)|queries exceeded)"
+    )
+    # Set the maximal length of a response which tells us that a server is
+    # throttling us. (Longer responses are real records.)
+    throttled_max_length = 1024
 
     def __init__(self, subject, server=None, timeout=3):
         if subject:
@@ -107,13 +117,9 @@ class WhoisLookup:
             if isinstance(server, str):
                 # The server is a str.
 
-                resolved_server = PyFunceble.DNSLOOKUP.a_record(server)
-
-                try:
-                    # We share it.
-                    self.server = choice(resolved_server)
-                except (IndexError, TypeError):
-                    self.server = None
+                # We share it.
+                self.referer = server
+                self.server = RefererCache().get(server)
             else:
                 # The server is not a str.
 
@@ -123,7 +129,7 @@ class WhoisLookup:
             # The server is not given or is None.
 
             # We get the server.
-            self.server = Referer(self.subject).get()[0]
+            self.server, self.referer = Referer(self.subject).get()
 
         if timeout:
             # The timeout is given.
@@ -139,66 +145,81 @@ class WhoisLookup:
                 # We eaise an exception.
                 raise ValueError("`timeout` must be an integer or float.")
 
-    def request(self):  # pragma: no cover
-        """
-        Perform the WHOIS request.
+    def __get_response(self, limiter):  # pragma: no cover
         """
+        Sends the request to the server and reads its response.
 
-        result = None
+        :param limiter: The limiter of the server.
+        :type limiter: :class:`~PyFunceble.lookup.whois_limiter.WhoisLimiter`
 
-        if self.server and self.subject:
-            # A server was found or is given.
-
-            # We initiate a socket for the request.
-            req = socket(AF_INET, SOCK_STREAM)
+        :return: The raw response or :code:`None` if something went wrong.
+        :rtype: bytearray, None
+        """
 
+        # We initiate a socket for the request.
+        with socket(AF_INET, SOCK_STREAM) as req:
             # We set the timeout.
             req.settimeout(self.timeout)
 
             try:
                 # We try to connect to the whois server at the port 43.
                 req.connect((self.server, self.universal_port))
-            except socket_error:
-                return result
 
-            # We send and encode the domain we want the information from.
-            req.send("{}\r\n".format(self.subject).encode())
+                # We send and encode the domain we want the information from.
+                req.sendall("{}\r\n".format(self.subject).encode())
+            except socket_error:
+                limiter.record("errors")
+                return None
 
-            # We initiate a bytes variable which will save the response from the server.
-            response = bytes("", "utf-8")
+            # We initiate the buffer which will save the response from the server.
+            response = bytearray()
+            chunk = memoryview(bytearray(self.buffer_size))
 
             while True:
                 # We loop infinitly
 
                 try:
-                    data = req.recv(self.buffer_size)
+                    size = req.recv_into(chunk)
                 except (ConnectionResetError, socket_timeout):
                     # We got an error.
+                    limiter.record("errors")
+                    return None
 
-                    # We close the connection.
-                    req.close()
+                if not size:
+                    # The server closed the connection.
+                    break
 
-                    # And we return the result.
-                    return result
+                # We append the data to the response.
+                response += chunk[:size]
 
-                # Eerything goes right.
+        return response
 
-                # We append the data to the response.
-                response += data
+    def request(self):  # pragma: no cover
+        """
+        Perform the WHOIS request.
+        """
 
-                if not data:
-                    # The data is empty or equal to None.
+        result = None
 
-                    # We close the connection.
-                    req.close()
+        if self.server and self.subject:
+            # A server was found or is given.
 
-                    # And we break the loop.
-                    break
+            # The limiter is shared by all the addresses of the server.
+            limiter = WhoisLimiter.get_instance(self.referer or self.server)
 
-            try:
-                # We finally decode and return the response we got from the server.
+            with limiter:
+                response = self.__get_response(limiter)
 
-                return response.decode()
+            if response is None:
+                return result
+
+            if not response:
+                limiter.record("empty")
+                return result
+
+            try:
+                # We finally decode the response we got from the server.
+                result = response.decode()
             except UnicodeDecodeError:
                 # We may get a decoding error.
 
@@ -206,7 +227,19 @@ class WhoisLookup:
                 # Note: Because we don't want to deal with other issue, we
                 # decided to use `replace` in order to automatically replace
                 # all non utf-8 encoded characters.
-                return response.decode("utf-8", "replace")
+                result = response.decode("utf-8", "replace")
+
+            if len(result) <= self.throttled_max_length and self.throttled_regex.search(
+                result
+            ):
+                # The server is telling us that we are sending too many requests.
+                limiter.record("throttled")
+
+                PyFunceble.LOGGER.info(
+                    f"[{self.subject}] Throttled by the WHOIS server {self.server}."
+                )
+
+            return result
 
         # The whois server is not given nor found.
 
@@ -0,0 +1,265 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the rate limiter of the WHOIS servers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+
+import PyFunceble
+
+
+class WhoisLimiter:
+    """
+    Rate limiter of a WHOIS server.
+
+    Each server gets a token bucket (:code:`rate_limit` requests per second)
+    and a bounded number of concurrent requests. We also keep some
+    statistics about the requests we sent to the server.
+
+    .. note::
+        The limiters are stored at the class level. They are not shared
+        between our processes. Therefore, under the worker pool mode, the
+        rate limit is split between our (long-lived) workers so that the
+        server does not get more than :code:`rate_limit` requests per second
+        from all of them.
+
+        Under the default multiprocessing mode, each subject is tested by
+        a new process which starts with a fresh copy of the buckets.
+        Therefore, the rate limit only applies to the requests of a single
+        subject.
+
+    :param str server:
+        The server to limit. It should be its hostname (e.g. the referer)
+        rather than one of its addresses.
+    :param float rate_limit:
+        The maximal number of requests per second. :code:`0` disables
+        the rate limiting.
+    :param int max_concurrency: The maximal number of concurrent requests.
+    """
+
+    default_rate_limit = 0.0
+    default_max_concurrency = 2
+    # The number of seconds we wait before talking again to a server
+    # which told us that we are sending too many requests.
+    throttled_penalty = 5.0
+
+    # server -> limiter
+    instances = {}
+    instances_lock = Lock()
+
+    def __init__(self, server, rate_limit=None, max_concurrency=None):
+        if rate_limit is None:
+            rate_limit = PyFunceble.CONFIGURATION.whois_rate_limit
+
+        if not isinstance(rate_limit, (int, float)) or rate_limit < 0:
+            rate_limit = self.default_rate_limit
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            max_concurrency = self.default_max_concurrency
+
+        if (
+            PyFunceble.CONFIGURATION.multiprocess
+            and PyFunceble.CONFIGURATION.multiprocess_worker_pool
+            and PyFunceble.CONFIGURATION.maximal_processes > 1
+        ):
+            # Each of our workers has its own bucket.
+            rate_limit /= PyFunceble.CONFIGURATION.maximal_processes
+
+        self.server = server
+        self.rate_limit = float(rate_limit)
+
+        self.bucket = {
+            # The bucket can hold at most 1 second worth of tokens.
+            "capacity": max(1.0, self.rate_limit),
+            "tokens": max(1.0, self.rate_limit),
+            "updated_at": monotonic(),
+            "blocked_until": 0.0,
+        }
+
+        self.semaphore = BoundedSemaphore(max_concurrency)
+        self.lock = Lock()
+
+        self.statistics = {
+            "requests": 0,
+            "waited": 0,
+            "throttled": 0,
+            "empty": 0,
+            "errors": 0,
+        }
+
+    def __enter__(self):
+        self.acquire()
+
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    @classmethod
+    def get_instance(cls, server):
+        """
+        Provides the limiter of the given server.
+
+        :param str server: The server to limit.
+
+        :rtype: WhoisLimiter
+        """
+
+        with cls.instances_lock:
+            if server not in cls.instances:
+                cls.instances[server] = cls(server)
+
+            return cls.instances[server]
+
+    @classmethod
+    def get_statistics(cls):
+        """
+        Provides the statistics of all limiters.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "server": {
+                        "requests": 0,
+                        "waited": 0,
+                        "throttled": 0,
+                        "empty": 0,
+                        "errors": 0
+                    }
+                }
+
+        :rtype: dict
+        """
+
+        with cls.instances_lock:
+            return {x: y.statistics.copy() for x, y in cls.instances.items()}
+
+    def __get_waiting_time(self):
+        """
+        Takes a token from the bucket or provides the number of seconds
+        to wait before one is available.
+
+        :rtype: float
+        """
+
+        now = monotonic()
+
+        with self.lock:
+            if self.bucket["blocked_until"] > now:
+                return self.bucket["blocked_until"] - now
+
+            if not self.rate_limit:
+                return 0.0
+
+            self.bucket["tokens"] = min(
+                self.bucket["capacity"],
+                self.bucket["tokens"]
+                + (now - self.bucket["updated_at"]) * self.rate_limit,
+            )
+            self.bucket["updated_at"] = now
+
+            if self.bucket["tokens"] >= 1:
+                self.bucket["tokens"] -= 1
+                return 0.0
+
+            return (1 - self.bucket["tokens"]) / self.rate_limit
+
+    def acquire(self):
+        """
+        Waits until we are allowed to send a request to the server.
+        """
+
+        # The slot is given back by release(), which may be called
+        # from another method (e.g. our __exit__).
+        self.semaphore.acquire()  # pylint: disable=consider-using-with
+
+        waited = False
+
+        while True:
+            waiting_time = self.__get_waiting_time()
+
+            if not waiting_time:
+                break
+
+            waited = True
+            sleep(waiting_time)
+
+        with self.lock:
+            self.statistics["requests"] += 1
+
+            if waited:
+                self.statistics["waited"] += 1
+
+    def release(self):
+        """
+        Releases the slot we took through :code:`acquire`.
+        """
+
+        self.semaphore.release()
+
+    def record(self, event):
+        """
+        Records the given event.
+
+        :param str event: One of :code:`throttled`, :code:`empty` or :code:`errors`.
+        """
+
+        with self.lock:
+            self.statistics[event] += 1
+
+            if event == "throttled":
+                # We stop talking to the server for a while.
+                self.bucket["blocked_until"] = monotonic() + self.throttled_penalty
+                self.bucket["updated_at"] = self.bucket["blocked_until"]
+                self.bucket["tokens"] = 0.0
@@ -52,7 +52,9 @@ License:
 
 from .clean import Clean
 from .constructor import Constructor
+from .counter import Counter
 from .generate import Generate
 from .logs import Logs
 from .percentage import Percentage
 from .prints import Prints
+from .writer import Writer
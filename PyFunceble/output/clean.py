@@ -170,6 +170,18 @@ class Clean:
             "{0}{1}".format(directory, PyFunceble.OUTPUTS.default_files.mining)
         )
 
+        # We append the journals of the inactive and mining database files.
+        result.append(
+            PyFunceble.database.Journal(
+                "{0}{1}".format(directory, PyFunceble.OUTPUTS.default_files.inactive_db)
+            ).path
+        )
+        result.append(
+            PyFunceble.database.Journal(
+                "{0}{1}".format(directory, PyFunceble.OUTPUTS.default_files.mining)
+            ).path
+        )
+
         # We append the hashes tracker file.
         result.append(
             "{0}{1}".format(
@@ -222,6 +234,9 @@ class Clean:
             ):  # pragma: no cover
                 to_delete.extend(self.databases_to_delete())
 
+            # We write what is still waiting to be written before deleting.
+            PyFunceble.output.Writer.close()
+
             for file in to_delete:
                 # We loop through the list of file to delete.
 
@@ -233,6 +248,7 @@ class Clean:
             if PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
 
                 if file_path:
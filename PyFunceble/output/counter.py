@@ -0,0 +1,179 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the status counter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import PyFunceble
+
+
+class Counter:
+    """
+    Provides a compact counter of the number of tested subjects per status.
+
+    The numbers are saved into an array of integers and the bucket (index)
+    of each status is precomputed from the list of statuses, so that each
+    count only costs a dictionnary lookup.
+
+    :param dict init:
+        The numbers to start from (e.g. from a previous session).
+    """
+
+    # The statuses we count. Each of them is an index of
+    # :code:`PyFunceble.STATUS.official`.
+    statuses = ("up", "down", "invalid", "valid", "malicious", "sane")
+
+    # The bucket of each index. The last one is the number of tested.
+    indexes = {x: i for i, x in enumerate(statuses + ("tested",))}
+
+    def __init__(self, init=None):
+        self.numbers = [0] * len(self.indexes)
+        # The bucket of each status. Constructed when we need it.
+        self.buckets = None
+
+        if init:
+            self.update(init)
+
+    def __getitem__(self, index):
+        return self.numbers[self.indexes[index]]
+
+    def __setitem__(self, index, value):
+        self.numbers[self.indexes[index]] = value
+
+    def __contains__(self, index):
+        return index in self.indexes
+
+    def __iter__(self):
+        return iter(self.indexes)
+
+    def __repr__(self):  # pragma: no cover
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    @classmethod
+    def get_buckets(cls):
+        """
+        Provides the bucket of each known status.
+
+        :return:
+            A dict in the following format.
+
+            ::
+
+                {
+                    "the status": the index of its bucket
+                }
+
+        :rtype: dict
+        """
+
+        result = {}
+
+        for index, status in enumerate(cls.statuses):
+            official = PyFunceble.STATUS.official[status]
+
+            result[official] = index
+            result[official.lower()] = index
+
+        for index, status in enumerate(cls.statuses):
+            for alias in PyFunceble.STATUS.list[status] or []:
+                result.setdefault(alias, index)
+
+        return result
+
+    def count(self, status):
+        """
+        Increments the number of tested and the number of the given status.
+
+        :param str status: The status to increment.
+
+        .. note::
+            An unknown status is counted as :code:`invalid`.
+        """
+
+        if self.buckets is None:
+            self.buckets = self.get_buckets()
+
+        try:
+            index = self.buckets[status]
+        except KeyError:
+            index = self.buckets.get(status.lower(), self.indexes["invalid"])
+
+        self.numbers[index] += 1
+        self.numbers[-1] += 1
+
+    def update(self, numbers):
+        """
+        Updates the numbers from the given dict.
+
+        :param dict numbers: The numbers to set.
+
+        .. note::
+            The unknown indexes are ignored.
+        """
+
+        for index, value in numbers.items():
+            if index in self.indexes:
+                self[index] = value
+
+    def reset(self):
+        """
+        Resets all numbers to :code:`0`.
+        """
+
+        self.numbers = [0] * len(self.indexes)
+        self.buckets = None
+
+    def to_dict(self):
+        """
+        Provides the numbers as a dict.
+
+        :rtype: dict
+        """
+
+        return dict(zip(self.indexes, self.numbers))
@@ -170,7 +170,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
         ):
             return bool(PyFunceble.CONFIGURATION.api_file_generation)
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             return self.end
 
         return not PyFunceble.CONFIGURATION.no_files
@@ -85,31 +85,8 @@ class Percentage:
         if self.status:
             # The status is parsed.
 
-            # We increase the number of tested.
-            PyFunceble.INTERN["counter"]["number"]["tested"] += 1
-
-            if (
-                self.status.lower() in PyFunceble.STATUS.list.up
-                or self.status.lower() in PyFunceble.STATUS.list.valid
-                or self.status.lower() in PyFunceble.STATUS.list.sane
-            ):
-                # The status is in the list of up status.
-
-                # We increase the number of up.
-                PyFunceble.INTERN["counter"]["number"]["up"] += 1
-            elif (
-                self.status.lower() in PyFunceble.STATUS.list.down
-                or self.status.lower() in PyFunceble.STATUS.list.malicious
-            ):
-                # The status is in the list of down status.
-
-                # We increase the number of down.
-                PyFunceble.INTERN["counter"]["number"]["down"] += 1
-            else:
-                # The status is not in the list of up nor down status.
-
-                # We increase the number of invalid.
-                PyFunceble.INTERN["counter"]["number"]["invalid"] += 1
+            # We increase the number of tested and the number of the status.
+            PyFunceble.INTERN["counter"]["number"].count(self.status)
 
     @classmethod
     def calculate(cls):
@@ -201,8 +178,6 @@ class Percentage:
 
                 # And we unset the INACTIVE line.
                 del lines_to_print[1]
-                del PyFunceble.INTERN["counter"]["number"]["down"]
-                del PyFunceble.INTERN["counter"]["number"]["up"]
 
             if PyFunceble.CONFIGURATION.reputation:
                 # We are checking for reputation.
@@ -226,9 +201,6 @@ class Percentage:
 
                 # And we unset the INVALID line.
                 del lines_to_print[2]
-                del PyFunceble.INTERN["counter"]["number"]["invalid"]
-                del PyFunceble.INTERN["counter"]["number"]["up"]
-                del PyFunceble.INTERN["counter"]["number"]["down"]
 
             if (
                 not PyFunceble.CONFIGURATION.quiet
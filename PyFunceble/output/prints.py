@@ -82,6 +82,16 @@ class Prints:
         Tell us if we only have to print on file and not on screen.
     """
 
+    headers_cache = {}
+    """
+    The list of header we already constructed (per set of official status).
+    """
+
+    formats_cache = {}
+    """
+    The format of the lines we already constructed (per spacement).
+    """
+
     def __init__(self, to_print, template, output_file=None, only_on_file=False):
         # We get the template.
         self.template = template
@@ -92,78 +102,14 @@ class Prints:
         # We get the state of the only on file.
         self.only_on_file = only_on_file
 
-        # We initiate the variable which will save the list of header.
-        # Note: We initiate an Ordered Dict because we want to keep
-        # the order.
-        self.headers = OrderedDict()
-
         PyFunceble.LOGGER.debug(f"Template: {self.template}")
         PyFunceble.LOGGER.debug(f"Destination: {self.output}")
-        PyFunceble.LOGGER.debug(f"Data to print:\n{self.data_to_print}")
+        PyFunceble.LOGGER.debug("Data to print:\n%s", self.data_to_print)
         PyFunceble.LOGGER.debug(f"Only print on file: {self.only_on_file}")
 
-        # We iniate the Generic header and the spacement of each colomns.
-        self.headers["Generic"] = OrderedDict(
-            zip(
-                [
-                    "Subject",
-                    "Status",
-                    "Expiration Date",
-                    "Source",
-                    "HTTP Code",
-                    "Analyze Date",
-                ],
-                [100, 11, 17, 10, 10, 20],
-            )
-        )
-
-        # We iniate the official UP header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.up] = OrderedDict(
-            zip(
-                ["Subject", "Expiration Date", "Source", "HTTP Code", "Analyze Date"],
-                [100, 17, 10, 10, 20],
-            )
-        )
-
-        # We iniate the official VALID header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.valid] = OrderedDict(
-            zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
-        )
-
-        # We iniate the official SANE header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.sane] = OrderedDict(
-            zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
-        )
-
-        # We iniate the official MALICIOUS header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.malicious] = OrderedDict(
-            zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
-        )
-
-        # We iniate the official DOWN header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.down] = OrderedDict(
-            zip(
-                [
-                    "Subject",
-                    "WHOIS Server",
-                    "Status",
-                    "Source",
-                    "HTTP Code",
-                    "Analyze Date",
-                ],
-                [100, 35, 11, 10, 10, 20],
-            )
-        )
-
-        # We iniate the official INVALID header and the spacement of each colomns.
-        self.headers[PyFunceble.STATUS.official.invalid] = OrderedDict(
-            zip(["Subject", "Source", "HTTP Code", "Analyze Date"], [100, 10, 10, 20])
-        )
-
-        # We iniate the official LESS header and the spacement of each colomns.
-        self.headers["Less"] = OrderedDict(
-            zip(["Subject", "Status", "HTTP Code"], [100, 11, 10])
-        )
+        # We get the list of header.
+        # Note: We copy it because it is shared between all instances.
+        self.headers = self.get_headers().copy()
 
         try:
             # We iniate the official Simple header and the spacement of each colomns.
@@ -173,21 +119,120 @@ class Prints:
         except TypeError:
             pass
 
-        # We iniate the official Percentage header and the spacement of each colomns.
-        self.headers["Percentage"] = OrderedDict(
-            zip(["Status", "Percentage", "Numbers"], [11, 12, 12])
-        )
-
-        # We iniate the official HTTP header and the spacement of each colomns.
-        self.headers["HTTP"] = OrderedDict(
-            zip(["Subject", "Status", "HTTP Code", "Analyze Date"], [100, 11, 10, 20])
-        )
-
         # We initiate a variable which will save the currently in use header.
         self.currently_used_header = {}
 
         # We initate a instance of the file output.
-        self.file_output_instance = PyFunceble.helpers.File(self.output)
+        self.file_output_instance = PyFunceble.output.Writer(self.output)
+
+    @classmethod
+    def get_headers(cls):
+        """
+        Provides the list of header and the spacement of each of their colomns.
+
+        .. warning::
+            The provided list and headers are shared. Please copy them
+            before modifying them.
+
+        :rtype: OrderedDict
+        """
+
+        key = tuple(PyFunceble.STATUS.official.values())
+
+        if key not in cls.headers_cache:
+            # We initiate the variable which will save the list of header.
+            # Note: We initiate an Ordered Dict because we want to keep
+            # the order.
+            headers = OrderedDict()
+
+            # We iniate the Generic header and the spacement of each colomns.
+            headers["Generic"] = OrderedDict(
+                zip(
+                    [
+                        "Subject",
+                        "Status",
+                        "Expiration Date",
+                        "Source",
+                        "HTTP Code",
+                        "Analyze Date",
+                    ],
+                    [100, 11, 17, 10, 10, 20],
+                )
+            )
+
+            # We iniate the official UP header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.up] = OrderedDict(
+                zip(
+                    [
+                        "Subject",
+                        "Expiration Date",
+                        "Source",
+                        "HTTP Code",
+                        "Analyze Date",
+                    ],
+                    [100, 17, 10, 10, 20],
+                )
+            )
+
+            # We iniate the official VALID header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.valid] = OrderedDict(
+                zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
+            )
+
+            # We iniate the official SANE header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.sane] = OrderedDict(
+                zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
+            )
+
+            # We iniate the official MALICIOUS header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.malicious] = OrderedDict(
+                zip(["Subject", "Source", "Analyze Date"], [100, 10, 20])
+            )
+
+            # We iniate the official DOWN header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.down] = OrderedDict(
+                zip(
+                    [
+                        "Subject",
+                        "WHOIS Server",
+                        "Status",
+                        "Source",
+                        "HTTP Code",
+                        "Analyze Date",
+                    ],
+                    [100, 35, 11, 10, 10, 20],
+                )
+            )
+
+            # We iniate the official INVALID header and the spacement of each colomns.
+            headers[PyFunceble.STATUS.official.invalid] = OrderedDict(
+                zip(
+                    ["Subject", "Source", "HTTP Code", "Analyze Date"],
+                    [100, 10, 10, 20],
+                )
+            )
+
+            # We iniate the official LESS header and the spacement of each colomns.
+            headers["Less"] = OrderedDict(
+                zip(["Subject", "Status", "HTTP Code"], [100, 11, 10])
+            )
+
+            # We iniate the official Percentage header and the spacement of each colomns.
+            headers["Percentage"] = OrderedDict(
+                zip(["Status", "Percentage", "Numbers"], [11, 12, 12])
+            )
+
+            # We iniate the official HTTP header and the spacement of each colomns.
+            headers["HTTP"] = OrderedDict(
+                zip(
+                    ["Subject", "Status", "HTTP Code", "Analyze Date"],
+                    [100, 11, 10, 20],
+                )
+            )
+
+            cls.headers_cache[key] = headers
+
+        return cls.headers_cache[key]
 
     def before_header(self):
         """
@@ -246,12 +291,14 @@ class Prints:
             try:
                 # We try to print the link, the date of generation and the header in the
                 # given file.
-                self.file_output_instance.write(link + date_of_generation + header)
+                self.file_output_instance.write(
+                    link + date_of_generation + header, flush=True
+                )
             except UnboundLocalError:
                 # We don't have any header.
 
                 # We print the link and the date in the given file.
-                self.file_output_instance.write(link + date_of_generation)
+                self.file_output_instance.write(link + date_of_generation, flush=True)
 
             PyFunceble.LOGGER.info(
                 f"Created the {self.file_output_instance.path} file with the header."
@@ -276,75 +323,53 @@ class Prints:
         :rtype: list
         """
 
-        # We initiate a variable which will save the header data.
-        header_data = []
-
-        # We initiate a variable which will save the header sizes.
-        header_size = ""
-
-        # We initiate the glue to set before the size.
-        before_size = "%-"
+        # We get the size of each colomns.
+        sizes = tuple(data_to_print.values())
 
-        # We initiate the glue to set after the size.
-        after_size = "s"
-
-        if header_separator:
-            # The header separator is not empty.
-
-            # We initiate a variable which will save the list of
-            # separator data.
-            header_separator_data = []
-
-        # We get the length of the data to print.
-        length_data_to_print = len(data_to_print) - 1
-
-        # We initiate an iterator.
-        i = 0
-
-        for data in data_to_print:
-            # We loop through the list of data.
-
-            # We get the size of the currently read data.
-            size = data_to_print[data]
-
-            # We append the data to the header data list.
-            header_data.append(data)
-
-            # We construct the header size.
-            # Note: our header size is formatted line %s-sizes
-            # (the s at the end is part of the formatting.)
-            header_size += before_size + str(size) + after_size
-
-            if i < length_data_to_print:
-                # The iterator is less than the length of data to print.
-
-                # We append the the colomn separator to the header size.
-                header_size += column_separator
-
-            if header_separator:
-                # The header separator is given.
-
-                # We append the right size of separator to the list of
-                # separator data.
-                header_separator_data.append(header_separator * size)
-
-            # We increase the iterator.
-            i += 1
+        # We get the format of the line.
+        # Note: our format is formatted like %-sizes
+        # (the s at the end is part of the formatting.)
+        header_size = cls.get_format(sizes, column_separator)
 
         if header_separator:
             # The header separator is given.
 
             return [
                 # We return the formatted header (like we will do with print('%s' % 'hello'))
-                header_size % tuple(header_data),
+                header_size % tuple(data_to_print),
                 # We return the formatted header separator.
-                header_size % tuple(header_separator_data),
+                header_size % tuple(header_separator * x for x in sizes),
             ]
 
         # The header separator is not given.
 
         # We return the formetted header.
-        return [header_size % tuple(header_data)]
+        return [header_size % tuple(data_to_print)]
+
+    @classmethod
+    def get_format(cls, sizes, column_separator=" "):
+        """
+        Provides the format of a line which have the given colomns sizes.
+
+        :param tuple sizes: The size of each colomns.
+        :param str column_separator: The separator to use between each colomns.
+
+        :rtype: str
+        """
+
+        key = (sizes, column_separator)
+
+        try:
+            return cls.formats_cache[key]
+        except KeyError:
+            if len(cls.formats_cache) >= 1024:
+                # Some sizes are given by the data to print, we do not
+                # want to keep all of them.
+                cls.formats_cache.clear()
+
+            cls.formats_cache[key] = column_separator.join(f"%-{x}s" for x in sizes)
+
+        return cls.formats_cache[key]
 
     def header(
         self, do_not_print=False
@@ -388,9 +413,9 @@ class Prints:
                     # * the http status code extraction is activated.
 
                     # We remove the Analyze Date colomn from the data to print.
-                    to_print = PyFunceble.helpers.Dict(to_print).remove_key(
-                        "Analyze Date"
-                    )
+                    to_print = PyFunceble.helpers.Dict(
+                        OrderedDict(to_print)
+                    ).remove_key("Analyze Date")
             elif self.template.lower() in PyFunceble.STATUS.list.up:
                 # The template is in the list of up status.
 
@@ -441,7 +466,7 @@ class Prints:
                     # * The http status code extraction is deactivated.
 
                     # We append the source index to the header.
-                    to_print["Source"] = 10
+                    to_print = OrderedDict(to_print, Source=10)
             elif self.template == "Simple":
                 to_print = self.headers[self.template]
 
@@ -449,7 +474,9 @@ class Prints:
                 # * The http status code extraction is deactivated.
 
                 # We remove the HTTP Code index from the data to print.
-                to_print = PyFunceble.helpers.Dict(to_print).remove_key("HTTP Code")
+                to_print = PyFunceble.helpers.Dict(OrderedDict(to_print)).remove_key(
+                    "HTTP Code"
+                )
 
             # We update the currently used header.
             self.currently_used_header = to_print
@@ -604,7 +631,7 @@ class Prints:
 
                     # We format our list.
                     content = PyFunceble.helpers.List(content).custom_format(
-                        PyFunceble.engine.Sort.standard
+                        PyFunceble.engine.Sort.cached(PyFunceble.engine.Sort.standard)
                     )
 
                     if PyFunceble.CONFIGURATION.hierarchical_sorting:
@@ -612,7 +639,9 @@ class Prints:
 
                         # We format our content hierarchicaly
                         content = PyFunceble.helpers.List(content).custom_format(
-                            PyFunceble.engine.Sort.hierarchical
+                            PyFunceble.engine.Sort.cached(
+                                PyFunceble.engine.Sort.hierarchical
+                            )
                         )
 
                     # We finally save our content into the file.
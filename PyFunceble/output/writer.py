@@ -0,0 +1,252 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the output writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+from atexit import register as register_at_exit
+from collections import OrderedDict
+from os import linesep
+from threading import RLock
+
+import PyFunceble
+
+
+class Writer:
+    """
+    Appends the given data into an output file.
+
+    The data are kept - per destination - into a buffer which is written
+    with a single write once it is full or when we are asked to flush.
+    The destinations are also kept open between two writes.
+
+    :param str path: The path of the output file.
+    """
+
+    buffer_size = 1048576
+    """
+    The size (in characters) from which we write the buffer of a destination.
+    """
+
+    maximal_handles = 64
+    """
+    The maximal number of destinations we keep open.
+    """
+
+    handles = OrderedDict()
+    """
+    The open destinations, their buffers and the size of their buffers.
+
+    ::
+
+        {
+            "path": {
+                "file": opened_file,
+                "pending": [],
+                "size": 0
+            }
+        }
+    """
+
+    lock = RLock()
+    hooks_registered = False
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        """
+        Checks if the output file exists.
+
+        .. note::
+            We do not ask the filesystem as long as we have data
+            waiting to be written into the output file.
+
+        :rtype: bool
+        """
+
+        try:
+            if self.handles[self.path]["pending"]:
+                return True
+        except KeyError:
+            pass
+
+        return os.path.isfile(self.path)
+
+    def write(self, data, flush=False):
+        """
+        Appends the given data into the output file.
+
+        :param str data: The data to write.
+        :param bool flush: Tells us to write the buffer immediately.
+        """
+
+        with self.lock:
+            try:
+                handle = self.handles[self.path]
+                self.handles.move_to_end(self.path)
+            except KeyError:
+                handle = self.__open(self.path)
+
+            handle["pending"].append(data)
+            handle["size"] += len(data)
+
+            if flush or handle["size"] >= self.buffer_size:
+                self.__flush_handle(self.path, handle)
+
+    @classmethod
+    def __register_hooks(cls):
+        """
+        Registers what we have to do at exit and around the creation
+        of a (forked) child.
+        """
+
+        if not cls.hooks_registered:
+            register_at_exit(cls.close)
+
+            if hasattr(os, "register_at_fork"):
+                # We write before forking so that our children do not
+                # inherit - and write again - our buffers.
+                os.register_at_fork(before=cls.flush, after_in_child=cls.reset_lock)
+
+            cls.hooks_registered = True
+
+    @classmethod
+    def reset_lock(cls):
+        """
+        Resets the lock which may have been copied in its acquired state.
+        """
+
+        cls.lock = RLock()
+
+    @classmethod
+    def __open(cls, path):
+        """
+        Opens the given destination and provides its handle.
+        """
+
+        cls.__register_hooks()
+
+        if len(cls.handles) >= cls.maximal_handles:
+            oldest_path, oldest_handle = cls.handles.popitem(last=False)
+            cls.__close_handle(oldest_path, oldest_handle)
+
+        PyFunceble.helpers.Directory(os.path.dirname(path)).create()
+
+        # The file is kept open across our writes. It is closed when it is
+        # evicted or by close() - at exit at the latest.
+        # pylint: disable=consider-using-with
+        file_stream = open(path, "ab", buffering=0)
+
+        handle = {"file": file_stream, "pending": [], "size": 0}
+        cls.handles[path] = handle
+
+        return handle
+
+    @classmethod
+    def __flush_handle(cls, path, handle):
+        """
+        Writes the buffer of the given destination.
+        """
+
+        if not handle["pending"]:
+            return
+
+        data = "".join(handle["pending"])
+
+        handle["pending"].clear()
+        handle["size"] = 0
+
+        if linesep != "\n":
+            data = data.replace("\n", linesep)
+
+        if os.fstat(handle["file"].fileno()).st_nlink == 0:
+            # The output file was deleted (by someone else) since we opened it.
+            handle["file"].close()
+            PyFunceble.helpers.Directory(os.path.dirname(path)).create()
+            # It replaces our kept open file. (See __open)
+            # pylint: disable=consider-using-with
+            handle["file"] = open(path, "ab", buffering=0)
+
+        data = memoryview(data.encode("utf-8"))
+
+        while data:
+            data = data[handle["file"].write(data) :]
+
+    @classmethod
+    def __close_handle(cls, path, handle):
+        """
+        Writes the buffer of the given destination and closes it.
+        """
+
+        try:
+            cls.__flush_handle(path, handle)
+        finally:
+            handle["file"].close()
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes the buffers of all destinations.
+        """
+
+        with cls.lock:
+            for path, handle in cls.handles.items():
+                cls.__flush_handle(path, handle)
+
+    @classmethod
+    def close(cls):
+        """
+        Writes the buffers of all destinations and closes them.
+        """
+
+        with cls.lock:
+            while cls.handles:
+                cls.__close_handle(*cls.handles.popitem(last=False))
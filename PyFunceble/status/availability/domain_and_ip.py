@@ -220,4 +220,4 @@ class DomainAndIp(GathererBase):
             )
         )
 
-        PyFunceble.LOGGER.debug(f"[{self.subject}] State:\n{self.status.get()}")
+        PyFunceble.LOGGER.debug(lambda: f"[{self.subject}] State:\n{self.status.get()}")
@@ -119,4 +119,4 @@ class Url(GathererBase):
             )
         )
 
-        PyFunceble.LOGGER.debug(f"[{self.subject}] State:\n{self.status.get()}")
+        PyFunceble.LOGGER.debug(lambda: f"[{self.subject}] State:\n{self.status.get()}")
@@ -103,4 +103,4 @@ class DomainAndIp(GathererBase):
             or self.status.ipv6_syntax_validation,
         ).status_file()
 
-        PyFunceble.LOGGER.debug(f"[{self.subject}] State:\n{self.status.get()}")
+        PyFunceble.LOGGER.debug(lambda: f"[{self.subject}] State:\n{self.status.get()}")
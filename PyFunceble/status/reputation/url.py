@@ -105,4 +105,4 @@ class Url(GathererBase):
             or self.status.ipv6_syntax_validation,
         ).status_file()
 
-        PyFunceble.LOGGER.debug(f"[{self.subject}] State:\n{self.status.get()}")
+        PyFunceble.LOGGER.debug(lambda: f"[{self.subject}] State:\n{self.status.get()}")
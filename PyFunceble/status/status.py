@@ -60,6 +60,10 @@ class Status:
 
     Provides the result of one of the status gatherer.
 
+    .. note::
+        The range validations are only computed when the subject is an IP.
+        The WHOIS server is not resolved.
+
     :param str subject:
         The subject which we describe.
 
@@ -102,8 +106,6 @@ class Status:
         The WHOIS record.
     """
 
-    # pylint: disable=no-member, attribute-defined-outside-init
-
     resulting_indexes = [
         "_status_source",
         "_status",
@@ -124,6 +126,8 @@ class Status:
         "whois_server",
     ]
 
+    __slots__ = ["subject", "checker"] + resulting_indexes
+
     def __init__(self, subject):
         self.subject = subject
         self.checker = PyFunceble.Check(self.subject)
@@ -135,9 +139,7 @@ class Status:
             "domain_syntax_validation": self.checker.is_domain(),
             "expiration_date": None,
             "http_status_code": PyFunceble.HTTP_CODE.not_found_default,
-            "ipv4_range_syntax_validation": self.checker.is_ipv4_range(),
             "ipv4_syntax_validation": self.checker.is_ipv4(),
-            "ipv6_range_syntax_validation": self.checker.is_ipv6_range(),
             "ipv6_syntax_validation": self.checker.is_ipv6(),
             "status_source": None,
             "status": None,
@@ -145,9 +147,17 @@ class Status:
             "tested": self.subject,
             "url_syntax_validation": self.checker.is_url(),
             "whois_record": None,
-            "whois_server": PyFunceble.lookup.Referer(self.subject).get()[-1],
+            "whois_server": PyFunceble.lookup.Referer(self.subject).get_referer(),
         }
 
+        # A range is an IP. Therefore, we only parse it when we have an IP.
+        pre_loading["ipv4_range_syntax_validation"] = (
+            pre_loading["ipv4_syntax_validation"] and self.checker.is_ipv4_range()
+        )
+        pre_loading["ipv6_range_syntax_validation"] = (
+            pre_loading["ipv6_syntax_validation"] and self.checker.is_ipv6_range()
+        )
+
         for description, value in pre_loading.items():
             setattr(self, description, value)
 
@@ -162,4 +172,4 @@ class Status:
         Provides the status in a dict format.
         """
 
-        return {x: y for x, y in self.__dict__.items() if x in self.resulting_indexes}
+        return {x: getattr(self, x) for x in self.resulting_indexes}
@@ -129,6 +129,27 @@ class TestCLICore(StdoutBase):
 
                 self.assertEqual(expected, actual)
 
+    def test_get_up_statuses(self):
+        """
+        Tests the method which provides the list of up statuses.
+        """
+
+        list_of_up = PyFunceble.STATUS.list.up.copy()
+
+        statuses = (
+            PyFunceble.STATUS.list.up
+            + PyFunceble.STATUS.list.valid
+            + PyFunceble.STATUS.list.sane
+        )
+
+        expected = sorted(statuses + [x.upper() for x in statuses])
+        actual = sorted(self.cli_core.get_up_statuses())
+
+        self.assertEqual(expected, actual)
+
+        self.assertIs(self.cli_core.get_up_statuses(), CLI.get_up_statuses())
+        self.assertEqual(list_of_up, PyFunceble.STATUS.list.up)
+
     def test_colored_ascii_home(self):
         """
         Tests the method which colors the ASCII representation of PyFunceble
@@ -0,0 +1,164 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.core.file.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.core.file import FileCore
+from PyFunceble.database.inactive import InactiveDB
+from PyFunceble.engine.database.loader import credential
+from PyFunceble.engine.database.migrations import Alembic
+from PyFunceble.engine.database.writer import BulkWriter
+
+
+class TestFileCore(TestCase):
+    """
+    Tests of PyFunceble.core.file.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(custom={"local": False, "filter": None})
+
+    def test_filter_shadow_file_chunk(self):
+        """
+        Tests the filtering of a chunk of the shadow file.
+        """
+
+        given = [
+            "# Hello, World!\n",
+            "example.org\n",
+            "localhost\n",
+            "example.net\n",
+            "0.0.0.0 example.com example.de\n",
+            "192.168.1.1\n",
+        ]
+        already_tested = {"example.net", "example.de"}
+
+        expected = ("example.org\nexample.com\n", "ISIISI")
+        actual = FileCore.filter_shadow_file_chunk(given, already_tested)
+
+        self.assertEqual(expected, actual)
+
+    def test_filter_shadow_file_chunk_empty(self):
+        """
+        Tests the filtering of an empty chunk of the shadow file.
+        """
+
+        expected = ("", "")
+        actual = FileCore.filter_shadow_file_chunk([], set())
+
+        self.assertEqual(expected, actual)
+
+    def test_should_be_ignored_sqlite(self):
+        """
+        Tests the check of the subjects to ignore under the SQLite database.
+        """
+
+        config_directory = PyFunceble.CONFIG_DIRECTORY
+        db_type = PyFunceble.CONFIGURATION.db_type
+        inactive_database = PyFunceble.CONFIGURATION.inactive_database
+
+        with TemporaryDirectory() as temp_directory:
+            try:
+                PyFunceble.CONFIG_DIRECTORY = temp_directory + "/"
+                PyFunceble.CONFIGURATION.db_type = "sqlite"
+                PyFunceble.CONFIGURATION.inactive_database = True
+
+                Alembic(credential.Credential()).upgrade()
+
+                writer = BulkWriter()
+                writer.add_status(
+                    "hello.list",
+                    {
+                        "tested": "example.org",
+                        "status": PyFunceble.STATUS.official.down,
+                    },
+                )
+                writer.add_status(
+                    "hello.list",
+                    {"tested": "example.net", "status": PyFunceble.STATUS.official.up},
+                )
+                writer.flush()
+
+                # Each file requests the database with the list of up statuses.
+                for _ in range(20):
+                    inactive_db = InactiveDB("hello.list", parent_process=True)
+
+                    self.assertTrue(
+                        FileCore.should_be_ignored(
+                            "example.org",
+                            auto_continue_db=None,
+                            inactive_db=inactive_db,
+                        )
+                    )
+                    self.assertFalse(
+                        FileCore.should_be_ignored(
+                            "example.net",
+                            auto_continue_db=None,
+                            inactive_db=inactive_db,
+                        )
+                    )
+            finally:
+                PyFunceble.CONFIG_DIRECTORY = config_directory
+                PyFunceble.CONFIGURATION.db_type = db_type
+                PyFunceble.CONFIGURATION.inactive_database = inactive_database
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,189 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.core.worker_pool.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+from random import random
+from time import sleep
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.core.worker_pool import WorkerPool
+
+
+def square(task_queue, result_queue, loader, intern, factor=1):
+    """
+    Squares the numbers of the task queue.
+    """
+
+    # pylint: disable=unused-argument
+
+    for index, number in iter(task_queue.get, None):
+        # We shuffle the order of the acknowledgements.
+        sleep(random() / 100)
+
+        result_queue.put(((index, number * number * factor), None))
+
+
+def die(task_queue, result_queue, loader, intern):
+    """
+    Dies without acknowledging anything.
+    """
+
+    # pylint: disable=unused-argument
+
+    task_queue.get()
+
+    os._exit(3)  # pylint: disable=protected-access
+
+
+def leave(task_queue, result_queue, loader, intern):
+    """
+    Exits without acknowledging anything.
+    """
+
+    # pylint: disable=unused-argument
+
+    task_queue.get()
+
+
+class TestWorkerPool(TestCase):
+    """
+    Tests of PyFunceble.core.worker_pool.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(custom={"maximal_processes": 3})
+
+    def test_imap(self):
+        """
+        Tests that the results are given in the same order as the tasks.
+        """
+
+        expected = [x * x * 2 for x in range(50)]
+
+        with WorkerPool(square, args=(2,)) as pool:
+            self.assertEqual(3, len(pool.workers))
+
+            actual = list(pool.imap(range(50)))
+
+        self.assertEqual(expected, actual)
+        self.assertEqual([], pool.workers)
+
+    def test_get(self):
+        """
+        Tests the acknowledgements of our workers.
+        """
+
+        pool = WorkerPool(square, kwargs={"factor": 3}, size=1)
+        pool.start()
+
+        pool.put((0, 4))
+
+        expected = ((0, 48), None)
+        actual = pool.get()
+
+        self.assertEqual(expected, actual)
+
+        pool.stop()
+
+        self.assertEqual([], pool.workers)
+
+    def test_get_dead_worker(self):
+        """
+        Tests that we get a traceback when a worker dies.
+        """
+
+        with WorkerPool(die, size=1, name="PyF test") as pool:
+            pool.put(None)
+
+            result, traceback = pool.get()
+
+            self.assertIsNone(result)
+            self.assertEqual("PyF test 0 died with exit code 3.", traceback)
+
+            with redirect_stdout(StringIO()) as stdout:
+                self.assertRaises(SystemExit, lambda: list(pool.imap([1])))
+
+            self.assertIn("died with exit code 3.", stdout.getvalue())
+            self.assertEqual([], pool.workers)
+
+    def test_get_exited_worker(self):
+        """
+        Tests that we do not wait forever when our workers exit
+        without acknowledging our tasks.
+        """
+
+        pool = WorkerPool(leave, size=1)
+        pool.start()
+
+        pool.put(None)
+
+        result, traceback = pool.get()
+
+        self.assertIsNone(result)
+        self.assertEqual(
+            "Our workers exited before acknowledging our tasks.", traceback
+        )
+
+        pool.stop()
+
+
+if __name__ == "__main__":
+    launch_tests()
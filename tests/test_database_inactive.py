@@ -53,6 +53,7 @@ License:
 # pylint: enable=line-too-long
 
 from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest import main as launch_tests
 from unittest.mock import Mock, patch
@@ -61,6 +62,9 @@ from time_zone import TZ
 
 import PyFunceble
 from PyFunceble.database.inactive import InactiveDB
+from PyFunceble.engine.database.loader import credential, session
+from PyFunceble.engine.database.migrations import Alembic
+from PyFunceble.engine.database.writer import BulkWriter
 
 
 class TestInactiveDB(TestCase):
@@ -297,6 +301,99 @@ class TestInactiveDB(TestCase):
 
         self.assertEqual(expected, self.inactive_db.get_already_tested())
 
+    def test_is_already_tested(self):
+        """
+        Tests of the method which checks if a subject is into the list
+        of already tested subject.
+        """
+
+        self.inactive_db.add("example.com", PyFunceble.STATUS.official.invalid)
+
+        self.assertTrue(self.inactive_db.is_already_tested("example.com"))
+        self.assertFalse(self.inactive_db.is_already_tested("example.org"))
+
+        self.inactive_db.remove("example.com")
+
+        self.assertFalse(self.inactive_db.is_already_tested("example.com"))
+
+        self.inactive_db.add("example.org", PyFunceble.STATUS.official.invalid)
+        self.inactive_db.authorized = False
+
+        self.assertFalse(self.inactive_db.is_already_tested("example.org"))
+
+    def test_is_already_tested_sql(self):
+        """
+        Tests that the set of already tested subjects is only requested
+        once under the SQL databases.
+        """
+
+        config_directory = PyFunceble.CONFIG_DIRECTORY
+        db_type = PyFunceble.CONFIGURATION.db_type
+
+        with TemporaryDirectory() as temp_directory:
+            try:
+                PyFunceble.CONFIG_DIRECTORY = temp_directory + "/"
+                PyFunceble.CONFIGURATION.db_type = "sqlite"
+
+                Alembic(credential.Credential()).upgrade()
+
+                writer = BulkWriter()
+                writer.add_status(
+                    self.file_to_test,
+                    {
+                        "tested": "example.com",
+                        "status": PyFunceble.STATUS.official.down,
+                    },
+                )
+                writer.add_status(
+                    self.file_to_test,
+                    {"tested": "example.net", "status": PyFunceble.STATUS.official.up},
+                )
+                writer.flush()
+
+                inactive_db = InactiveDB(self.file_to_test, parent_process=True)
+
+                with patch.object(session, "Session", side_effect=AssertionError):
+                    self.assertTrue(inactive_db.is_already_tested("example.com"))
+                    self.assertFalse(inactive_db.is_already_tested("example.net"))
+                    self.assertFalse(inactive_db.is_already_tested("example.org"))
+
+                    inactive_db.add("example.org", PyFunceble.STATUS.official.down)
+                    inactive_db.remove("example.com")
+
+                    self.assertTrue(inactive_db.is_already_tested("example.org"))
+                    self.assertFalse(inactive_db.is_already_tested("example.com"))
+            finally:
+                PyFunceble.CONFIG_DIRECTORY = config_directory
+                PyFunceble.CONFIGURATION.db_type = db_type
+
+    def test_journal(self):
+        """
+        Tests the usage of the journal database type.
+        """
+
+        PyFunceble.CONFIGURATION.db_type = "journal"
+
+        inactive_db = InactiveDB(self.file_to_test, parent_process=True)
+        journal_file = inactive_db.journal.path
+
+        inactive_db.add("example.com", PyFunceble.STATUS.official.invalid)
+        inactive_db.add("example.org", PyFunceble.STATUS.official.invalid)
+        inactive_db.remove("example.org")
+        inactive_db.save()
+
+        self.assertFalse(PyFunceble.helpers.File(self.storage_file).exists())
+
+        inactive_db.database = {}
+        inactive_db.load()
+
+        expected = ["example.com"]
+        actual = list(inactive_db.database[self.file_to_test])
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.helpers.File(journal_file).delete()
+
     def test_get_to_clean(self):
         """
         Tests of the method which gives us the list of subject to clean.
@@ -0,0 +1,248 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.database.journal.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from os import replace
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.database.journal import Journal
+
+
+class TestJournal(TestCase):
+    """
+    Tests of PyFunceble.database.journal
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.database_file = "this_is_a_ghost.json"
+        self.journal = Journal(self.database_file)
+
+        PyFunceble.helpers.File(self.journal.path).delete()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        PyFunceble.helpers.File(self.journal.path).delete()
+
+    def test_path(self):
+        """
+        Tests the location of the journal.
+        """
+
+        expected = "this_is_a_ghost.jsonl"
+        actual = self.journal.path
+
+        self.assertEqual(expected, actual)
+
+    def test_apply(self):
+        """
+        Tests of the method which let us apply a change to a database.
+        """
+
+        database = {}
+
+        Journal.apply(database, ["set", ["hello", "world"], {"status": "INACTIVE"}])
+        Journal.apply(database, ["append", ["hello", "fun"], "ilrys"])
+        Journal.apply(database, ["append", ["hello", "fun"], "funilrys"])
+
+        expected = {
+            "hello": {"world": {"status": "INACTIVE"}, "fun": ["ilrys", "funilrys"]}
+        }
+
+        self.assertEqual(expected, database)
+
+        Journal.apply(database, ["delete", ["hello", "world"], None])
+        Journal.apply(database, ["delete", ["hello", "not_existing"], None])
+
+        expected = {"hello": {"fun": ["ilrys", "funilrys"]}}
+
+        self.assertEqual(expected, database)
+
+        Journal.apply(database, ["set", [], {"world": {}}])
+
+        expected = {"world": {}}
+
+        self.assertEqual(expected, database)
+
+    def test_write_and_load(self):
+        """
+        Tests of the methods which let us write and replay the journal.
+        """
+
+        self.assertFalse(self.journal.exists())
+
+        self.journal.set(["hello", "world"], {"status": "INACTIVE"})
+        self.journal.append(["hello", "fun"], "ilrys")
+        self.journal.write()
+
+        self.assertTrue(self.journal.exists())
+        self.assertEqual([], self.journal.changes)
+
+        self.journal.delete(["hello", "world"])
+        self.journal.write()
+
+        expected = {"hello": {"fun": ["ilrys"]}}
+        actual = Journal(self.database_file).load()
+
+        self.assertEqual(expected, actual)
+
+    def test_load_partially_written(self):
+        """
+        Tests the case that the last change was not completely written.
+        """
+
+        self.journal.set(["hello"], {"world": "fun"})
+        self.journal.write()
+
+        with open(self.journal.path, "a", encoding="utf-8") as file_stream:
+            file_stream.write('["set", ["hello"], {"wor')
+
+        expected = {"hello": {"world": "fun"}}
+        actual = Journal(self.database_file).load()
+
+        self.assertEqual(expected, actual)
+
+    def test_write_after_partially_written(self):
+        """
+        Tests that the changes we write after a partially written change
+        are not lost.
+        """
+
+        self.journal.set(["a"], 1)
+        self.journal.write()
+
+        with open(self.journal.path, "a", encoding="utf-8") as file_stream:
+            file_stream.write('["set", ["b"], 2')
+
+        journal = Journal(self.database_file)
+        journal.load()
+
+        journal.set(["c"], 3)
+        journal.write()
+
+        expected = {"a": 1, "c": 3}
+        actual = Journal(self.database_file).load()
+
+        self.assertEqual(expected, actual)
+
+    def test_compact(self):
+        """
+        Tests of the method which let us compact the journal.
+        """
+
+        database = {"hello": {}}
+
+        self.journal.minimal_compaction_size = 0
+
+        for index in range(10):
+            database["hello"][str(index)] = index
+            self.journal.set(["hello", str(index)], index)
+
+        self.journal.write(database)
+
+        with open(self.journal.path, "r", encoding="utf-8") as file_stream:
+            expected = 1
+            actual = len(file_stream.readlines())
+
+        self.assertEqual(expected, actual)
+
+        expected = database
+        actual = Journal(self.database_file).load()
+
+        self.assertEqual(expected, actual)
+
+    def test_compact_synced(self):
+        """
+        Tests that the snapshot is synced before it replaces the journal.
+        """
+
+        calls = []
+
+        def fake_replace(*args):
+            calls.append("replace")
+            replace(*args)
+
+        with patch(
+            "PyFunceble.database.journal.fsync",
+            side_effect=lambda _: calls.append("fsync"),
+        ), patch(
+            "PyFunceble.helpers.directory.fsync",
+            side_effect=lambda _: calls.append("fsync"),
+        ), patch(
+            "PyFunceble.database.journal.replace", side_effect=fake_replace
+        ):
+            self.journal.compact({"hello": "world"})
+
+        # The snapshot is synced before the replacement and its directory after.
+        expected = ["fsync", "replace", "fsync"]
+
+        self.assertEqual(expected, calls)
+
+        expected = {"hello": "world"}
+        actual = Journal(self.database_file).load()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -52,11 +52,16 @@ License:
 """
 # pylint: enable=line-too-long
 
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest.mock import patch
 
 import PyFunceble
 from PyFunceble.engine import AutoContinue
+from PyFunceble.engine.database.loader import credential, session
+from PyFunceble.engine.database.migrations import Alembic
+from PyFunceble.engine.database.writer import BulkWriter
 
 
 class TestAutoContinue(TestCase):
@@ -258,6 +263,87 @@ class TestAutoContinue(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_is_already_tested(self):
+        """
+        Tests of the method which checks if a subject was already tested.
+        """
+
+        self.auto_continue.database = {}
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+
+        self.assertTrue(self.auto_continue.is_already_tested("hello.world"))
+        self.assertFalse(self.auto_continue.is_already_tested("world.hello"))
+
+        self.auto_continue.add("world.hello", "INACTIVE")
+
+        self.assertTrue(self.auto_continue.is_already_tested("world.hello"))
+
+        self.auto_continue.database[self.file_to_test]["complements"] = [
+            "www.hello.world"
+        ]
+        self.auto_continue.save()
+        self.auto_continue.load()
+
+        self.assertTrue(self.auto_continue.is_already_tested("hello.world"))
+        self.assertFalse(self.auto_continue.is_already_tested("www.hello.world"))
+
+        self.auto_continue.clean()
+
+        self.assertFalse(self.auto_continue.is_already_tested("hello.world"))
+        self.assertFalse(self.auto_continue.is_already_tested("world.hello"))
+
+    def test_is_already_tested_sql(self):
+        """
+        Tests that the set of already tested subjects is only requested
+        once under the SQL databases.
+        """
+
+        config_directory = PyFunceble.CONFIG_DIRECTORY
+        db_type = PyFunceble.CONFIGURATION.db_type
+
+        with TemporaryDirectory() as temp_directory:
+            try:
+                PyFunceble.CONFIG_DIRECTORY = temp_directory + "/"
+                PyFunceble.CONFIGURATION.db_type = "sqlite"
+
+                Alembic(credential.Credential()).upgrade()
+
+                writer = BulkWriter()
+                writer.add_status(
+                    self.file_to_test,
+                    {
+                        "tested": "example.com",
+                        "status": PyFunceble.STATUS.official.down,
+                        "test_completed": True,
+                    },
+                )
+                writer.add_status(
+                    self.file_to_test,
+                    {
+                        "tested": "example.net",
+                        "status": PyFunceble.STATUS.official.up,
+                        "test_completed": False,
+                    },
+                )
+                writer.flush()
+
+                auto_continue = AutoContinue(self.file_to_test, parent_process=True)
+
+                with patch.object(session, "Session", side_effect=AssertionError):
+                    self.assertTrue(auto_continue.is_already_tested("example.com"))
+                    self.assertFalse(auto_continue.is_already_tested("example.net"))
+                    self.assertFalse(auto_continue.is_already_tested("example.org"))
+
+                    auto_continue.add("example.org", PyFunceble.STATUS.official.down)
+
+                    self.assertTrue(auto_continue.is_already_tested("example.org"))
+                    self.assertIn("example.org", auto_continue)
+                    self.assertNotIn("example.net", auto_continue)
+            finally:
+                PyFunceble.CONFIG_DIRECTORY = config_directory
+                PyFunceble.CONFIGURATION.db_type = db_type
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,164 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.engine.ci.base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+from stdout_base import StdoutBase
+
+import PyFunceble
+from PyFunceble.engine.ci.base import CIBase
+from PyFunceble.output import Counter, Writer
+
+
+class AuthorizedCI(CIBase):  # pylint: disable=abstract-method
+    """
+    Provides an always authorized CI engine.
+    """
+
+    authorized = True
+
+
+class TestCIBase(StdoutBase):
+    """
+    Tests of PyFunceble.engine.ci.base.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+        StdoutBase.setUp(self)
+
+        PyFunceble.INTERN["counter"] = {
+            "number": Counter(),
+            "percentage": {"down": 0, "invalid": 0, "up": 0},
+        }
+        PyFunceble.INTERN["counter"]["number"].update(
+            {"up": 45, "down": 78, "invalid": 2, "tested": 125}
+        )
+
+        PyFunceble.CONFIGURATION.show_percentage = True
+        PyFunceble.CONFIGURATION.syntax = False
+        PyFunceble.CONFIGURATION.reputation = False
+
+        self.percentage_file = PyFunceble.helpers.File(
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS.parent_directory
+            + PyFunceble.OUTPUTS.logs.directories.parent
+            + PyFunceble.OUTPUTS.logs.directories.percentage
+            + PyFunceble.OUTPUTS.logs.filenames.percentage
+        )
+
+        self.committed = []
+
+    def tearDown(self):
+        """
+        Setups everything we need after the tests.
+        """
+
+        Writer.close()
+        self.percentage_file.delete()
+
+        StdoutBase.tearDown(self)
+
+    def save_committed(self, command, *_):
+        """
+        Saves what is on disk when the given command is executed.
+        """
+
+        if "git commit" in command:
+            self.committed.append(self.percentage_file.read())
+
+    def test_not_end_commit(self):
+        """
+        Tests that the percentage file is complete when we commit
+        in the middle of the test.
+        """
+
+        ci_engine = AuthorizedCI()
+
+        with patch("PyFunceble.helpers.Command") as command, patch.object(
+            ci_engine, "push"
+        ):
+            command.side_effect = lambda x: self.save_committed(x) or command
+            ci_engine.not_end_commit()
+
+        self.assertEqual(1, len(self.committed))
+        self.assertIn("ACTIVE", self.committed[0])
+        self.assertIn("INVALID", self.committed[0])
+
+    def test_end_commit(self):
+        """
+        Tests that the percentage file is complete when we commit
+        at the end of the test.
+        """
+
+        ci_engine = AuthorizedCI()
+
+        with patch.object(ci_engine, "exec_commands") as exec_commands, patch.object(
+            ci_engine, "push"
+        ):
+            exec_commands.side_effect = lambda x: [self.save_committed(*y) for y in x]
+            ci_engine.end_commit()
+
+        self.assertEqual(1, len(self.committed))
+        self.assertIn("ACTIVE", self.committed[0])
+        self.assertIn("INVALID", self.committed[0])
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,223 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.engine.database.writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.engine.database.loader import credential, session
+from PyFunceble.engine.database.migrations import Alembic
+from PyFunceble.engine.database.schemas import File, Mined, Status, WhoisRecord
+from PyFunceble.engine.database.writer import BulkWriter
+
+
+class TestBulkWriter(TestCase):
+    """
+    Tests of PyFunceble.engine.database.writer.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.config_directory = PyFunceble.CONFIG_DIRECTORY
+        self.db_type = PyFunceble.CONFIGURATION.db_type
+
+        self.temp_directory = TemporaryDirectory()
+
+        PyFunceble.CONFIG_DIRECTORY = self.temp_directory.name + "/"
+        PyFunceble.CONFIGURATION.db_type = "sqlite"
+
+        Alembic(credential.Credential()).upgrade()
+
+        self.writer = BulkWriter(batch_size=1000)
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        PyFunceble.CONFIG_DIRECTORY = self.config_directory
+        PyFunceble.CONFIGURATION.db_type = self.db_type
+
+        self.temp_directory.cleanup()
+
+    def test_add_status(self):
+        """
+        Tests the write of the status rows.
+        """
+
+        self.writer.add_status(
+            "hello.list", {"tested": "example.org", "status": "INACTIVE"}
+        )
+        self.writer.add_status("hello.list", {"tested": "example.net", "status": "UP"})
+
+        self.assertEqual(2, len(self.writer))
+
+        with session.Session() as db_session:
+            # pylint: disable=no-member
+            self.assertEqual(0, db_session.query(Status).count())
+
+        self.writer.flush()
+
+        self.assertEqual(0, len(self.writer))
+
+        self.writer.add_status("hello.list", {"tested": "example.org", "status": "UP"})
+        self.writer.add_status("world.list", {"tested": "example.org", "status": "UP"})
+        self.writer.flush()
+
+        with session.Session() as db_session:
+            # pylint: disable=no-member
+            self.assertEqual(2, db_session.query(File).count())
+
+            expected = [
+                ("hello.list", "example.net", "UP"),
+                ("hello.list", "example.org", "UP"),
+                ("world.list", "example.org", "UP"),
+            ]
+            actual = sorted(
+                db_session.query(File.path, Status.tested, Status.status)
+                .join(File)
+                .all()
+            )
+
+            self.assertEqual(expected, [tuple(x) for x in actual])
+
+    def test_add_whois_record(self):
+        """
+        Tests the write of the WHOIS record rows.
+        """
+
+        data = {
+            "epoch": 1,
+            "expiration_date": "01-jan-1970",
+            "state": "past",
+            "record": None,
+            "server": "whois.example.org",
+        }
+
+        self.writer.add_whois_record("example.org", data)
+
+        self.assertEqual(
+            "01-jan-1970",
+            self.writer.get_whois_record("example.org")["expiration_date"],
+        )
+
+        self.writer.flush()
+
+        self.assertIsNone(self.writer.get_whois_record("example.org"))
+
+        data["state"] = "future"
+
+        self.writer.add_whois_record("example.org", data)
+        self.writer.flush()
+
+        with session.Session() as db_session:
+            # pylint: disable=no-member
+            fetched = db_session.query(WhoisRecord).all()
+
+            self.assertEqual(1, len(fetched))
+            self.assertEqual("future", fetched[0].state)
+
+    def test_add_mined(self):
+        """
+        Tests the write of the mined rows.
+        """
+
+        self.writer.add_status("hello.list", {"tested": "example.org", "status": "UP"})
+        self.writer.add_mined("example.org", ["www.example.org"])
+        self.writer.add_mined("example.net", ["www.example.net"])
+        self.writer.flush()
+
+        self.writer.add_mined("example.org", "www.example.org")
+        self.writer.flush()
+
+        with session.Session() as db_session:
+            # pylint: disable=no-member
+            self.assertEqual(
+                ["www.example.org"], [x.mined for x in db_session.query(Mined).all()]
+            )
+
+    def test_get_chunks(self):
+        """
+        Tests the method which let us split the rows to write.
+        """
+
+        self.writer.batch_size = 2
+
+        given = [{"tested": x} for x in range(5)]
+        expected = [given[:2], given[2:4], given[4:]]
+
+        self.assertEqual(expected, list(self.writer.get_chunks(given)))
+
+    def test_group_by_columns(self):
+        """
+        Tests the method which let us group the rows by columns.
+        """
+
+        given = [{"a": 1, "b": 2}, {"b": 3, "a": 4}, {"a": 5}]
+        expected = {
+            ("a", "b"): [{"a": 1, "b": 2}, {"b": 3, "a": 4}],
+            ("a",): [{"a": 5}],
+        }
+
+        self.assertEqual(expected, BulkWriter.group_by_columns(given))
+
+
+if __name__ == "__main__":
+    launch_tests()
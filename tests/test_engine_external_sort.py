@@ -0,0 +1,159 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.engine.external_sort
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from os import chmod, stat
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.engine import ExternalSort, Sort
+
+
+class TestExternalSort(TestCase):
+    """
+    Tests of PyFunceble.engine.external_sort.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.file = "the_file_is_a_ghost"
+        self.file_instance = PyFunceble.helpers.File(self.file)
+
+        self.header = ["# Hello", "# World", ""]
+        self.lines = [
+            "hello.world",
+            "example.org",
+            "example.com",
+            "a.example.org",
+            "1.1.1.1",
+            "example.org",
+            "10.1.1.1",
+            "2.1.1.1",
+            "world.hello",
+            "a.example.org",
+        ]
+
+        self.file_instance.write("\n".join(self.header + self.lines) + "\n")
+
+    def tearDown(self):
+        """
+        Setups everything we need after the tests.
+        """
+
+        self.file_instance.delete()
+
+    def get_expected(self, key_method):
+        """
+        Provides the expected content of the file.
+        """
+
+        return (
+            "\n".join(
+                self.header
+                + PyFunceble.helpers.List(self.lines).custom_format(key_method)
+            )
+            + "\n"
+        )
+
+    def test_sort(self):
+        """
+        Tests the sorting of a file which fit into memory.
+        """
+
+        ExternalSort(self.file, Sort.standard, header_limit=3).sort()
+
+        self.assertEqual(self.get_expected(Sort.standard), self.file_instance.read())
+
+    def test_sort_with_runs(self):
+        """
+        Tests the sorting of a file which does not fit into memory.
+        """
+
+        ExternalSort(self.file, Sort.hierarchical, header_limit=3, chunk_size=3).sort()
+
+        self.assertEqual(
+            self.get_expected(Sort.hierarchical), self.file_instance.read()
+        )
+
+    def test_sort_keep_mode(self):
+        """
+        Tests that we keep the permissions of the sorted file.
+        """
+
+        chmod(self.file, 0o644)
+
+        ExternalSort(self.file, Sort.standard, header_limit=3, chunk_size=3).sort()
+
+        self.assertEqual(0o644, stat(self.file).st_mode & 0o777)
+
+    def test_sort_not_comparable(self):
+        """
+        Tests that we keep the file as it is when we can't compare its lines.
+        """
+
+        expected = self.file_instance.read()
+
+        ExternalSort(
+            self.file, lambda x: 1 if x.startswith("1") else "a", header_limit=3
+        ).sort()
+
+        self.assertEqual(expected, self.file_instance.read())
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,209 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.engine.save_scheduler.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+import os
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest import skipUnless
+
+import PyFunceble
+
+
+class TestSaveScheduler(TestCase):
+    """
+    Tests of PyFunceble.engine.save_scheduler.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.saved = 0
+
+    def save(self):
+        """
+        Simulates the save method of a database.
+        """
+
+        self.saved += 1
+
+    def test_schedule(self):
+        """
+        Tests of the method which let us schedule a save.
+        """
+
+        scheduler = PyFunceble.engine.SaveScheduler(
+            self.save, threshold=3, interval=3600
+        )
+
+        scheduler.schedule()
+        scheduler.schedule()
+
+        self.assertEqual(0, self.saved)
+        self.assertEqual(2, scheduler.pending)
+
+        scheduler.schedule()
+
+        self.assertEqual(1, self.saved)
+        self.assertEqual(0, scheduler.pending)
+
+    def test_schedule_interval(self):
+        """
+        Tests of the method which let us schedule a save for the case
+        that the interval is reached.
+        """
+
+        scheduler = PyFunceble.engine.SaveScheduler(
+            self.save, threshold=1000, interval=3600
+        )
+
+        scheduler.schedule()
+
+        self.assertEqual(0, self.saved)
+
+        scheduler.last_save -= 3600
+        scheduler.schedule()
+
+        self.assertEqual(1, self.saved)
+        self.assertEqual(0, scheduler.pending)
+
+    def test_flush(self):
+        """
+        Tests of the method which let us save the pending changes.
+        """
+
+        scheduler = PyFunceble.engine.SaveScheduler(
+            self.save, threshold=1000, interval=3600
+        )
+
+        scheduler.flush()
+
+        self.assertEqual(0, self.saved)
+
+        scheduler.schedule()
+        scheduler.flush()
+
+        self.assertEqual(1, self.saved)
+
+        scheduler.flush()
+
+        self.assertEqual(1, self.saved)
+
+    def test_flush_all(self):
+        """
+        Tests of the method which let us save the pending changes of
+        all living schedulers.
+        """
+
+        schedulers = [
+            PyFunceble.engine.SaveScheduler(self.save, threshold=1000, interval=3600)
+            for _ in range(3)
+        ]
+
+        for scheduler in schedulers[:2]:
+            scheduler.schedule()
+
+        PyFunceble.engine.SaveScheduler.flush_all()
+
+        self.assertEqual(2, self.saved)
+        self.assertEqual([0, 0, 0], [x.pending for x in schedulers])
+
+    @skipUnless(hasattr(os, "fork"), "Requires os.fork().")
+    def test_flush_all_child(self):
+        """
+        Tests that a (forked) child does not save the pending changes
+        of the schedulers of its parent.
+        """
+
+        scheduler = PyFunceble.engine.SaveScheduler(
+            self.save, threshold=1000, interval=3600
+        )
+        scheduler.schedule()
+
+        pid = os.fork()
+
+        if pid == 0:  # pragma: no cover
+            PyFunceble.engine.SaveScheduler.flush_all()
+
+            # We give our number of saves to our parent.
+            os._exit(self.saved)  # pylint: disable=protected-access
+
+        _, exit_status = os.waitpid(pid, 0)
+
+        self.assertEqual(0, os.WEXITSTATUS(exit_status))
+
+        PyFunceble.engine.SaveScheduler.flush_all()
+
+        self.assertEqual(1, self.saved)
+
+    def test_reset(self):
+        """
+        Tests of the method which let us reset the pending changes.
+        """
+
+        scheduler = PyFunceble.engine.SaveScheduler(
+            self.save, threshold=1000, interval=3600
+        )
+
+        scheduler.schedule()
+        scheduler.reset()
+        scheduler.flush()
+
+        self.assertEqual(0, self.saved)
+
+
+if __name__ == "__main__":
+    launch_tests()
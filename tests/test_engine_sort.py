@@ -160,6 +160,48 @@ class TestSort(TestCase):
 
         self.assertEqual(expected_url, actual_url)
 
+    def test_standard_leading_zeros_sorting(self):
+        """
+        Tests the standard sorting of numbers with leading zeros.
+        """
+
+        given = ["010.example.com", "2.example.com", "0009.example.com", "a1.com"]
+        expected = ["2.example.com", "0009.example.com", "010.example.com", "a1.com"]
+
+        actual = List(given).custom_format(Sort.standard)
+
+        self.assertEqual(expected, actual)
+
+    def test_standard_special_characters(self):
+        """
+        Tests that the special characters are ignored by the standard sorting.
+        """
+
+        expected = Sort.standard("example2.com")
+
+        for given in ["ex_ample2.com", "ex-ample2.com", "exé_ample2.com"]:
+            self.assertEqual(expected, Sort.standard(given))
+
+    def test_cached(self):
+        """
+        Tests that the cached key method gives the same keys.
+        """
+
+        given = ["example.com", "www.example.org", "1.example.net"]
+
+        for key_method in [Sort.standard, Sort.hierarchical]:
+            cached_key_method = Sort.cached(key_method)
+
+            for element in given:
+                expected = key_method(element)
+
+                self.assertEqual(expected, cached_key_method(element))
+                self.assertEqual(expected, cached_key_method(element))
+
+            self.assertEqual(
+                sorted(given, key=key_method), sorted(given, key=cached_key_method)
+            )
+
     def test_hierarchical_numeric_sorting(self):
         """
         Tests the hierarchical numeric sorting.
@@ -52,8 +52,10 @@ License:
 """
 # pylint: enable=line-too-long
 
+from os import listdir, replace
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest.mock import patch
 
 from PyFunceble.helpers import Dict, File
 
@@ -252,6 +254,70 @@ class TestDict(TestCase):
 
         File(output_file).delete()
 
+    def test_to_json_file_synced(self):
+        """
+        Tests that the method which let us save a dict into a JSON file
+        syncs the file before it replaces the given one.
+        """
+
+        output_file = "this_file_is_a_ghost"
+        File(output_file).delete()
+
+        calls = []
+
+        def fake_replace(*args):
+            calls.append("replace")
+            replace(*args)
+
+        with patch(
+            "PyFunceble.helpers.dict.fsync", side_effect=lambda _: calls.append("fsync")
+        ), patch(
+            "PyFunceble.helpers.directory.fsync",
+            side_effect=lambda _: calls.append("fsync"),
+        ), patch(
+            "PyFunceble.helpers.dict.replace", side_effect=fake_replace
+        ):
+            Dict(self.test_subject.copy()).to_json_file(output_file)
+
+        # The file is synced before the replacement and its directory after.
+        expected = ["fsync", "replace", "fsync"]
+
+        self.assertEqual(expected, calls)
+
+        expected = self.test_subject.copy()
+        actual = Dict().from_json_file(output_file)
+
+        self.assertEqual(expected, actual)
+
+        File(output_file).delete()
+
+    def test_to_json_file_not_serializable(self):
+        """
+        Tests the method which let us save a dict into a JSON file
+        for the case that the given dict can't be serialized.
+        """
+
+        output_file = "this_file_is_a_ghost"
+        File(output_file).delete()
+
+        Dict(self.test_subject.copy()).to_json_file(output_file)
+
+        self.assertRaises(
+            TypeError, lambda: Dict({"hello": object()}).to_json_file(output_file)
+        )
+
+        expected = self.test_subject.copy()
+        actual = Dict().from_json_file(output_file)
+
+        self.assertEqual(expected, actual)
+
+        expected = [output_file]
+        actual = [x for x in listdir(".") if x.startswith(output_file)]
+
+        self.assertEqual(expected, actual)
+
+        File(output_file).delete()
+
     def test_to_json(self):
         """
         Tests the method which let us get the JSON
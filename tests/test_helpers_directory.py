@@ -56,6 +56,7 @@ from os import getcwd, path
 from os import sep as directory_separator
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest.mock import patch
 
 from PyFunceble.helpers import Directory
 
@@ -111,6 +112,16 @@ class TestDirectory(TestCase):
 
         dir_instance.delete()
 
+    def test_fsync(self):
+        """
+        Tests the method which let us sync a directory.
+        """
+
+        with patch("PyFunceble.helpers.directory.fsync") as fsync:
+            Directory(getcwd()).fsync()
+
+        self.assertEqual(1, fsync.call_count)
+
     def test_fix_path(self):
         """
         Tests the method which allows us to fix
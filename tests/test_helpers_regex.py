@@ -52,6 +52,7 @@ License:
 """
 # pylint: enable=line-too-long
 
+from re import MULTILINE
 from unittest import TestCase
 from unittest import main as launch_tests
 
@@ -155,6 +156,44 @@ class TestRegex(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_get_compiled(self):
+        """
+        Tests the method which let us get a compiled regex.
+        """
+
+        regex = r"^hello-cache-[a-z]+$"
+
+        statistics = Regex.get_statistics()
+
+        actual = Regex.get_compiled(regex)
+
+        self.assertIs(actual, Regex.get_compiled(regex))
+        self.assertIsNot(actual, Regex.get_compiled(regex, MULTILINE))
+
+        expected = statistics["misses"] + 2
+        actual = Regex.get_statistics()["misses"]
+
+        self.assertEqual(expected, actual)
+
+        expected = statistics["hits"] + 1
+        actual = Regex.get_statistics()["hits"]
+
+        self.assertEqual(expected, actual)
+
+    def test_get_compiled_max_size(self):
+        """
+        Tests that the cache of compiled regex does not grow
+        over its maximal size.
+        """
+
+        for index in range(Regex.compiled_max_size + 10):
+            Regex.get_compiled(f"^hello-{index}$")
+
+        expected = Regex.compiled_max_size
+        actual = Regex.get_statistics()["size"]
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
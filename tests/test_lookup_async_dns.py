@@ -0,0 +1,345 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.lookup.async_dns
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+import asyncio
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import dns.asyncresolver
+from dns.resolver import NXDOMAIN, NoAnswer
+
+from PyFunceble.lookup import AsyncDns, Dns
+
+
+class TestAsyncDNSLookup(TestCase):
+    """
+    Tests of the PyFunceble.lookup.async_dns.
+    """
+
+    # pylint: disable=invalid-name
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.dns_lookup = Dns(dns_server="127.0.0.1", lifetime=5)
+        self.async_dns_lookup = AsyncDns(self.dns_lookup, concurrency=2)
+
+        self.queried = []
+        self.fast_record_types = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fake_resolve(self, subject, record_type, tcp=False):
+        """
+        Provides a fake asynchronous resolution.
+        """
+
+        # pylint: disable=unused-argument
+
+        self.queried.append((str(subject), record_type))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        await asyncio.sleep(0.01)
+
+        self.in_flight -= 1
+
+        if record_type == "A" and str(subject) != "example.org":
+            return ["192.168.1.1"]
+
+        raise NXDOMAIN()
+
+    async def fake_fan_out_resolve(self, subject, record_type, tcp=False):
+        """
+        Provides a fake asynchronous resolution where only the given
+        record types answer quickly.
+        """
+
+        # pylint: disable=unused-argument
+
+        self.queried.append((str(subject), record_type))
+
+        if record_type in self.fast_record_types:
+            await asyncio.sleep(0.01)
+
+            if str(subject) == "example.org":
+                raise NXDOMAIN()
+            return ["192.168.1.1"]
+
+        await asyncio.sleep(5)
+
+        raise NoAnswer()
+
+    def test_resolver_settings(self):
+        """
+        Tests that the settings of the given resolver are reused.
+        """
+
+        expected = self.dns_lookup.resolver.nameservers
+        actual = self.async_dns_lookup.resolver.nameservers
+
+        self.assertEqual(expected, actual)
+
+        expected = self.dns_lookup.resolver.lifetime
+        actual = self.async_dns_lookup.resolver.lifetime
+
+        self.assertEqual(expected, actual)
+
+    def test_wrong_concurrency(self):
+        """
+        Tests the initiation with a wrong concurrency.
+        """
+
+        expected = AsyncDns.default_concurrency
+        actual = AsyncDns(self.dns_lookup, concurrency=0).concurrency
+
+        self.assertEqual(expected, actual)
+
+    def test_request_many(self):
+        """
+        Tests the method which let us request multiple subjects at once.
+        """
+
+        self.async_dns_lookup.resolver.resolve = Mock(side_effect=self.fake_resolve)
+
+        expected = {
+            "example.org": {},
+            "github.com": {
+                "A": ["192.168.1.1"],
+                "nameservers": self.dns_lookup.resolver.nameservers,
+            },
+        }
+        actual = self.async_dns_lookup.request_many(
+            ["example.org", "github.com", "github.com"]
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = [
+            ("example.org", "A"),
+            ("example.org", "AAAA"),
+            ("example.org", "CNAME"),
+            ("example.org", "DNAME"),
+            ("example.org", "NS"),
+            ("github.com", "CNAME"),
+            ("github.com", "DNAME"),
+            ("github.com", "NS"),
+            ("github.com", "A"),
+        ]
+
+        self.assertEqual(sorted(expected), sorted(self.queried))
+        self.assertEqual(2, self.max_in_flight)
+
+    def test_request_many_concurrency(self):
+        """
+        Tests that the number of queries in flight is limited.
+        """
+
+        self.async_dns_lookup.resolver.resolve = Mock(side_effect=self.fake_resolve)
+
+        self.async_dns_lookup.request_many([f"{x}.example.com" for x in range(10)])
+
+        expected = 2
+        actual = self.max_in_flight
+
+        self.assertEqual(expected, actual)
+
+    def test_request_many_empty(self):
+        """
+        Tests the method which let us request multiple subjects at once
+        for the case that nothing is given.
+        """
+
+        expected = {}
+        actual = self.async_dns_lookup.request_many([])
+
+        self.assertEqual(expected, actual)
+
+    def test_record_given_not_str(self):
+        """
+        Tests the method which let us query a record for the case
+        that a non string is given.
+        """
+
+        loop = asyncio.new_event_loop()
+
+        self.assertRaises(
+            ValueError,
+            lambda: loop.run_until_complete(self.async_dns_lookup.record(123, "A")),
+        )
+
+        loop.close()
+
+    def test_request_fan_out(self):
+        """
+        Tests that the fan-out stops at the first positive answer.
+        """
+
+        self.fast_record_types = ["A"]
+        self.async_dns_lookup.fan_out = True
+        self.async_dns_lookup.resolver.resolve = Mock(
+            side_effect=self.fake_fan_out_resolve
+        )
+
+        expected = {
+            "github.com": {
+                "A": ["192.168.1.1"],
+                "nameservers": self.dns_lookup.resolver.nameservers,
+            }
+        }
+        actual = self.async_dns_lookup.request_many(["github.com"])
+
+        self.assertEqual(expected, actual)
+
+        expected = [
+            ("github.com", x) for x in self.async_dns_lookup.not_ip_record_types
+        ]
+
+        self.assertEqual(sorted(expected), sorted(self.queried))
+
+    def test_request_fan_out_nxdomain(self):
+        """
+        Tests that the fan-out stops at the first NXDOMAIN.
+        """
+
+        self.fast_record_types = ["NS"]
+        self.async_dns_lookup.fan_out = True
+        self.async_dns_lookup.resolver.resolve = Mock(
+            side_effect=self.fake_fan_out_resolve
+        )
+
+        expected = {"example.org": {}}
+        actual = self.async_dns_lookup.request_many(["example.org"])
+
+        self.assertEqual(expected, actual)
+
+    def test_request_fan_out_from_dns_lookup(self):
+        """
+        Tests that the DNS lookup interface uses the fan-out when asked.
+        """
+
+        self.fast_record_types = ["CNAME"]
+        self.dns_lookup.fan_out = True
+
+        with patch.object(
+            dns.asyncresolver.Resolver,
+            "resolve",
+            Mock(side_effect=self.fake_fan_out_resolve),
+        ):
+            expected = {
+                "CNAME": ["192.168.1.1"],
+                "nameservers": self.dns_lookup.resolver.nameservers,
+            }
+            actual = self.dns_lookup.request("github.com")
+
+        self.assertEqual(expected, actual)
+
+    def test_async_dns_reused(self):
+        """
+        Tests that the DNS lookup interface keeps the same asynchronous
+        interface (and loop) until its settings are updated.
+        """
+
+        self.dns_lookup.fan_out = True
+
+        with patch.object(
+            dns.asyncresolver.Resolver,
+            "resolve",
+            Mock(side_effect=self.fake_resolve),
+        ):
+            self.dns_lookup.request("github.com")
+            async_dns = self.dns_lookup.async_dns
+            loop = async_dns.loop
+
+            self.dns_lookup.request("example.org")
+
+        self.assertIs(async_dns, self.dns_lookup.async_dns)
+        self.assertIs(loop, self.dns_lookup.async_dns.loop)
+        self.assertFalse(loop.is_closed())
+
+        self.dns_lookup.update_lifetime(10)
+
+        self.assertIsNone(self.dns_lookup.async_dns)
+        self.assertTrue(loop.is_closed())
+
+        expected = self.dns_lookup.resolver.lifetime
+        actual = self.dns_lookup.get_async_dns().resolver.lifetime
+
+        self.assertEqual(expected, actual)
+
+    def test_prefetch(self):
+        """
+        Tests that the prefetched records are given back by the
+        DNS lookup interface.
+        """
+
+        self.dns_lookup.prefetched = {"github.com": {"A": ["192.168.1.1"]}}
+
+        expected = {"A": ["192.168.1.1"]}
+        actual = self.dns_lookup.request("github.com")
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = self.dns_lookup.prefetched
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,180 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.async_http_code.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.lookup.async_http_code import AsyncHTTPCode
+
+
+class HeadHandler(BaseHTTPRequestHandler):
+    """
+    Answers to our HEAD requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    clients = set()
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """
+        Answers to a HEAD request.
+        """
+
+        self.clients.add(self.client_address)
+
+        if "missing" in self.path:
+            self.send_response(404)
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class HeadServer(ThreadingMixIn, HTTPServer):
+    """
+    A threaded HTTP server.
+    """
+
+    daemon_threads = True
+
+
+class TestAsyncHTTPCode(TestCase):
+    """
+    Tests of PyFunceble.lookup.async_http_code.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        HeadHandler.clients = set()
+
+        self.server = HeadServer(("127.0.0.1", 0), HeadHandler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_request_many(self):
+        """
+        Tests the request of several URLs.
+        """
+
+        urls = [f"{self.base}/{x}" for x in range(50)]
+
+        expected = {x: 200 for x in urls}
+        expected[f"{self.base}/missing?hello=world"] = 404
+        expected["ftp://example.org/"] = None
+
+        actual = AsyncHTTPCode(
+            concurrency=10, host_concurrency=2, timeout=3
+        ).request_many(list(expected))
+
+        self.assertEqual(expected, actual)
+
+        # We reused our connections.
+        self.assertLessEqual(len(HeadHandler.clients), 2)
+
+    def test_request_many_hostname(self):
+        """
+        Tests that the hostnames are resolved through the asynchronous
+        interface of our DNS lookup.
+        """
+
+        async def fake_record(subject, record_type):  # pylint: disable=unused-argument
+            return ["127.0.0.1"]
+
+        port = self.server.server_address[1]
+        urls = [f"http://example.test:{port}/{x}" for x in range(5)]
+
+        async_dns = Mock()
+        async_dns.record.side_effect = fake_record
+
+        with patch.object(
+            PyFunceble.DNSLOOKUP, "get_async_dns", return_value=async_dns
+        ):
+            actual = AsyncHTTPCode(timeout=3).request_many(urls)
+
+        self.assertEqual({x: 200 for x in urls}, actual)
+
+        async_dns.record.assert_called_once_with("example.test", "A")
+
+    def test_request_many_empty(self):
+        """
+        Tests the request of an empty list of URLs.
+        """
+
+        self.assertEqual({}, AsyncHTTPCode().request_many([]))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,286 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.lookup.dns_cache
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+import pickle
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+from dns.resolver import NXDOMAIN
+
+from PyFunceble.lookup import DNSCache, Dns
+
+
+class FakeAnswer(list):
+    """
+    Provides a fake DNS answer.
+    """
+
+    def __init__(self, records, ttl):
+        super().__init__(records)
+
+        self.rrset = Mock(ttl=ttl)
+
+
+class TestDNSCache(TestCase):
+    """
+    Tests of the PyFunceble.lookup.dns_cache.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.dns_cache = DNSCache(max_size=2)
+        self.nameservers = ["127.0.0.1"]
+
+    def test_get_not_cached(self):
+        """
+        Tests the method which let us get an answer for the case
+        that nothing is cached.
+        """
+
+        expected = (False, None)
+        actual = self.dns_cache.get("github.com", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 0, "misses": 1, "size": 0}
+        actual = self.dns_cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_cached(self):
+        """
+        Tests the method which let us get an answer for the case
+        that it is cached.
+        """
+
+        self.dns_cache.put("github.com", "A", self.nameservers, ["192.168.1.1"], 60)
+
+        expected = (True, ["192.168.1.1"])
+        actual = self.dns_cache.get("GitHub.com.", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        expected = (False, None)
+        actual = self.dns_cache.get("github.com", "AAAA", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        actual = self.dns_cache.get("github.com", "A", ["127.0.0.2"])
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 1, "misses": 2, "size": 1}
+        actual = self.dns_cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_nxdomain(self):
+        """
+        Tests the method which let us get an answer for the case
+        that a NXDOMAIN is cached.
+        """
+
+        self.dns_cache.put("example.org", "NS", self.nameservers, None, 60)
+
+        expected = (True, None)
+        actual = self.dns_cache.get("example.org", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_expired(self):
+        """
+        Tests the method which let us get an answer for the case
+        that the cached answer expired.
+        """
+
+        with patch("PyFunceble.lookup.dns_cache.time", Mock(return_value=1000)):
+            self.dns_cache.put("github.com", "A", self.nameservers, ["1.1.1.1"], 60)
+
+        with patch("PyFunceble.lookup.dns_cache.time", Mock(return_value=1061)):
+            expected = (False, None)
+            actual = self.dns_cache.get("github.com", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = self.dns_cache.get_statistics()["size"]
+
+        self.assertEqual(expected, actual)
+
+    def test_put_without_ttl(self):
+        """
+        Tests the method which let us save an answer for the case
+        that no TTL is given.
+        """
+
+        self.dns_cache.put("github.com", "A", self.nameservers, ["1.1.1.1"], None)
+
+        expected = 0
+        actual = self.dns_cache.get_statistics()["size"]
+
+        self.assertEqual(expected, actual)
+
+    def test_put_lru(self):
+        """
+        Tests that the least recently used answer is dropped when
+        the cache is full.
+        """
+
+        self.dns_cache.put("github.com", "A", self.nameservers, ["1.1.1.1"], 60)
+        self.dns_cache.put("gitlab.com", "A", self.nameservers, ["1.1.1.2"], 60)
+
+        self.dns_cache.get("github.com", "A", self.nameservers)
+
+        self.dns_cache.put("example.com", "A", self.nameservers, ["1.1.1.3"], 60)
+
+        expected = (True, ["1.1.1.1"])
+        actual = self.dns_cache.get("github.com", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        expected = (False, None)
+        actual = self.dns_cache.get("gitlab.com", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+    def test_flush(self):
+        """
+        Tests the method which let us flush the cache.
+        """
+
+        self.dns_cache.put("github.com", "A", self.nameservers, ["1.1.1.1"], 60)
+        self.dns_cache.flush()
+
+        expected = 0
+        actual = self.dns_cache.get_statistics()["size"]
+
+        self.assertEqual(expected, actual)
+
+    def test_pickle(self):
+        """
+        Tests that the cache can be given to another process.
+        """
+
+        self.dns_cache.put("github.com", "A", self.nameservers, ["1.1.1.1"], 60)
+
+        dns_cache = pickle.loads(pickle.dumps(self.dns_cache))
+
+        expected = (True, ["1.1.1.1"])
+        actual = dns_cache.get("github.com", "A", self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+
+class TestDNSLookupWithCache(TestCase):
+    """
+    Tests of the PyFunceble.lookup.dns with a cache.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.dns_cache = DNSCache()
+        self.dns_lookup = Dns(dns_server="127.0.0.1", cache=self.dns_cache)
+
+    def test_record(self):
+        """
+        Tests that a record is only requested once.
+        """
+
+        self.dns_lookup.resolver.resolve = Mock(
+            return_value=FakeAnswer(["192.168.1.1"], 60)
+        )
+
+        expected = ["192.168.1.1"]
+
+        for _ in range(3):
+            actual = self.dns_lookup.a_record("github.com")
+
+            self.assertEqual(expected, actual)
+
+        self.dns_lookup.resolver.resolve.assert_called_once()
+
+        expected = {"hits": 2, "misses": 1, "size": 1}
+        actual = self.dns_cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_record_NXDOMAIN(self):
+        """
+        Tests that a NXDOMAIN is cached for all record types.
+        """
+
+        self.dns_lookup.resolver.resolve = Mock(side_effect=NXDOMAIN())
+
+        with patch.object(DNSCache, "get_negative_ttl_of", Mock(return_value=60)):
+            expected = None
+            actual = self.dns_lookup.ns_record("example.org")
+
+            self.assertEqual(expected, actual)
+
+            actual = self.dns_lookup.a_record("example.org")
+
+            self.assertEqual(expected, actual)
+
+        self.dns_lookup.resolver.resolve.assert_called_once()
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,166 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.ipv4_reputation.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from array import array
+from ipaddress import ip_address
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.lookup.ipv4_reputation import IPv4Reputation
+
+
+class TestIPv4Reputation(TestCase):
+    """
+    Tests of PyFunceble.lookup.ipv4_reputation.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.config_directory = PyFunceble.CONFIG_DIRECTORY
+
+        self.temp_directory = TemporaryDirectory()
+        PyFunceble.CONFIG_DIRECTORY = self.temp_directory.name + "/"
+
+        self.input_file = (
+            PyFunceble.CONFIG_DIRECTORY
+            + PyFunceble.abstracts.Infrastructure.IPV4_REPUTATION_FILENAME
+        )
+
+        PyFunceble.helpers.File(self.input_file).write(
+            "45.34.29.15#4#2#Malicious Host#US##37.751,-97.822#3\n"
+            "192.0.2.12#4#2#Scanning Host#US##37.751,-97.822#3\n"
+            "198.51.100.0/25#4#2#Spamming#US##37.751,-97.822#3\n"
+            "hello world\n",
+            overwrite=True,
+        )
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        PyFunceble.CONFIG_DIRECTORY = self.config_directory
+
+        self.temp_directory.cleanup()
+
+        IPv4Reputation.index = (array("L"), array("L"))
+        IPv4Reputation.index_state = None
+
+    def test_get_index(self):
+        """
+        Tests the indexation of the input file.
+        """
+
+        expected = (
+            [
+                int(ip_address("45.34.29.15")),
+                int(ip_address("192.0.2.12")),
+                int(ip_address("198.51.100.0")),
+            ],
+            [
+                int(ip_address("45.34.29.15")),
+                int(ip_address("192.0.2.12")),
+                int(ip_address("198.51.100.127")),
+            ],
+        )
+
+        starts, ends = IPv4Reputation.get_index(self.input_file)
+
+        self.assertEqual(expected, (list(starts), list(ends)))
+
+    def test_contains(self):
+        """
+        Tests the lookup of a subject.
+        """
+
+        expected = {
+            "45.34.29.15": True,
+            "45.34.29.1": False,
+            "45.34.29.150": False,
+            "192.0.2.12": True,
+            "198.51.100.1": True,
+            "198.51.100.128": False,
+            "198.51.100.0/24": True,
+        }
+
+        reputation = IPv4Reputation()
+
+        for subject, present in expected.items():
+            self.assertEqual(present, subject in reputation, msg=subject)
+
+    def test_load_changed_file(self):
+        """
+        Tests that the index is rebuilt when the input file changes.
+        """
+
+        self.assertTrue("192.0.2.12" in IPv4Reputation())
+
+        PyFunceble.helpers.File(self.input_file).write(
+            "192.0.2.13#4#2#Scanning Host#US##37.751,-97.822#3\n", overwrite=True
+        )
+
+        reputation = IPv4Reputation()
+
+        self.assertFalse("192.0.2.12" in reputation)
+        self.assertTrue("192.0.2.13" in reputation)
+
+
+if __name__ == "__main__":
+    launch_tests()
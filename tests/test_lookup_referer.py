@@ -0,0 +1,130 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.referer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.lookup.referer import Referer
+
+
+class TestReferer(TestCase):
+    """
+    Tests of PyFunceble.lookup.referer.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(custom={"local": False, "no_whois": False})
+
+        self.iana_lookup = {"org": "whois.pir.org", "example": None}
+        self.dns_lookup = Mock()
+
+    def get_referer(self, subject):
+        """
+        Provides the referer of the given subject with our fake IANA
+        database.
+        """
+
+        with patch.object(PyFunceble, "IANALOOKUP", self.iana_lookup), patch.object(
+            PyFunceble, "DNSLOOKUP", self.dns_lookup
+        ):
+            return Referer(subject).get_referer()
+
+    def test_get_referer(self):
+        """
+        Tests that the referer is given without being resolved.
+        """
+
+        expected = "whois.pir.org"
+        actual = self.get_referer("example.org")
+
+        self.assertEqual(expected, actual)
+
+        self.dns_lookup.a_record.assert_not_called()
+
+    def test_get_referer_not_filled(self):
+        """
+        Tests the case that the referer of the extension is unknown.
+        """
+
+        with patch.object(PyFunceble.output.Logs, "referer_not_found") as log:
+            self.assertIsNone(self.get_referer("hello.example"))
+
+        log.assert_called_once_with("hello.example", "example")
+
+    def test_get_referer_not_authorized(self):
+        """
+        Tests the cases that we are not supposed to give a referer.
+        """
+
+        # The extension is ignored.
+        self.assertIsNone(self.get_referer("example.ad"))
+
+        # The extension is not into the IANA database.
+        self.assertIsNone(self.get_referer("example.funilrys"))
+
+        PyFunceble.CONFIGURATION.no_whois = True
+        self.assertIsNone(self.get_referer("example.org"))
+
+        PyFunceble.CONFIGURATION.no_whois = False
+        PyFunceble.CONFIGURATION.local = True
+        self.assertIsNone(self.get_referer("example.org"))
+
+
+if __name__ == "__main__":
+    launch_tests()
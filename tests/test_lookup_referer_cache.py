@@ -0,0 +1,135 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.referer_cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.lookup.referer_cache import RefererCache
+
+
+class TestRefererCache(TestCase):
+    """
+    Tests of PyFunceble.lookup.referer_cache.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        RefererCache.flush()
+
+        self.dns_lookup = Mock()
+        self.dns_lookup.a_record.return_value = ["192.0.2.1", "192.0.2.2"]
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        RefererCache.flush()
+
+    def test_get(self):
+        """
+        Tests that a server is only resolved once and that we go
+        round-robin over its addresses.
+        """
+
+        expected = ["192.0.2.1", "192.0.2.2", "192.0.2.1"]
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            actual = [
+                RefererCache(refresh_interval=3600).get("whois.example.org"),
+                RefererCache(refresh_interval=3600).get("WHOIS.example.org."),
+                RefererCache(refresh_interval=3600).get("whois.example.org"),
+            ]
+
+        self.assertEqual(expected, actual)
+        self.dns_lookup.a_record.assert_called_once_with("whois.example.org")
+
+    def test_get_not_resolved(self):
+        """
+        Tests the case that the server could not be resolved.
+        """
+
+        self.dns_lookup.a_record.return_value = None
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            self.assertIsNone(RefererCache(refresh_interval=3600).get("whois.example"))
+            self.assertIsNone(RefererCache(refresh_interval=3600).get("whois.example"))
+
+        self.assertEqual(1, self.dns_lookup.a_record.call_count)
+
+    def test_get_no_cache(self):
+        """
+        Tests that the server is resolved every time when the cache is
+        disabled.
+        """
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            for _ in range(3):
+                self.assertIn(
+                    RefererCache(refresh_interval=0).get("whois.example.org"),
+                    ["192.0.2.1", "192.0.2.2"],
+                )
+
+        self.assertEqual(3, self.dns_lookup.a_record.call_count)
+        self.assertEqual({}, RefererCache.cache)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,133 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.requests.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.lookup.requests import HostSSLAdapter
+
+
+class TestHostSSLAdapter(TestCase):
+    """
+    Tests of PyFunceble.lookup.requests.HostSSLAdapter.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        HostSSLAdapter.resolve_cache.flush()
+
+        self.dns_lookup = Mock()
+        self.dns_lookup.cache = None
+        self.dns_lookup.resolver.nameservers = ["192.0.2.53"]
+        self.dns_lookup.a_record.return_value = ["192.0.2.1"]
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        HostSSLAdapter.resolve_cache.flush()
+
+    def test_resolve_with_cache(self):
+        """
+        Tests that we only resolve a hostname once.
+        """
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            for _ in range(3):
+                self.assertEqual(
+                    "192.0.2.1", HostSSLAdapter.resolve_with_cache("example.org")
+                )
+
+        self.dns_lookup.a_record.assert_called_once_with("example.org")
+
+    def test_resolve_with_cache_not_resolved(self):
+        """
+        Tests that we also cache the hostnames we could not resolve.
+        """
+
+        self.dns_lookup.a_record.return_value = None
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            for _ in range(3):
+                self.assertIsNone(HostSSLAdapter.resolve_with_cache("example.org"))
+
+        self.dns_lookup.a_record.assert_called_once_with("example.org")
+
+    def test_resolve_with_dns_cache(self):
+        """
+        Tests that we let the DNS lookup interface cache the answers when it
+        has a cache.
+        """
+
+        self.dns_lookup.cache = Mock()
+
+        with patch.object(PyFunceble, "DNSLOOKUP", self.dns_lookup):
+            for _ in range(3):
+                self.assertEqual(
+                    "192.0.2.1", HostSSLAdapter.resolve_with_cache("example.org")
+                )
+
+        self.assertEqual(3, self.dns_lookup.a_record.call_count)
+        self.assertEqual(0, HostSSLAdapter.resolve_cache.get_statistics()["size"])
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,137 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.reserved_ip.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyFunceble.lookup.reserved_ip import ReservedIP
+
+
+class TestReservedIP(TestCase):
+    """
+    Tests of PyFunceble.lookup.reserved_ip.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.reserved_ip = ReservedIP()
+
+    def test_is_reserved_ipv4(self):
+        """
+        Tests the method which let us check if an IPv4 is reserved.
+        """
+
+        expected = {
+            "0.0.0.0": True,
+            "10.255.255.255": True,
+            "100.63.255.255": False,
+            "100.64.0.0": True,
+            "100.127.255.255": True,
+            "100.128.0.0": False,
+            "110.10.10.10": False,
+            "192.168.1.0/24": True,
+            "192.168.1.0/255.255.255.0": True,
+            "20.10.10.10": False,
+            "255.255.255.255": True,
+            "45.34.29.15": False,
+            "::1": False,
+            "hello.world": False,
+            "300.1.1.1": False,
+        }
+
+        for subject, reserved in expected.items():
+            self.assertEqual(
+                reserved, self.reserved_ip.is_reserved_ipv4(subject), msg=subject
+            )
+
+    def test_is_reserved_ipv6(self):
+        """
+        Tests the method which let us check if an IPv6 is reserved.
+        """
+
+        expected = {
+            "::1": True,
+            "::ffff:10.0.0.1": True,
+            "2001:db8::1": True,
+            "2606:4700:4700::1111": False,
+            "fe80::1%eth0": True,
+            "ff02::1": True,
+            "2001:db8::/128": False,
+            "10.0.0.1": False,
+            "hello.world": False,
+        }
+
+        for subject, reserved in expected.items():
+            self.assertEqual(
+                reserved, self.reserved_ip.is_reserved_ipv6(subject), msg=subject
+            )
+
+    def test_are_reserved(self):
+        """
+        Tests the method which let us check a batch of subjects.
+        """
+
+        given = ["10.0.0.1", "45.34.29.15", "fc00::1", "hello.world"]
+        expected = [True, False, True, False]
+
+        self.assertEqual(expected, self.reserved_ip.are_reserved(given))
+
+        self.assertTrue("127.0.0.1" in self.reserved_ip)
+        self.assertFalse("8.8.8.8" in self.reserved_ip)
+
+
+if __name__ == "__main__":
+    launch_tests()
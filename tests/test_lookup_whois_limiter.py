@@ -0,0 +1,186 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.lookup.whois_limiter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.lookup.whois_limiter import WhoisLimiter
+
+
+class TestWhoisLimiter(TestCase):
+    """
+    Tests of PyFunceble.lookup.whois_limiter.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+    def test_acquire(self):
+        """
+        Tests that we only wait once the bucket is empty.
+        """
+
+        limiter = WhoisLimiter("192.0.2.1", rate_limit=20)
+
+        for _ in range(21):
+            with limiter:
+                pass
+
+        expected = {
+            "requests": 21,
+            "waited": 1,
+            "throttled": 0,
+            "empty": 0,
+            "errors": 0,
+        }
+
+        self.assertEqual(expected, limiter.statistics)
+
+    def test_acquire_no_rate_limit(self):
+        """
+        Tests that we never wait when the rate limiting is disabled.
+        """
+
+        limiter = WhoisLimiter("192.0.2.1", rate_limit=0)
+
+        for _ in range(100):
+            with limiter:
+                pass
+
+        self.assertEqual(0, limiter.statistics["waited"])
+
+    def test_record_throttled(self):
+        """
+        Tests that we stop talking to a server which throttles us.
+        """
+
+        limiter = WhoisLimiter("192.0.2.1", rate_limit=0)
+        limiter.throttled_penalty = 0.05
+
+        limiter.record("throttled")
+
+        with limiter:
+            pass
+
+        self.assertEqual(1, limiter.statistics["throttled"])
+        self.assertEqual(1, limiter.statistics["waited"])
+
+    def test_rate_limit_disabled_by_default(self):
+        """
+        Tests that the rate limiting is disabled by default.
+        """
+
+        expected = 0.0
+        actual = WhoisLimiter("whois.example.org").rate_limit
+
+        self.assertEqual(expected, actual)
+
+    def test_rate_limit_multiprocess(self):
+        """
+        Tests that the rate limit is only split between the workers
+        of the worker pool.
+        """
+
+        previous = {
+            x: getattr(PyFunceble.CONFIGURATION, x)
+            for x in ["multiprocess", "multiprocess_worker_pool", "maximal_processes"]
+        }
+
+        PyFunceble.CONFIGURATION.multiprocess = True
+        PyFunceble.CONFIGURATION.multiprocess_worker_pool = True
+        PyFunceble.CONFIGURATION.maximal_processes = 4
+
+        try:
+            expected = 0.5
+            actual = WhoisLimiter("whois.example.org", rate_limit=2).rate_limit
+
+            self.assertEqual(expected, actual)
+
+            PyFunceble.CONFIGURATION.multiprocess_worker_pool = False
+
+            expected = 2.0
+            actual = WhoisLimiter("whois.example.org", rate_limit=2).rate_limit
+
+            self.assertEqual(expected, actual)
+
+            PyFunceble.CONFIGURATION.multiprocess_worker_pool = True
+            PyFunceble.CONFIGURATION.maximal_processes = 1
+
+            expected = 2.0
+            actual = WhoisLimiter("whois.example.org", rate_limit=2).rate_limit
+
+            self.assertEqual(expected, actual)
+        finally:
+            PyFunceble.CONFIGURATION.update(previous)
+
+    def test_get_instance(self):
+        """
+        Tests that we share a limiter per server.
+        """
+
+        self.assertIs(
+            WhoisLimiter.get_instance("192.0.2.2"),
+            WhoisLimiter.get_instance("192.0.2.2"),
+        )
+        self.assertIn("192.0.2.2", WhoisLimiter.get_statistics())
+
+        del WhoisLimiter.instances["192.0.2.2"]
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,132 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.output.counter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.output import Counter
+
+
+class TestCounter(TestCase):
+    """
+    Tests of PyFunceble.output.counter.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.counter = Counter()
+
+    def test_count(self):
+        """
+        Tests the counting of the official statuses.
+        """
+
+        for status in Counter.statuses:
+            self.counter.count(PyFunceble.STATUS.official[status])
+
+        expected = {
+            "up": 1,
+            "down": 1,
+            "invalid": 1,
+            "valid": 1,
+            "malicious": 1,
+            "sane": 1,
+            "tested": 6,
+        }
+
+        self.assertEqual(expected, self.counter.to_dict())
+
+    def test_count_alias(self):
+        """
+        Tests the counting of the statuses which are not official.
+        """
+
+        for status in ["active", "error", "ouch", "safe", "hello, world"]:
+            self.counter.count(status)
+
+        expected = {
+            "up": 1,
+            "down": 1,
+            "invalid": 2,
+            "valid": 0,
+            "malicious": 0,
+            "sane": 1,
+            "tested": 5,
+        }
+
+        self.assertEqual(expected, self.counter.to_dict())
+
+    def test_update_and_reset(self):
+        """
+        Tests the update and the reset of the numbers.
+        """
+
+        self.counter.update({"up": 5, "tested": 7, "unknown": 3})
+
+        self.assertEqual(5, self.counter["up"])
+        self.assertEqual(7, self.counter["tested"])
+        self.assertNotIn("unknown", self.counter)
+
+        self.counter.reset()
+
+        self.assertEqual([0] * 7, [self.counter[x] for x in self.counter])
+
+
+if __name__ == "__main__":
+    launch_tests()
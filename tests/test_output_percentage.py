@@ -58,7 +58,7 @@ from unittest import main as launch_tests
 from stdout_base import StdoutBase
 
 import PyFunceble
-from PyFunceble.output import Percentage
+from PyFunceble.output import Counter, Percentage
 
 
 class TestPercentage(StdoutBase):
@@ -73,7 +73,7 @@ class TestPercentage(StdoutBase):
 
         PyFunceble.INTERN = {
             "counter": {
-                "number": {"down": 0, "invalid": 0, "tested": 0, "up": 0},
+                "number": Counter(),
                 "percentage": {"down": 0, "invalid": 0, "up": 0},
             }
         }
@@ -92,13 +92,10 @@ class TestPercentage(StdoutBase):
         Preset the counters.
         """
 
-        expected = {}
-
         for i, element in enumerate(["tested", "up", "down", "invalid"]):
             PyFunceble.INTERN["counter"]["number"][element] = 12 + i
-            expected.update({element: 12 + i})
 
-        return expected
+        return PyFunceble.INTERN["counter"]["number"].to_dict()
 
     def test_count(self):
         """
@@ -114,7 +111,7 @@ class TestPercentage(StdoutBase):
 
             expected[element] += 1
             expected["tested"] += 1
-            actual = PyFunceble.INTERN["counter"]["number"]
+            actual = PyFunceble.INTERN["counter"]["number"].to_dict()
 
             self.assertEqual(expected, actual)
 
@@ -129,7 +126,7 @@ class TestPercentage(StdoutBase):
 
             expected[element] += 1
             expected["tested"] += 1
-            actual = PyFunceble.INTERN["counter"]["number"]
+            actual = PyFunceble.INTERN["counter"]["number"].to_dict()
 
             self.assertEqual(expected, actual)
 
@@ -139,11 +136,19 @@ class TestPercentage(StdoutBase):
         system from outside.
         """
 
-        expected = {"up": 15, "down": 2, "invalid": 0, "tested": 75}
+        expected = {
+            "up": 15,
+            "down": 2,
+            "invalid": 0,
+            "valid": 0,
+            "malicious": 0,
+            "sane": 0,
+            "tested": 75,
+        }
 
         Percentage(domain_status=None, init=expected)
 
-        self.assertEqual(expected, PyFunceble.INTERN["counter"]["number"])
+        self.assertEqual(expected, PyFunceble.INTERN["counter"]["number"].to_dict())
 
     def test_calculate(self):
         """
@@ -154,7 +159,14 @@ class TestPercentage(StdoutBase):
             {"up": 45, "down": 78, "invalid": 2, "tested": 125}
         )
 
-        expected = {"up": 36, "down": 62, "invalid": 1}
+        expected = {
+            "up": 36,
+            "down": 62,
+            "invalid": 1,
+            "valid": 0,
+            "malicious": 0,
+            "sane": 0,
+        }
 
         Percentage(domain_status=None, init=None).calculate()
         actual = PyFunceble.INTERN["counter"]["percentage"]
@@ -197,7 +209,14 @@ INVALID     1%%           2%s
         Percentage(domain_status=None, init=None).log()
 
         actual = PyFunceble.INTERN["counter"]["percentage"]
-        expected = {"up": 36, "down": 62, "invalid": 1}
+        expected = {
+            "up": 36,
+            "down": 62,
+            "invalid": 1,
+            "valid": 0,
+            "malicious": 0,
+            "sane": 0,
+        }
 
         self.assertEqual(expected, actual)
 
@@ -238,7 +257,14 @@ INVALID     4%%           2%s
         Percentage(domain_status=None, init=None).log()
 
         actual = PyFunceble.INTERN["counter"]["percentage"]
-        expected = {"up": 0, "down": 0, "valid": 95, "invalid": 4}
+        expected = {
+            "up": 0,
+            "down": 0,
+            "invalid": 4,
+            "valid": 95,
+            "malicious": 0,
+            "sane": 0,
+        }
 
         self.assertEqual(expected, actual)
 
@@ -282,7 +308,14 @@ MALICIOUS   4%%           2%s
         Percentage(domain_status=None, init=None).log()
 
         actual = PyFunceble.INTERN["counter"]["percentage"]
-        expected = {"up": 0, "down": 0, "invalid": 0, "sane": 95, "malicious": 4}
+        expected = {
+            "up": 0,
+            "down": 0,
+            "invalid": 0,
+            "valid": 0,
+            "malicious": 4,
+            "sane": 95,
+        }
 
         self.assertEqual(expected, actual)
 
@@ -0,0 +1,150 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.output.writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.output import Writer
+
+
+class TestWriter(TestCase):
+    """
+    Tests of PyFunceble.output.writer.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.file = "the_file_is_a_ghost"
+
+        self.file_instance = PyFunceble.helpers.File(self.file)
+        self.file_instance.delete()
+
+        self.writer = Writer(self.file)
+
+    def tearDown(self):
+        """
+        Setups everything we need after the tests.
+        """
+
+        Writer.close()
+
+        self.file_instance.delete()
+
+    def test_write(self):
+        """
+        Tests that we only write once we are asked to.
+        """
+
+        self.assertFalse(self.writer.exists())
+
+        self.writer.write("Hello\n")
+        self.writer.write("World\n")
+
+        self.assertTrue(self.writer.exists())
+        self.assertEqual("", self.file_instance.read())
+
+        Writer.flush()
+
+        self.assertEqual("Hello\nWorld\n", self.file_instance.read())
+
+        self.writer.write("!\n", flush=True)
+
+        self.assertEqual("Hello\nWorld\n!\n", self.file_instance.read())
+
+    def test_write_full_buffer(self):
+        """
+        Tests that we write once the buffer is full.
+        """
+
+        given = "a" * Writer.buffer_size
+
+        self.writer.write(given)
+
+        self.assertEqual(given, self.file_instance.read())
+
+    def test_write_deleted(self):
+        """
+        Tests that we write into a new file when the output
+        file was deleted.
+        """
+
+        self.writer.write("Hello\n", flush=True)
+        self.file_instance.delete()
+
+        self.assertFalse(self.writer.exists())
+
+        self.writer.write("World\n", flush=True)
+
+        self.assertEqual("World\n", self.file_instance.read())
+
+    def test_close(self):
+        """
+        Tests that we write everything before closing.
+        """
+
+        self.writer.write("Hello, World!\n")
+
+        Writer.close()
+
+        self.assertEqual({}, Writer.handles)
+        self.assertEqual("Hello, World!\n", self.file_instance.read())
+
+
+if __name__ == "__main__":
+    launch_tests()
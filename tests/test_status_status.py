@@ -0,0 +1,148 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+Tests of PyFunceble.status.status.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.status.status import Status
+
+
+class TestStatus(TestCase):
+    """
+    Tests of PyFunceble.status.status.
+    """
+
+    # pylint: disable=no-member
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config()
+
+        self.checker = Mock()
+        self.checker.is_domain.return_value = True
+        self.checker.is_ipv4.return_value = False
+        self.checker.is_ipv6.return_value = False
+        self.checker.is_subdomain.return_value = False
+        self.checker.is_url.return_value = False
+
+        with patch("PyFunceble.Check", return_value=self.checker), patch.object(
+            PyFunceble.lookup.Referer, "get_referer", return_value="whois.pir.org"
+        ) as get_referer:
+            self.status = Status("example.org")
+
+        self.get_referer = get_referer
+
+    def test_syntax_validations(self):
+        """
+        Tests that each syntax validation is computed once.
+        """
+
+        self.assertTrue(self.status.domain_syntax_validation)
+        self.assertTrue(self.status["domain_syntax_validation"])
+        self.assertFalse(self.status.url_syntax_validation)
+
+        self.checker.is_domain.assert_called_once_with()
+        self.checker.is_url.assert_called_once_with()
+
+    def test_range_validations(self):
+        """
+        Tests that the range validations are only computed for IPs.
+        """
+
+        self.assertFalse(self.status.ipv4_range_syntax_validation)
+        self.assertFalse(self.status.ipv6_range_syntax_validation)
+
+        self.checker.is_ipv4_range.assert_not_called()
+        self.checker.is_ipv6_range.assert_not_called()
+
+    def test_whois_server(self):
+        """
+        Tests that the WHOIS server is given without being resolved.
+        """
+
+        self.assertEqual("whois.pir.org", self.status.whois_server)
+
+        self.get_referer.assert_called_once_with()
+
+    def test_unknown_index(self):
+        """
+        Tests the read and the write of an unknown index.
+        """
+
+        self.assertRaises(AttributeError, lambda: self.status.hello)
+        self.assertRaises(AttributeError, setattr, self.status, "hello", "world")
+
+        self.assertFalse(hasattr(self.status, "__dict__"))
+
+    def test_get(self):
+        """
+        Tests that all indexes are given.
+        """
+
+        actual = self.status.get()
+
+        self.assertEqual(Status.resulting_indexes, list(actual.keys()))
+
+        self.assertEqual("example.org", actual["tested"])
+        self.assertEqual("whois.pir.org", actual["whois_server"])
+        self.assertTrue(actual["domain_syntax_validation"])
+        self.assertFalse(actual["ipv4_range_syntax_validation"])
+
+
+if __name__ == "__main__":
+    launch_tests()